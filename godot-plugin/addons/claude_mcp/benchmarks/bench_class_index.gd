@@ -0,0 +1,55 @@
+@tool
+extends EditorScript
+
+# Microbenchmark of class introspection in the editor: the per-request ClassDB scans
+# list_node_classes and get_node_class_info used to do, against GodotAPI's startup index.
+# Open this file in the script editor and use File > Run (Ctrl+Shift+X); results are printed.
+
+const ITERATIONS = 20
+
+func _run():
+	var api = GodotAPI.new()
+	var start = Time.get_ticks_usec()
+	api._build_class_index()
+	print("Class index build: %d classes in %.2f ms" % [api.class_names.size(), (Time.get_ticks_usec() - start) / 1000.0])
+	
+	for filter_type in ["all", "node", "control", "node3d"]:
+		var before = _time_usec(func(): _legacy_list_node_classes(filter_type))
+		var after = _time_usec(func(): api.list_node_classes({"filter": filter_type}))
+		print("list_node_classes filter=%-8s before %9.1f us  after %8.1f us  (%.0fx)" % [filter_type, before, after, before / max(after, 0.001)])
+	
+	for class_name_to_query in ["Node", "Control", "Label"]:
+		var before = _time_usec(func(): _legacy_child_classes(class_name_to_query))
+		var after = _time_usec(func(): api.class_children[class_name_to_query].duplicate())
+		print("child_classes %-16s before %9.1f us  after %8.1f us  (%.0fx)" % [class_name_to_query, before, after, before / max(after, 0.001)])
+	
+	api.free()
+
+func _time_usec(callable: Callable) -> float:
+	var start = Time.get_ticks_usec()
+	for i in range(ITERATIONS):
+		callable.call()
+	return float(Time.get_ticks_usec() - start) / ITERATIONS
+
+# Previous list_node_classes body: several ClassDB.is_parent_class calls per class, then a sort
+func _legacy_list_node_classes(filter_type: String) -> Array:
+	var base = {"node": "Node", "control": "Control", "node2d": "Node2D", "node3d": "Node3D"}.get(filter_type, filter_type)
+	var filtered_classes = []
+	for cls in ClassDB.get_class_list():
+		if filter_type == "all" or ClassDB.is_parent_class(cls, base):
+			filtered_classes.append({
+				"name": cls,
+				"parent": ClassDB.get_parent_class(cls),
+				"can_instantiate": ClassDB.can_instantiate(cls),
+				"is_node": ClassDB.is_parent_class(cls, "Node")
+			})
+	filtered_classes.sort_custom(func(a, b): return a.name < b.name)
+	return filtered_classes
+
+# Previous get_node_class_info child lookup: get_parent_class for every class
+func _legacy_child_classes(class_name_to_query: String) -> Array:
+	var child_classes = []
+	for cls in ClassDB.get_class_list():
+		if ClassDB.get_parent_class(cls) == class_name_to_query:
+			child_classes.append(cls)
+	return child_classes
@@ -0,0 +1,89 @@
+@tool
+extends Node
+
+# Turns editor signals into events on event_log, which /events serves to the MCP server
+# so it can drop or patch cached views when the user edits by hand. Node events for the
+# edited scene are buffered per frame: a burst larger than max_node_events_per_frame
+# (opening a scene, pasting a branch) is published as a single "tree_changed".
+
+const EventLog = preload("event_log.gd")
+
+var event_log = EventLog.new()
+var max_node_events_per_frame: int = 32
+
+var pending_node_events: Array = []
+var pending_scene_edit: bool = false
+
+func _enter_tree():
+	get_tree().node_added.connect(_on_node_added)
+	get_tree().node_removed.connect(_on_node_removed)
+	get_tree().node_renamed.connect(_on_node_renamed)
+	var filesystem = EditorInterface.get_resource_filesystem()
+	filesystem.filesystem_changed.connect(_on_filesystem_changed)
+	filesystem.resources_reimported.connect(_on_resources_reimported)
+	# Every editor action (inspector edits included) goes through undo/redo
+	EditorInterface.get_editor_undo_redo().version_changed.connect(_on_version_changed)
+
+func _exit_tree():
+	get_tree().node_added.disconnect(_on_node_added)
+	get_tree().node_removed.disconnect(_on_node_removed)
+	get_tree().node_renamed.disconnect(_on_node_renamed)
+	var filesystem = EditorInterface.get_resource_filesystem()
+	filesystem.filesystem_changed.disconnect(_on_filesystem_changed)
+	filesystem.resources_reimported.disconnect(_on_resources_reimported)
+	EditorInterface.get_editor_undo_redo().version_changed.disconnect(_on_version_changed)
+
+func _process(_delta):
+	if pending_node_events.size() > max_node_events_per_frame:
+		event_log.publish("tree_changed", {"count": pending_node_events.size()})
+	else:
+		for event in pending_node_events:
+			event_log.publish(event.type, event.data)
+	pending_node_events.clear()
+	if pending_scene_edit:
+		event_log.publish("scene_edited")
+		pending_scene_edit = false
+
+# EditorPlugin signals, connected by plugin.gd
+func on_scene_changed(scene_root: Node):
+	pending_node_events.clear()
+	event_log.publish("scene_changed", {"path": scene_root.scene_file_path if scene_root else ""})
+
+func on_scene_saved(filepath: String):
+	event_log.publish("scene_saved", {"path": filepath})
+
+func on_resource_saved(resource: Resource):
+	event_log.publish("resource_saved", {"path": resource.resource_path, "class": resource.get_class()})
+
+# Path relative to the edited scene root, as /scene/tree reports it; "" if node isn't in that scene
+func _scene_path(node: Node) -> String:
+	var root = EditorInterface.get_edited_scene_root()
+	if not root or (node != root and not root.is_ancestor_of(node)):
+		return ""
+	return str(root.get_path_to(node))
+
+func _queue_node_event(type: String, node: Node, data: Dictionary = {}):
+	var path = _scene_path(node)
+	if path.is_empty():
+		return
+	var event_data = data.duplicate()
+	event_data["path"] = path
+	pending_node_events.append({"type": type, "data": event_data})
+
+func _on_node_added(node: Node):
+	_queue_node_event("node_added", node, {"node_type": node.get_class()})
+
+func _on_node_removed(node: Node):
+	_queue_node_event("node_removed", node)
+
+func _on_node_renamed(node: Node):
+	_queue_node_event("node_renamed", node, {"name": str(node.name)})
+
+func _on_filesystem_changed():
+	event_log.publish("filesystem_changed")
+
+func _on_resources_reimported(resources: PackedStringArray):
+	event_log.publish("resources_reimported", {"paths": Array(resources)})
+
+func _on_version_changed():
+	pending_scene_edit = true
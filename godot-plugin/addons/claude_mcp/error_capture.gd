@@ -0,0 +1,36 @@
+@tool
+extends Logger
+
+# Engine logger (Godot 4.5+, registered with OS.add_logger) that feeds every error and
+# warning the editor process reports - push_error/push_warning, script and shader errors,
+# engine ERR_* macros, printerr - into the plugin's error_log. The engine may call it from
+# any thread, and error_log.add() is mutex-guarded. Never print from here: output is
+# routed back through this logger.
+
+const SEVERITY_BY_TYPE = {
+	ERROR_TYPE_ERROR: "error",
+	ERROR_TYPE_WARNING: "warning",
+	ERROR_TYPE_SCRIPT: "script_error",
+	ERROR_TYPE_SHADER: "shader_error"
+}
+
+var error_log
+
+func _init(target_log):
+	error_log = target_log
+
+func _log_error(function: String, file: String, line: int, code: String, rationale: String, editor_notify: bool, error_type: int, script_backtraces: Array[ScriptBacktrace]):
+	var severity = SEVERITY_BY_TYPE.get(error_type, "error")
+	var message = rationale if not rationale.is_empty() else code
+	# Prefer the innermost script frame over the C++ location the error was raised from
+	var source = "%s:%d @ %s()" % [file, line, function]
+	for backtrace in script_backtraces:
+		if backtrace.get_frame_count() > 0:
+			source = "%s:%d @ %s()" % [backtrace.get_frame_file(0), backtrace.get_frame_line(0), backtrace.get_frame_function(0)]
+			break
+	error_log.add(severity, message, source, severity.to_upper())
+
+func _log_message(message: String, error: bool):
+	# Plain print() output is not an error; printerr() is
+	if error:
+		error_log.add("error", message.strip_edges(), "", "STDERR")
@@ -0,0 +1,108 @@
+@tool
+extends RefCounted
+
+# Fixed-size ring of errors and warnings with monotonically increasing sequence numbers.
+# An error identical to one still in the ring (same severity, message and source) bumps that
+# entry's count and moves it to a new seq, so readers tailing with since() see it again.
+# Written from any thread (the engine Logger hook) and read from the HTTP I/O thread.
+
+const SEVERITIES = ["error", "warning", "script_error", "shader_error"]
+
+var mutex: Mutex = Mutex.new()
+var slots: Array = []  # Ring storage, capacity entries; null until used
+var next_slot: int = 0
+var by_key: Dictionary = {}  # dedup key -> entry currently in the ring
+var last_seq: int = 0
+var dropped_seq: int = 0  # Highest seq an evicted entry had; readers behind it missed errors
+
+func _init(capacity: int = 500):
+	slots.resize(capacity)
+
+func add(severity: String, message: String, source: String = "", type: String = ""):
+	var now = Time.get_unix_time_from_system()
+	var key = severity + "\u001f" + message + "\u001f" + source
+	mutex.lock()
+	last_seq += 1
+	var entry = by_key.get(key)
+	if entry != null:
+		entry.seq = last_seq
+		entry.count += 1
+		entry.last_time = now
+	else:
+		var evicted = slots[next_slot]
+		if evicted != null:
+			by_key.erase(evicted.key)
+			dropped_seq = max(dropped_seq, evicted.seq)
+		entry = {
+			"seq": last_seq,
+			"severity": severity,
+			"type": type if not type.is_empty() else severity.to_upper(),
+			"message": message,
+			"source": source,
+			"count": 1,
+			"first_time": now,
+			"last_time": now,
+			"timestamp": Time.get_datetime_string_from_system(),
+			"key": key
+		}
+		slots[next_slot] = entry
+		by_key[key] = entry
+		next_slot = (next_slot + 1) % slots.size()
+	mutex.unlock()
+
+func latest_seq() -> int:
+	mutex.lock()
+	var seq = last_seq
+	mutex.unlock()
+	return seq
+
+# Entries with seq > since, oldest first, filtered by severities (empty = all) and a source
+# substring, at most limit of them. "reset" is true when matching errors after since may
+# have been evicted already (or since is from before a plugin restart). A negative since
+# means "from the start" and never resets.
+func since(since_seq: int, severities: Array = [], source: String = "", limit: int = 200) -> Dictionary:
+	mutex.lock()
+	var matches = []
+	for entry in slots:
+		if entry == null or entry.seq <= since_seq:
+			continue
+		if not severities.is_empty() and not entry.severity in severities:
+			continue
+		if not source.is_empty() and not entry.source.contains(source):
+			continue
+		var copy = entry.duplicate()
+		copy.erase("key")
+		matches.append(copy)
+	var latest = last_seq
+	var reset = (since_seq >= 0 and since_seq < dropped_seq) or since_seq > last_seq
+	mutex.unlock()
+
+	matches.sort_custom(func(a, b): return a.seq < b.seq)
+	var truncated = matches.size() > limit
+	if truncated:
+		matches = matches.slice(0, limit)
+	return {
+		"errors": matches,
+		"count": matches.size(),
+		"last_seq": matches[-1].seq if truncated else latest,
+		"latest_seq": latest,
+		"has_more": truncated,
+		"reset": reset
+	}
+
+func size() -> int:
+	mutex.lock()
+	var count = by_key.size()
+	mutex.unlock()
+	return count
+
+# Empties the ring; sequence numbers keep increasing so existing cursors stay valid
+func clear() -> int:
+	mutex.lock()
+	var cleared = by_key.size()
+	for i in range(slots.size()):
+		slots[i] = null
+	by_key.clear()
+	next_slot = 0
+	mutex.unlock()
+	return cleared
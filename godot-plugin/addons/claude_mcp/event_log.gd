@@ -0,0 +1,51 @@
+@tool
+extends RefCounted
+
+# Sequence-numbered editor change events, published on the main thread (editor signals)
+# and read by the HTTP I/O thread for /events long-polls, hence the mutex.
+# Events are compact: {"seq", "type", "time", ...type-specific fields such as "path"}.
+
+var mutex: Mutex = Mutex.new()
+var events: Array = []
+var capacity: int = 1000
+var last_seq: int = 0
+
+func _init(max_events: int = 1000):
+	capacity = max_events
+
+func publish(type: String, data: Dictionary = {}):
+	mutex.lock()
+	last_seq += 1
+	var event = {"seq": last_seq, "type": type, "time": Time.get_unix_time_from_system()}
+	event.merge(data)
+	events.append(event)
+	if events.size() > capacity:
+		events = events.slice(events.size() - capacity)
+	mutex.unlock()
+
+func latest_seq() -> int:
+	mutex.lock()
+	var seq = last_seq
+	mutex.unlock()
+	return seq
+
+# Events after seq, oldest first, at most limit of them. "reset" is true when events
+# after seq were already dropped from the ring, or seq is unknown (the plugin restarted),
+# so the reader must resync fully.
+func since(seq: int, limit: int = 500) -> Dictionary:
+	mutex.lock()
+	var oldest = events[0].seq if not events.is_empty() else last_seq + 1
+	var reset = seq < oldest - 1 or seq > last_seq
+	var page = []
+	if not reset:
+		var start = events.size() - (last_seq - seq)
+		page = events.slice(start, start + limit)
+	var latest = last_seq
+	mutex.unlock()
+	# After a reset the reader continues from the newest event
+	return {
+		"events": page,
+		"last_seq": page[-1].seq if not page.is_empty() else (latest if reset else seq),
+		"latest_seq": latest,
+		"reset": reset
+	}
@@ -2,6 +2,86 @@
 extends Node
 class_name GodotAPI
 
+# ClassDB indexes, built once at startup: the class list never changes while the editor runs
+var class_names: Array = []  # Sorted
+var class_rows: Dictionary = {}  # name -> {name, parent, can_instantiate, is_node}
+var class_children: Dictionary = {}  # name -> direct subclasses, sorted
+var category_members: Dictionary = {}  # base class -> sorted names of the base and all descendants
+
+# list_node_classes filters that name a base class
+const CLASS_FILTER_BASES = {"node": "Node", "control": "Control", "node2d": "Node2D", "node3d": "Node3D"}
+
+# Typed JSON encoding of property values (see variant_codec.gd)
+const VariantCodec = preload("variant_codec.gd")
+
+# Class name -> {property name: value} of a freshly constructed instance, for non_default_only reads
+var class_defaults: Dictionary = {}
+
+# Resource class of project files without loading them (see resource_type_index.gd)
+const ResourceTypeIndex = preload("resource_type_index.gd")
+var resource_types = ResourceTypeIndex.new()
+
+# Upper bound on nodes read by one get_many_node_properties call
+const MAX_MULTI_READ_NODES = 500
+
+# Nodes per /scene/tree page: default and upper bound
+const SCENE_TREE_PAGE_SIZE = 1000
+const SCENE_TREE_MAX_PAGE_SIZE = 5000
+
+# Files per /asset/list page: default and upper bound, and the keys it can sort by
+const RESOURCE_PAGE_SIZE = 500
+const RESOURCE_MAX_PAGE_SIZE = 5000
+const RESOURCE_SORT_KEYS = ["path", "name", "modified", "type", "extension"]
+
+func _ready():
+	_build_class_index()
+
+func _build_class_index():
+	class_names = Array(ClassDB.get_class_list())
+	class_names.sort()
+	class_rows.clear()
+	class_children.clear()
+	category_members.clear()
+	for cls in class_names:
+		class_children[cls] = []
+	for cls in class_names:
+		var parent = ClassDB.get_parent_class(cls)
+		class_rows[cls] = {
+			"name": cls,
+			"parent": parent,
+			"can_instantiate": ClassDB.can_instantiate(cls),
+			"is_node": false
+		}
+		if class_children.has(parent):
+			class_children[parent].append(cls)
+	# Children were appended in sorted order, so each list is already sorted
+	for base in CLASS_FILTER_BASES.values():
+		_classes_inheriting(base)
+	for cls in category_members.get("Node", []):
+		class_rows[cls].is_node = true
+
+func _ensure_class_index():
+	if class_names.is_empty():
+		_build_class_index()
+
+# The base class and all its descendants, sorted; computed once per base from class_children.
+# Unknown bases (from user input) get an empty list and are not memoized, so the memo
+# stays bounded by the number of real classes.
+func _classes_inheriting(base: String) -> Array:
+	if category_members.has(base):
+		return category_members[base]
+	if not class_children.has(base):
+		return []
+	var members = []
+	var stack = [base]
+	while not stack.is_empty():
+		var cls = stack.pop_back()
+		members.append(cls)
+		stack.append_array(class_children[cls])
+	members.sort()
+	category_members[base] = members
+	return members
+
 func create_scene(params: Dictionary) -> Dictionary:
 	var scene_name = params.get("name", "NewScene")
 	var scene_path = params.get("path", "res://scenes/%s.tscn" % scene_name)
@@ -135,6 +215,139 @@ func get_current_scene() -> Dictionary:
 		}
 	}
 
+# Serialises the edited scene's hierarchy below root_path (default the scene root) in
+# pre-order, down to depth (-1 = unlimited), one page of limit nodes at a time. Pages
+# start after the node named by the "after" cursor (the previous page's next_after), or
+# at offset. Only the page is visited and serialised: the walk steps from node to node
+# and stops once the page is full, so a page costs O(limit) with a cursor, O(offset +
+# limit) with an offset. total_count is only included with count=true, as it visits the
+# whole subtree. Paths are relative to the scene root ("." is the root itself);
+# "properties" adds the named property values, encoded with VariantCodec, to every node
+# that has them.
+func get_scene_tree(params: Dictionary) -> Dictionary:
+	var current_scene = EditorInterface.get_edited_scene_root()
+	if not current_scene:
+		return {
+			"status": 400,
+			"body": {
+				"success": false,
+				"error": "No scene currently open"
+			}
+		}
+	
+	var root_path = str(params.get("root_path", "."))
+	var root = current_scene.get_node_or_null(root_path if not root_path.is_empty() else ".")
+	if not root:
+		return {
+			"status": 404,
+			"body": {
+				"success": false,
+				"error": "Node not found: " + root_path
+			}
+		}
+	
+	var max_depth = _int_param(params, "depth", -1)
+	var offset = max(_int_param(params, "offset", 0), 0)
+	var limit = clamp(_int_param(params, "limit", SCENE_TREE_PAGE_SIZE), 1, SCENE_TREE_MAX_PAGE_SIZE)
+	var property_names = _list_param(params, "properties")
+	var count_param = params.get("count", "false")
+	var count_total = count_param == "true" or count_param == true
+	
+	# [node, depth below root] of the first node of the page
+	var cursor = [root, 0]
+	var after = str(params.get("after", ""))
+	if not after.is_empty():
+		var after_node = current_scene.get_node_or_null(after)
+		if not after_node or not (after_node == root or root.is_ancestor_of(after_node)):
+			# The node was removed or moved since the previous page
+			return {
+				"status": 409,
+				"body": {
+					"success": false,
+					"error": "Cursor node not found under %s: %s" % [root_path, after]
+				}
+			}
+		var after_depth = 0
+		var ancestor = after_node
+		while ancestor != root:
+			ancestor = ancestor.get_parent()
+			after_depth += 1
+		cursor = _next_in_tree([after_node, after_depth], root, max_depth)
+		offset = 0
+	for i in range(offset):
+		if cursor.is_empty():
+			break
+		cursor = _next_in_tree(cursor, root, max_depth)
+	
+	var page = []
+	while not cursor.is_empty() and page.size() < limit:
+		page.append(cursor[0])
+		cursor = _next_in_tree(cursor, root, max_depth)
+	var has_more = not cursor.is_empty()
+	
+	var nodes = []
+	for node in page:
+		var entry = {
+			"path": str(current_scene.get_path_to(node)),
+			"name": str(node.name),
+			"type": node.get_class(),
+			"parent": str(current_scene.get_path_to(node.get_parent())) if node != current_scene else "",
+			"index": node.get_index() if node != current_scene else 0,
+			"child_count": node.get_child_count(),
+			"owner": str(current_scene.get_path_to(node.owner)) if node.owner else "",
+			"groups": []
+		}
+		for group in node.get_groups():
+			# Skip engine-internal groups such as "_vp_unhandled_input..."
+			if not str(group).begins_with("_"):
+				entry.groups.append(str(group))
+		if node != current_scene and not node.scene_file_path.is_empty():
+			entry["instance"] = node.scene_file_path
+		if node.get_script():
+			entry["script"] = node.get_script().resource_path
+		if not property_names.is_empty():
+			entry["properties"] = _read_node_properties(node, property_names, false).properties
+		nodes.append(entry)
+	
+	var body = {
+		"success": true,
+		"scene_path": current_scene.scene_file_path,
+		"root_path": str(current_scene.get_path_to(root)),
+		"nodes": nodes,
+		"offset": offset,
+		"limit": limit,
+		"has_more": has_more,
+		"next_offset": offset + page.size() if has_more and after.is_empty() else -1,
+		"next_after": nodes[-1].path if has_more else ""
+	}
+	if count_total:
+		var total = 0
+		var counted = [root, 0]
+		while not counted.is_empty():
+			total += 1
+			counted = _next_in_tree(counted, root, max_depth)
+		body["total_count"] = total
+	return {
+		"status": 200,
+		"body": body
+	}
+
+# Pre-order successor of [node, depth] within root's subtree down to max_depth (-1 =
+# unlimited), as [node, depth], or [] after the last node. Costs O(depth) at most.
+func _next_in_tree(current: Array, root: Node, max_depth: int) -> Array:
+	var node: Node = current[0]
+	var depth: int = current[1]
+	if node.get_child_count() > 0 and (max_depth < 0 or depth < max_depth):
+		return [node.get_child(0), depth + 1]
+	while node != root:
+		var parent = node.get_parent()
+		var next_index = node.get_index() + 1
+		if next_index < parent.get_child_count():
+			return [parent.get_child(next_index), depth]
+		node = parent
+		depth -= 1
+	return []
+
 func add_node(params: Dictionary) -> Dictionary:
 	var node_type = params.get("type", "Node")
 	var node_name = params.get("name", "NewNode")
@@ -812,26 +1025,164 @@ func get_node_properties(params: Dictionary) -> Dictionary:
 			}
 		}
 	
-	var properties = {}
-	var property_list = target_node.get_property_list()
+	var read = _read_node_properties(target_node, _list_param(params, "names"), bool(params.get("non_default_only", false)))
+	var body = {
+		"success": true,
+		"node_path": node_path,
+		"node_type": target_node.get_class(),
+		"properties": read.properties,
+		"message": "Node properties retrieved successfully"
+	}
+	if read.has("missing_properties"):
+		body["missing_properties"] = read.missing_properties
+	return {
+		"status": 200,
+		"body": body
+	}
+
+# Reads several nodes' properties in one request: an explicit node_paths list, or every node
+# under root_path down to depth (0 = the root only, -1 = unlimited). A path that doesn't
+# resolve gets its own {success: false} entry instead of failing the request.
+func get_many_node_properties(params: Dictionary) -> Dictionary:
+	var current_scene = EditorInterface.get_edited_scene_root()
+	if not current_scene:
+		return {
+			"status": 400,
+			"body": {
+				"success": false,
+				"error": "No scene currently open"
+			}
+		}
+	
+	var node_paths = _list_param(params, "node_paths")
+	var root_path = str(params.get("root_path", ""))
+	if node_paths.is_empty() and root_path.is_empty():
+		return {
+			"status": 400,
+			"body": {
+				"success": false,
+				"error": "node_paths or root_path is required"
+			}
+		}
 	
-	for property in property_list:
-		if property.usage & PROPERTY_USAGE_STORAGE:
-			var prop_name = property.name
-			var prop_value = target_node.get(prop_name)
-			properties[prop_name] = str(prop_value)
+	var truncated = false
+	if node_paths.is_empty():
+		var root = current_scene.get_node_or_null(root_path)
+		if not root:
+			return {
+				"status": 404,
+				"body": {
+					"success": false,
+					"error": "Node not found: " + root_path
+				}
+			}
+		var subtree = []
+		truncated = _collect_subtree(root, _int_param(params, "depth", -1), subtree)
+		for node in subtree:
+			node_paths.append(str(current_scene.get_path_to(node)))
+	elif node_paths.size() > MAX_MULTI_READ_NODES:
+		node_paths = node_paths.slice(0, MAX_MULTI_READ_NODES)
+		truncated = true
+	
+	var names = _list_param(params, "names")
+	var non_default_only = bool(params.get("non_default_only", false))
+	var nodes = []
+	var missing_nodes = []
+	for path in node_paths:
+		var node = current_scene.get_node_or_null(path)
+		if not node:
+			missing_nodes.append(path)
+			nodes.append({"node_path": path, "success": false, "error": "Node not found: " + path})
+			continue
+		var entry = _read_node_properties(node, names, non_default_only)
+		entry["node_path"] = path
+		entry["node_type"] = node.get_class()
+		entry["success"] = true
+		nodes.append(entry)
 	
 	return {
 		"status": 200,
 		"body": {
 			"success": true,
-			"node_path": node_path,
-			"node_type": target_node.get_class(),
-			"properties": properties,
-			"message": "Node properties retrieved successfully"
+			"nodes": nodes,
+			"missing_nodes": missing_nodes,
+			"truncated": truncated,
+			"message": "Read properties of %d nodes" % (nodes.size() - missing_nodes.size())
 		}
 	}
 
+# Pre-order walk below root; returns true if MAX_MULTI_READ_NODES cut it short
+func _collect_subtree(root: Node, depth: int, out: Array) -> bool:
+	if out.size() >= MAX_MULTI_READ_NODES:
+		return true
+	out.append(root)
+	if depth == 0:
+		return false
+	for child in root.get_children():
+		if _collect_subtree(child, depth - 1, out):
+			return true
+	return false
+
+# Stored property values of one node, encoded with VariantCodec. names, when given, projects
+# to those properties in that order (unknown ones go in missing_properties); non_default_only
+# drops values equal to their default.
+func _read_node_properties(node: Node, names: Array, non_default_only: bool) -> Dictionary:
+	var read_names = []
+	var missing_properties = []
+	if names.is_empty():
+		for property in node.get_property_list():
+			if property.usage & PROPERTY_USAGE_STORAGE:
+				read_names.append(property.name)
+	else:
+		for prop_name in names:
+			if prop_name in node:
+				read_names.append(prop_name)
+			else:
+				missing_properties.append(prop_name)
+	
+	var defaults = _class_defaults(node.get_class()) if non_default_only else {}
+	var properties = {}
+	for prop_name in read_names:
+		var prop_value = node.get(prop_name)
+		if non_default_only and _is_default_value(node, prop_name, prop_value, defaults):
+			continue
+		properties[prop_name] = VariantCodec.encode(prop_value)
+	
+	var result = {"properties": properties}
+	if not missing_properties.is_empty():
+		result["missing_properties"] = missing_properties
+	return result
+
+# Storage property values of a default-constructed instance, built once per class
+func _class_defaults(cls: String) -> Dictionary:
+	if class_defaults.has(cls):
+		return class_defaults[cls]
+	var defaults = {}
+	if ClassDB.can_instantiate(cls):
+		var instance = ClassDB.instantiate(cls)
+		for property in instance.get_property_list():
+			if property.usage & PROPERTY_USAGE_STORAGE:
+				defaults[property.name] = instance.get(property.name)
+		if instance is Node:
+			instance.free()
+	class_defaults[cls] = defaults
+	return defaults
+
+# A property is default when it equals the node's revert value (exported script variables,
+# properties with class-specific defaults), else the class default or the script's initial value
+func _is_default_value(node: Object, prop_name: String, value, defaults: Dictionary) -> bool:
+	var default_value
+	if node.property_can_revert(prop_name):
+		default_value = node.property_get_revert(prop_name)
+	elif defaults.has(prop_name):
+		default_value = defaults[prop_name]
+	elif node.get_script():
+		default_value = node.get_script().get_property_default_value(prop_name)
+	else:
+		return false
+	# Variants of different types can't be compared with ==
+	return typeof(value) == typeof(default_value) and value == default_value
+
 func set_node_properties(params: Dictionary) -> Dictionary:
 	var node_path = params.get("node_path", "")
 	var properties = params.get("properties", {})
@@ -874,16 +1225,27 @@ func set_node_properties(params: Dictionary) -> Dictionary:
 			}
 		}
 	
+	var property_types = {}
+	for property in target_node.get_property_list():
+		property_types[property.name] = property.type
+	
 	var set_properties = []
 	var failed_properties = []
+	var errors = {}
 	
 	for prop_name in properties:
-		var prop_value = properties[prop_name]
-		if target_node.has_method("set") and prop_name in target_node:
-			target_node.set(prop_name, prop_value)
-			set_properties.append(prop_name)
-		else:
+		if not prop_name in target_node:
 			failed_properties.append(prop_name)
+			errors[prop_name] = "No such property on " + target_node.get_class()
+			continue
+		# Tagged values and untagged input are decoded against the property's declared type
+		var decoded = VariantCodec.decode(properties[prop_name], property_types.get(prop_name, TYPE_NIL))
+		if decoded.has("error"):
+			failed_properties.append(prop_name)
+			errors[prop_name] = decoded.error
+			continue
+		target_node.set(prop_name, decoded.value)
+		set_properties.append(prop_name)
 	
 	return {
 		"status": 200,
@@ -892,6 +1254,7 @@ func set_node_properties(params: Dictionary) -> Dictionary:
 			"node_path": node_path,
 			"set_properties": set_properties,
 			"failed_properties": failed_properties,
+			"errors": errors,
 			"message": "Node properties updated"
 		}
 	}
@@ -927,11 +1290,11 @@ func get_node_class_info(params: Dictionary) -> Dictionary:
 			}
 		}
 	
-	if not ClassDB.class_exists(class_name):
+	_ensure_class_index()
+	if not class_rows.has(class_name):
 		# Try to find similar class names
-		var all_classes = ClassDB.get_class_list()
 		var suggestions = []
-		for cls in all_classes:
+		for cls in class_names:
 			if cls.to_lower().contains(class_name.to_lower()) or class_name.to_lower().contains(cls.to_lower()):
 				suggestions.append(cls)
 		
@@ -948,23 +1311,18 @@ func get_node_class_info(params: Dictionary) -> Dictionary:
 			}
 		}
 	
+	var row = class_rows[class_name]
 	var info = {
 		"class_name": class_name,
 		"exists": true,
-		"can_instantiate": ClassDB.can_instantiate(class_name),
-		"is_node": ClassDB.is_parent_class(class_name, "Node"),
-		"parent_class": ClassDB.get_parent_class(class_name),
-		"child_classes": [],
+		"can_instantiate": row.can_instantiate,
+		"is_node": row.is_node,
+		"parent_class": row.parent,
+		"child_classes": class_children[class_name].duplicate(),
 		"properties": [],
 		"methods": []
 	}
 	
-	# Get child classes
-	var all_classes = ClassDB.get_class_list()
-	for cls in all_classes:
-		if ClassDB.get_parent_class(cls) == class_name:
-			info.child_classes.append(cls)
-	
 	# Get class methods
 	var methods = ClassDB.class_get_method_list(class_name, true)
 	for method in methods:
@@ -991,51 +1349,112 @@ func get_node_class_info(params: Dictionary) -> Dictionary:
 func list_node_classes(params: Dictionary) -> Dictionary:
 	var filter_type = params.get("filter", "all")  # all, node, control, node2d, node3d
 	var search_term = params.get("search", "")
+	var prefix = params.get("prefix", "")
+	# Paging: start at offset, or just after cursor (the last name of the previous page); limit 0 returns everything
+	var offset = max(0, _int_param(params, "offset", 0))
+	var limit = max(0, _int_param(params, "limit", 0))
+	var cursor = params.get("cursor", "")
+	var fields = _list_param(params, "fields")
+	
+	_ensure_class_index()
+	var candidates = class_names
+	if filter_type != "all":
+		candidates = _classes_inheriting(CLASS_FILTER_BASES.get(filter_type, filter_type))
+	
+	# Candidates are already sorted by name
+	var matches = []
+	var search_lower = search_term.to_lower()
+	var prefix_lower = prefix.to_lower()
+	for cls in candidates:
+		var cls_lower = cls.to_lower()
+		if (search_lower.is_empty() or cls_lower.contains(search_lower)) and (prefix_lower.is_empty() or cls_lower.begins_with(prefix_lower)):
+			matches.append(cls)
+	
+	var start = offset
+	if not cursor.is_empty():
+		start = matches.bsearch(cursor, false)
+	var page = matches.slice(start, start + limit) if limit > 0 else matches.slice(start)
+	
+	var classes = []
+	for cls in page:
+		if fields.is_empty():
+			classes.append(class_rows[cls])
+		else:
+			var row = {"name": cls}
+			for field in fields:
+				if class_rows[cls].has(field):
+					row[field] = class_rows[cls][field]
+			classes.append(row)
 	
-	var all_classes = ClassDB.get_class_list()
-	var filtered_classes = []
-	
-	for cls in all_classes:
-		var include_class = false
-		
-		# Apply filter
-		match filter_type:
-			"all":
-				include_class = true
-			"node":
-				include_class = ClassDB.is_parent_class(cls, "Node")
-			"control":
-				include_class = ClassDB.is_parent_class(cls, "Control")
-			"node2d":
-				include_class = ClassDB.is_parent_class(cls, "Node2D")
-			"node3d":
-				include_class = ClassDB.is_parent_class(cls, "Node3D")
-			_:
-				include_class = ClassDB.is_parent_class(cls, filter_type)
-		
-		# Apply search term
-		if include_class and not search_term.is_empty():
-			include_class = cls.to_lower().contains(search_term.to_lower())
-		
-		if include_class:
-			filtered_classes.append({
-				"name": cls,
-				"parent": ClassDB.get_parent_class(cls),
-				"can_instantiate": ClassDB.can_instantiate(cls),
-				"is_node": ClassDB.is_parent_class(cls, "Node")
-			})
-	
-	# Sort by name
-	filtered_classes.sort_custom(func(a, b): return a.name < b.name)
-	
+	var has_more = start + page.size() < matches.size()
 	return {
 		"status": 200,
 		"body": {
 			"success": true,
-			"classes": filtered_classes,
-			"total_count": filtered_classes.size(),
+			"classes": classes,
+			"total_count": matches.size(),
+			"offset": start,
+			"limit": limit,
+			"has_more": has_more,
+			"next_cursor": page.back() if has_more else "",
 			"filter": filter_type,
-			"search": search_term
+			"search": search_term,
+			"prefix": prefix
+		}
+	}
+
+# Integer request parameter; GET query values arrive as strings, JSON numbers as floats
+func _int_param(params: Dictionary, key: String, default_value: int) -> int:
+	var value = params.get(key, default_value)
+	if value is String:
+		return value.to_int() if value.is_valid_int() else default_value
+	if value is int or value is float:
+		return int(value)
+	return default_value
+
+# List request parameter given as an Array or a comma-separated String
+func _list_param(params: Dictionary, key: String) -> Array:
+	var value = params.get(key, [])
+	if value is String:
+		return Array(value.split(",", false)).map(func(item): return item.strip_edges())
+	if value is Array:
+		return value
+	return []
+
+# Exports the whole class hierarchy with each class's own properties and methods,
+# so clients can answer class introspection without further round trips
+func get_classdb_dump(params: Dictionary) -> Dictionary:
+	_ensure_class_index()
+	var classes = []
+	for cls in class_names:
+		var properties = []
+		for prop in ClassDB.class_get_property_list(cls, true):
+			if prop.usage & PROPERTY_USAGE_STORAGE:
+				properties.append({
+					"name": prop.name,
+					"type": _type_to_string(prop.type),
+					"usage": prop.usage
+				})
+		var methods = []
+		for method in ClassDB.class_get_method_list(cls, true):
+			methods.append(method.name)
+		var row = class_rows[cls]
+		classes.append({
+			"name": cls,
+			"parent": row.parent,
+			"can_instantiate": row.can_instantiate,
+			"is_node": row.is_node,
+			"properties": properties,
+			"methods": methods
+		})
+	
+	return {
+		"status": 200,
+		"body": {
+			"success": true,
+			"godot_version": Engine.get_version_info().string,
+			"classes": classes,
+			"total_count": classes.size()
 		}
 	}
 
@@ -1142,19 +1561,34 @@ func import_asset(params: Dictionary) -> Dictionary:
 		}
 	}
 
+# Lists files from EditorFileSystem's in-memory tree (path and resource type per file),
+# so nothing is opened and no directory is read from disk. Matches are sorted, then only
+# the requested page is expanded into full entries.
 func list_resources(params: Dictionary) -> Dictionary:
-	var directory = params.get("directory", "res://")
-	var file_types_param = params.get("file_types", "")
-	var file_types = []
-	if not file_types_param.is_empty():
-		file_types = file_types_param.split(",")
+	var directory = str(params.get("directory", "res://"))
+	var file_types = _list_param(params, "file_types")
+	var globs = _list_param(params, "glob")
+	var base_type = str(params.get("resource_type", ""))
 	var recursive_param = params.get("recursive", "true")
 	var recursive = recursive_param == "true" or recursive_param == true
+	var descending_param = params.get("descending", "false")
+	var descending = descending_param == "true" or descending_param == true
+	var sort_key = str(params.get("sort", "path"))
+	var offset = max(_int_param(params, "offset", 0), 0)
+	var limit = clamp(_int_param(params, "limit", RESOURCE_PAGE_SIZE), 1, RESOURCE_MAX_PAGE_SIZE)
 	
-	var resources = []
-	var dir = DirAccess.open(directory)
+	if not sort_key in RESOURCE_SORT_KEYS:
+		return {
+			"status": 400,
+			"body": {
+				"success": false,
+				"error": "Unknown sort key: %s (expected one of %s)" % [sort_key, ", ".join(RESOURCE_SORT_KEYS)]
+			}
+		}
 	
-	if not dir:
+	var filesystem = EditorInterface.get_resource_filesystem()
+	var root_dir = filesystem.get_filesystem_path(directory)
+	if not root_dir:
 		return {
 			"status": 404,
 			"body": {
@@ -1163,21 +1597,97 @@ func list_resources(params: Dictionary) -> Dictionary:
 			}
 		}
 	
-	if recursive:
-		_scan_directory_for_resources(dir, directory, resources, file_types)
-	else:
-		_scan_single_directory_for_resources(dir, directory, resources, file_types)
+	var matches = []
+	_collect_filesystem_files(root_dir, recursive, file_types, globs, base_type, matches)
+	if sort_key == "modified":
+		for entry in matches:
+			entry["modified"] = FileAccess.get_modified_time(entry.path)
+	matches.sort_custom(func(a, b): return _resource_sorts_before(a, b, sort_key, descending))
 	
+	var page = matches.slice(offset, offset + limit)
+	var resources = []
+	for entry in page:
+		var extension = entry.path.get_extension()
+		resources.append({
+			"name": entry.path.get_file().get_basename(),
+			"path": entry.path,
+			"directory": entry.path.get_base_dir(),
+			"type": _get_asset_type_from_extension(extension),
+			"resource_type": entry.type,
+			"extension": extension,
+			"modified": entry.get("modified", FileAccess.get_modified_time(entry.path))
+		})
+	
+	var has_more = offset + page.size() < matches.size()
 	return {
 		"status": 200,
 		"body": {
+			"success": true,
 			"resources": resources,
 			"count": resources.size(),
+			"total_count": matches.size(),
+			"offset": offset,
+			"limit": limit,
+			"has_more": has_more,
+			"next_offset": offset + page.size() if has_more else -1,
 			"directory": directory,
+			"sort": sort_key,
+			# While the editor is still scanning, files it hasn't reached yet are missing
+			"scanning": filesystem.is_scanning(),
 			"message": "Resource list retrieved successfully"
 		}
 	}
 
+# base_type, when given, keeps only resources of that class or a subclass
+func _collect_filesystem_files(dir: EditorFileSystemDirectory, recursive: bool, file_types: Array, globs: Array, base_type: String, out: Array):
+	for i in range(dir.get_file_count()):
+		var path = dir.get_file_path(i)
+		if not _resource_file_matches(path, dir.get_file(i), file_types, globs):
+			continue
+		var file_type = str(dir.get_file_type(i))
+		if not base_type.is_empty():
+			if file_type.is_empty():
+				file_type = resource_types.header_type(path)
+			if not ResourceTypeIndex.is_type(file_type, base_type):
+				continue
+		out.append({"path": path, "type": file_type})
+	if recursive:
+		for i in range(dir.get_subdir_count()):
+			_collect_filesystem_files(dir.get_subdir(i), recursive, file_types, globs, base_type, out)
+
+# file_types are name suffixes (".png"); a glob containing "/" is matched against the
+# whole res:// path, any other against the file name, case-insensitively
+func _resource_file_matches(path: String, file_name: String, file_types: Array, globs: Array) -> bool:
+	if not file_types.is_empty() and not file_types.any(func(file_type): return file_name.ends_with(file_type)):
+		return false
+	if globs.is_empty():
+		return true
+	for pattern in globs:
+		if pattern.matchn(path if "/" in pattern else file_name):
+			return true
+	return false
+
+func _resource_sort_value(entry: Dictionary, sort_key: String):
+	match sort_key:
+		"name":
+			return entry.path.get_file().get_basename().to_lower()
+		"modified":
+			return entry.modified
+		"type":
+			return entry.type
+		"extension":
+			return entry.path.get_extension().to_lower()
+		_:
+			return entry.path
+
+# Ties are broken by path so pages stay stable between calls
+func _resource_sorts_before(a: Dictionary, b: Dictionary, sort_key: String, descending: bool) -> bool:
+	var value_a = _resource_sort_value(a, sort_key)
+	var value_b = _resource_sort_value(b, sort_key)
+	if value_a == value_b:
+		return a.path < b.path
+	return value_a > value_b if descending else value_a < value_b
+
 func organize_assets(params: Dictionary) -> Dictionary:
 	var source_path = params.get("source_path", "")
 	var target_path = params.get("target_path", "")
@@ -1405,84 +1915,6 @@ func _get_asset_directory_for_type(asset_type: String) -> String:
 		_:
 			return "assets"
 
-func _scan_directory_for_resources(dir: DirAccess, path: String, resources: Array, file_types: Array):
-	if not dir:
-		return
-		
-	dir.list_dir_begin()
-	var file_name = dir.get_next()
-	
-	while file_name != "":
-		if file_name == "." or file_name == "..":
-			file_name = dir.get_next()
-			continue
-			
-		var full_path = path + "/" + file_name if path != "res://" else "res://" + file_name
-		
-		if dir.current_is_dir():
-			if not file_name.begins_with("."):
-				var sub_dir = DirAccess.open(full_path)
-				if sub_dir:
-					_scan_directory_for_resources(sub_dir, full_path, resources, file_types)
-		else:
-			_add_resource_if_matches(full_path, path, file_name, resources, file_types)
-		
-		file_name = dir.get_next()
-	
-	dir.list_dir_end()
-
-func _scan_single_directory_for_resources(dir: DirAccess, path: String, resources: Array, file_types: Array):
-	if not dir:
-		return
-		
-	dir.list_dir_begin()
-	var file_name = dir.get_next()
-	
-	while file_name != "":
-		if file_name == "." or file_name == "..":
-			file_name = dir.get_next()
-			continue
-			
-		var full_path = path + "/" + file_name if path != "res://" else "res://" + file_name
-		
-		if not dir.current_is_dir():
-			_add_resource_if_matches(full_path, path, file_name, resources, file_types)
-		
-		file_name = dir.get_next()
-	
-	dir.list_dir_end()
-
-func _add_resource_if_matches(full_path: String, directory: String, file_name: String, resources: Array, file_types: Array):
-	# Check if file type matches filter
-	if file_types.size() > 0:
-		var matches_filter = false
-		for file_type in file_types:
-			if file_name.ends_with(file_type):
-				matches_filter = true
-				break
-		if not matches_filter:
-			return
-	
-	# Get file size
-	var file = FileAccess.open(full_path, FileAccess.READ)
-	var size = "unknown"
-	if file:
-		size = str(file.get_length()) + " bytes"
-		file.close()
-	
-	# Determine asset type
-	var asset_type = _get_asset_type_from_extension(file_name.get_extension())
-	
-	var resource_info = {
-		"name": file_name.get_basename(),
-		"path": full_path,
-		"directory": directory,
-		"size": size,
-		"type": asset_type,
-		"extension": file_name.get_extension()
-	}
-	resources.append(resource_info)
-
 func _get_asset_type_from_extension(extension: String) -> String:
 	match extension.to_lower():
 		"png", "jpg", "jpeg", "bmp", "tga", "webp":
@@ -3436,10 +3868,19 @@ func export_theme(params: Dictionary) -> Dictionary:
 
 func list_themes(params: Dictionary) -> Dictionary:
 	var directory = params.get("directory", "res://")
-	var recursive = params.get("recursive", true)
+	var recursive_param = params.get("recursive", true)
+	var recursive = recursive_param == "true" or recursive_param == true
 	
+	# Types come from the resource type index; no theme is loaded to list it
 	var themes = []
-	_find_theme_files(directory, themes, recursive)
+	for path in resource_types.find("Theme", directory, recursive):
+		var file_access = FileAccess.open(path, FileAccess.READ)
+		var size = file_access.get_length() if file_access else 0
+		themes.append({
+			"name": path.get_file().get_basename(),
+			"path": path,
+			"size": str(size) + " bytes"
+		})
 	
 	return {
 		"status": 200,
@@ -3595,37 +4036,6 @@ func _apply_theme_to_node(node: Node, theme: Theme, recursive: bool) -> int:
 	
 	return count
 
-func _find_theme_files(directory: String, themes: Array, recursive: bool):
-	var dir = DirAccess.open(directory)
-	if not dir:
-		return
-	
-	dir.list_dir_begin()
-	var file_name = dir.get_next()
-	
-	while file_name != "":
-		var full_path = directory.path_join(file_name)
-		
-		if dir.current_is_dir() and recursive and file_name != "." and file_name != "..":
-			_find_theme_files(full_path, themes, recursive)
-		elif file_name.ends_with(".tres") or file_name.ends_with(".res"):
-			# Check if it's a theme resource
-			if ResourceLoader.exists(full_path):
-				var resource = load(full_path)
-				if resource is Theme:
-					var file_access = FileAccess.open(full_path, FileAccess.READ)
-					var size = file_access.get_length() if file_access else 0
-					if file_access:
-						file_access.close()
-					
-					themes.append({
-						"name": file_name.get_basename(),
-						"path": full_path,
-						"size": str(size) + " bytes"
-					})
-		
-		file_name = dir.get_next()
-
 func _get_theme_colors(theme: Theme) -> Dictionary:
 	var colors = {}
 	# This is simplified - you'd want to iterate through all theme types
@@ -6,15 +6,66 @@ var tcp_server: TCPServer
 var port: int = 8080
 var is_running: bool = false
 var godot_api
-var error_log: Array = []
-var max_log_entries: int = 100
+var editor_events
+var error_log
+var max_log_entries: int = 500
+# Engine Logger feeding error_log; null on editors older than Godot 4.5
+var error_capture
+
+# Keep-alive connection management (owned by the I/O thread)
+var connections: Array = []
+var max_connections: int = 16
+var idle_timeout_msec: int = 30000
+var max_requests_per_connection: int = 1000
+
+# Socket I/O runs on server_thread; only route_request runs on the main thread.
+# request_queue holds jobs parsed by the I/O thread and is guarded by queue_mutex.
+var server_thread: Thread
+var queue_mutex: Mutex = Mutex.new()
+var request_queue: Array = []
+var thread_running: bool = false
+var idle_sleep_usec: int = 1000
+
+# Incremental request parser limits
+var max_header_bytes: int = 65536
+var max_body_bytes: int = 64 * 1024 * 1024
+
+# Response writer: bodies above stream_threshold_bytes are sent with chunked
+# transfer encoding in write_chunk_bytes pieces, written without blocking
+var stream_threshold_bytes: int = 64 * 1024
+var write_chunk_bytes: int = 16 * 1024
+# Bodies larger than this are compressed when the client sends Accept-Encoding
+var compression_threshold_bytes: int = 2048
+
+const CHUNKS_INCOMPLETE = 0
+const CHUNKS_COMPLETE = 1
+const CHUNKS_INVALID = -1
+
+# Requests that never touch the editor and can be answered on the I/O thread
+const THREAD_SAFE_ROUTES = ["GET /health"]
+
+# X-Deadline (Unix time in ms) of the request being routed; 0 when the client sent none
+var request_deadline_msec: float = 0.0
+
+# GET /events and GET /errors long-polls are held on the I/O thread (they only read the
+# mutex-guarded event and error logs) until something newer than "since" exists or the poll times out
+const EVENTS_ROUTE = "GET /events"
+const ERRORS_ROUTE = "GET /errors"
+var max_poll_timeout_msec: int = 25000
 
 func _ready():
+	var script_path = get_script().resource_path.get_base_dir()
 	if not godot_api:
-		var script_path = get_script().resource_path.get_base_dir()
 		var GodotAPIScript = load(script_path + "/godot_api.gd")
 		godot_api = GodotAPIScript.new()
 		add_child(godot_api)
+	if not editor_events:
+		var EditorEventsScript = load(script_path + "/editor_events.gd")
+		editor_events = EditorEventsScript.new()
+		add_child(editor_events)
+	if not error_log:
+		var ErrorLogScript = load(script_path + "/error_log.gd")
+		error_log = ErrorLogScript.new(max_log_entries)
 	
 	# Set up error capture
 	_setup_error_capture()
@@ -24,48 +75,460 @@ func start_server():
 	var error = tcp_server.listen(port, "127.0.0.1")
 	if error == OK:
 		is_running = true
+		thread_running = true
+		server_thread = Thread.new()
+		server_thread.start(_server_loop)
 		print("HTTP Server listening on port ", port)
 	else:
 		print("Failed to start HTTP server: ", error)
 
 func stop_server():
+	if server_thread:
+		queue_mutex.lock()
+		thread_running = false
+		queue_mutex.unlock()
+		server_thread.wait_to_finish()
+		server_thread = null
+	for connection in connections:
+		connection.peer.disconnect_from_host()
+	connections.clear()
+	request_queue.clear()
 	if tcp_server:
 		tcp_server.stop()
 		is_running = false
 		print("HTTP Server stopped")
 
+func _exit_tree():
+	if server_thread:
+		stop_server()
+	if error_capture:
+		OS.remove_logger(error_capture)
+		error_capture = null
+
+# Main thread: run every queued request against the editor API
 func _process(_delta):
-	if not is_running or not tcp_server:
+	if not is_running:
 		return
 	
-	if tcp_server.is_connection_available():
-		var client = tcp_server.take_connection()
-		handle_client(client)
+	queue_mutex.lock()
+	var jobs = request_queue
+	request_queue = []
+	queue_mutex.unlock()
+	
+	for job in jobs:
+		var response
+		request_deadline_msec = job.deadline
+		if _deadline_exceeded():
+			# The client has already timed out; don't start work nobody is waiting for
+			response = {
+				"status": 504,
+				"body": {
+					"success": false,
+					"error": "Request deadline expired before it was started",
+					"deadline_exceeded": true
+				}
+			}
+		else:
+			response = route_request(job.method, job.path, job.body)
+		request_deadline_msec = 0.0
+		queue_mutex.lock()
+		job.response = response
+		job.done = true
+		queue_mutex.unlock()
+
+# I/O thread: accept, read, parse and write until stop_server() is called
+func _server_loop():
+	while true:
+		queue_mutex.lock()
+		var running = thread_running
+		queue_mutex.unlock()
+		if not running:
+			break
+		
+		var did_work = _accept_connections()
+		var now = Time.get_ticks_msec()
+		var still_open = []
+		for connection in connections:
+			var state = _service_connection(connection, now)
+			if state.did_work:
+				did_work = true
+			if state.open:
+				still_open.append(connection)
+			else:
+				connection.peer.disconnect_from_host()
+		connections = still_open
+		
+		if not did_work:
+			OS.delay_usec(idle_sleep_usec)
+
+func _accept_connections() -> bool:
+	var accepted = false
+	while tcp_server.is_connection_available():
+		accepted = true
+		var peer = tcp_server.take_connection()
+		if connections.size() >= max_connections:
+			# Over the cap: answer immediately and close rather than queueing
+			send_response(peer, {"status": 503, "body": {"success": false, "error": "Too many connections"}}, false)
+			peer.disconnect_from_host()
+			continue
+		var connection = {
+			"peer": peer,
+			"last_active": Time.get_ticks_msec(),
+			"requests_served": 0,
+			"job": null,
+			"buffer": PackedByteArray(),
+			"out_queue": [],
+			"out_offset": 0,
+			"close_after_write": false
+		}
+		_reset_parser(connection)
+		connections.append(connection)
+	return accepted
+
+# Returns {"open": bool, "did_work": bool} for one connection
+func _service_connection(connection: Dictionary, now: int) -> Dictionary:
+	var peer: StreamPeerTCP = connection.peer
+	
+	# Finish writing the previous response before reading the next request
+	if not connection.out_queue.is_empty():
+		return _flush_output(connection, now)
+	
+	# Waiting on the main thread: queue the response once it is ready
+	if connection.job != null:
+		var job = connection.job
+		queue_mutex.lock()
+		var done = job.done
+		queue_mutex.unlock()
+		if not done and job.has("poll"):
+			done = _poll_events(job, now)
+		if not done:
+			return {"open": true, "did_work": false}
+		connection.job = null
+		connection.out_queue = _encode_response(job.response, job.keep_alive, job.get("chunked_ok", false), job.get("encoding", ""))
+		connection.out_offset = 0
+		connection.close_after_write = not job.keep_alive
+		return _flush_output(connection, now)
+	
+	peer.poll()
+	if peer.get_status() != StreamPeerTCP.STATUS_CONNECTED:
+		return {"open": false, "did_work": false}
+	
+	var did_read = _read_available(connection)
+	if did_read:
+		connection.last_active = now
+	if connection.buffer.is_empty():
+		return {"open": now - connection.last_active < idle_timeout_msec, "did_work": false}
+	
+	var parsed = _parse_buffered(connection)
+	if parsed.is_empty():
+		# Partial request: keep accumulating, but drop peers that stall mid-request
+		return {"open": now - connection.last_active < idle_timeout_msec, "did_work": did_read}
+	
+	connection.requests_served += 1
+	if parsed.has("error_response"):
+		# The stream can't be resynchronised after a framing error, so close after replying
+		connection.job = {"keep_alive": false, "done": true, "response": parsed.error_response}
+		return {"open": true, "did_work": true}
+	
+	var allow_keep_alive = connection.requests_served < max_requests_per_connection
+	# The response is written on a later pass, once the job is done
+	connection.job = handle_client(parsed.head, parsed.body, allow_keep_alive)
+	return {"open": true, "did_work": true}
 
-func handle_client(client: StreamPeerTCP):
-	var request = ""
-	var bytes_to_read = 1024
+# Writes as much queued output as the socket accepts without blocking
+func _flush_output(connection: Dictionary, now: int) -> Dictionary:
+	var peer: StreamPeerTCP = connection.peer
+	peer.poll()
+	if peer.get_status() != StreamPeerTCP.STATUS_CONNECTED:
+		return {"open": false, "did_work": false}
 	
-	while client.get_available_bytes() > 0:
-		var chunk = client.get_string(min(bytes_to_read, client.get_available_bytes()))
-		request += chunk
-		if request.ends_with("\r\n\r\n"):
+	var wrote = false
+	while not connection.out_queue.is_empty():
+		var segment: PackedByteArray = connection.out_queue[0]
+		var pending = segment if connection.out_offset == 0 else segment.slice(connection.out_offset)
+		var result = peer.put_partial_data(pending)
+		if result[0] != OK:
+			return {"open": false, "did_work": wrote}
+		var sent: int = result[1]
+		if sent > 0:
+			wrote = true
+			connection.last_active = now
+		if sent < pending.size():
+			# Socket buffer is full; resume from here on the next pass
+			connection.out_offset += sent
 			break
+		connection.out_queue.pop_front()
+		connection.out_offset = 0
+	
+	if connection.out_queue.is_empty() and connection.close_after_write:
+		return {"open": false, "did_work": wrote}
+	return {"open": now - connection.last_active < idle_timeout_msec, "did_work": wrote}
+
+# Moves whatever the socket has into the connection buffer without blocking
+func _read_available(connection: Dictionary) -> bool:
+	var peer: StreamPeerTCP = connection.peer
+	var available = peer.get_available_bytes()
+	if available <= 0:
+		return false
+	var result = peer.get_partial_data(available)
+	if result[0] != OK or result[1].is_empty():
+		return false
+	connection.buffer.append_array(result[1])
+	return true
+
+func _reset_parser(connection: Dictionary):
+	connection.header_end = -1
+	connection.scan_pos = 0
+	connection.head = ""
+	connection.content_length = 0
+	connection.chunked = false
+	connection.chunk_pos = 0
+	connection.body = PackedByteArray()
+
+# Advances the connection's parser over its buffer. Returns {} while the request is
+# incomplete, {"head", "body"} once a full request is buffered, or {"error_response"}.
+# Bytes after the request stay buffered for the next (pipelined) request.
+func _parse_buffered(connection: Dictionary) -> Dictionary:
+	if connection.header_end == -1:
+		var header_end = _find_header_end(connection.buffer, connection.scan_pos)
+		if header_end == -1:
+			if connection.buffer.size() > max_header_bytes:
+				return {"error_response": {"status": 431, "body": {"success": false, "error": "Request headers too large"}}}
+			# Resume the scan where it stopped, allowing for a split CRLFCRLF
+			connection.scan_pos = max(0, connection.buffer.size() - 3)
+			return {}
+		
+		connection.header_end = header_end
+		connection.head = connection.buffer.slice(0, header_end - 4).get_string_from_utf8()
+		var headers = _parse_headers(connection.head)
+		if headers.get("transfer-encoding", "").to_lower().contains("chunked"):
+			connection.chunked = true
+			connection.chunk_pos = header_end
+		elif headers.has("content-length"):
+			var length_text = headers["content-length"]
+			if not length_text.is_valid_int() or int(length_text) < 0:
+				return {"error_response": {"status": 400, "body": {"success": false, "error": "Invalid Content-Length"}}}
+			connection.content_length = int(length_text)
+			if connection.content_length > max_body_bytes:
+				return {"error_response": {"status": 413, "body": {"success": false, "error": "Request body too large"}}}
+	
+	var consumed = 0
+	if connection.chunked:
+		var chunk_state = _parse_chunks(connection)
+		if chunk_state == CHUNKS_INCOMPLETE:
+			return {}
+		if chunk_state == CHUNKS_INVALID:
+			return {"error_response": {"status": 400, "body": {"success": false, "error": "Invalid chunked request body"}}}
+		consumed = connection.chunk_pos
+	else:
+		consumed = connection.header_end + connection.content_length
+		if connection.buffer.size() < consumed:
+			return {}
+		connection.body = connection.buffer.slice(connection.header_end, consumed)
+	
+	var request = {"head": connection.head, "body": connection.body.get_string_from_utf8()}
+	connection.buffer = connection.buffer.slice(consumed)
+	_reset_parser(connection)
+	return request
+
+# Decodes as many complete chunks as are buffered, resuming from chunk_pos
+func _parse_chunks(connection: Dictionary) -> int:
+	var buffer: PackedByteArray = connection.buffer
+	while true:
+		var line_end = _find_crlf(buffer, connection.chunk_pos)
+		if line_end == -1:
+			return CHUNKS_INCOMPLETE
+		
+		var size_text = buffer.slice(connection.chunk_pos, line_end).get_string_from_ascii().split(";")[0].strip_edges()
+		if not size_text.is_valid_hex_number():
+			return CHUNKS_INVALID
+		var chunk_size = size_text.hex_to_int()
+		
+		if chunk_size == 0:
+			# Last chunk: skip optional trailers up to the terminating empty line
+			var trailer_end = _find_header_end(buffer, line_end)
+			if trailer_end == -1:
+				return CHUNKS_INCOMPLETE
+			connection.chunk_pos = trailer_end
+			return CHUNKS_COMPLETE
+		
+		var data_start = line_end + 2
+		var data_end = data_start + chunk_size
+		if buffer.size() < data_end + 2:
+			return CHUNKS_INCOMPLETE
+		if connection.body.size() + chunk_size > max_body_bytes:
+			return CHUNKS_INVALID
+		connection.body.append_array(buffer.slice(data_start, data_end))
+		connection.chunk_pos = data_end + 2
+	return CHUNKS_INCOMPLETE
+
+# Index just past the first CRLFCRLF at or after from, or -1
+func _find_header_end(buffer: PackedByteArray, from: int) -> int:
+	var pos = buffer.find(13, from)
+	while pos != -1 and pos + 3 < buffer.size():
+		if buffer[pos + 1] == 10 and buffer[pos + 2] == 13 and buffer[pos + 3] == 10:
+			return pos + 4
+		pos = buffer.find(13, pos + 1)
+	return -1
+
+# Index of the CR of the first CRLF at or after from, or -1
+func _find_crlf(buffer: PackedByteArray, from: int) -> int:
+	var pos = buffer.find(13, from)
+	while pos != -1 and pos + 1 < buffer.size():
+		if buffer[pos + 1] == 10:
+			return pos
+		pos = buffer.find(13, pos + 1)
+	return -1
+
+# Header names are lower-cased; the request line is skipped
+func _parse_headers(head: String) -> Dictionary:
+	var headers = {}
+	var lines = head.split("\r\n")
+	for i in range(1, lines.size()):
+		var separator = lines[i].find(":")
+		if separator > 0:
+			headers[lines[i].substr(0, separator).strip_edges().to_lower()] = lines[i].substr(separator + 1).strip_edges()
+	return headers
+
+# Turns one parsed request into a job on the I/O thread.
+# Jobs that need the editor are queued for _process; the rest are answered here.
+func handle_client(head: String, body_text: String, allow_keep_alive: bool = false) -> Dictionary:
+	var job = {
+		"keep_alive": allow_keep_alive and _wants_keep_alive(head),
+		"chunked_ok": _is_http11(head),
+		"encoding": _negotiate_encoding(head),
+		"deadline": _parse_deadline(head),
+		"done": false,
+		"response": null
+	}
+	var parsed = _build_request(head, body_text)
+	if parsed.has("error_response"):
+		job.response = parsed.error_response
+		job.done = true
+		return job
 	
-	var response = process_request(request)
-	send_response(client, response)
-	client.disconnect_from_host()
+	job.method = parsed.method
+	job.path = parsed.path
+	job.body = parsed.body
+	var route = parsed.method + " " + parsed.path
+	if route == EVENTS_ROUTE or route == ERRORS_ROUTE:
+		# Answered by _poll_events on the I/O thread once there is something to report
+		var timeout_msec = clamp(int(str(parsed.body.get("timeout", "0")).to_float() * 1000.0), 0, max_poll_timeout_msec)
+		var since = str(parsed.body.get("since", "-1")).to_int()
+		job.poll = {
+			"since": since,
+			"seen": since,
+			"limit": clamp(str(parsed.body.get("limit", "500")).to_int(), 1, 1000),
+			"until": Time.get_ticks_msec() + timeout_msec
+		}
+		if route == ERRORS_ROUTE:
+			job.poll.errors = parsed.body
+			# Without a cursor the answer is the whole log, but the wait is for errors
+			# logged after the request arrived
+			job.poll.start = since if since >= 0 else error_log.latest_seq()
+			job.poll.seen = job.poll.start
+		if job.deadline > 0.0:
+			# Answer (possibly empty) before the client gives up on us
+			var remaining = job.deadline - Time.get_unix_time_from_system() * 1000.0
+			job.poll.until = min(job.poll.until, Time.get_ticks_msec() + int(remaining) - 100)
+		return job
+	if route in THREAD_SAFE_ROUTES:
+		job.response = route_request(parsed.method, parsed.path, parsed.body)
+		job.done = true
+		return job
+	
+	queue_mutex.lock()
+	request_queue.append(job)
+	queue_mutex.unlock()
+	return job
+
+# I/O thread: completes a /events or /errors long-poll job once entries after poll.since
+# exist (for /errors: matching the filters and newer than poll.start) or it times out
+func _poll_events(job: Dictionary, now: int) -> bool:
+	var source_log = error_log if job.poll.has("errors") else editor_events.event_log
+	var latest = source_log.latest_seq()
+	if latest == job.poll.seen and now < job.poll.until:
+		return false
+	var result
+	if job.poll.has("errors"):
+		result = _query_errors(job.poll.errors)
+		var fresh = result.has_more or (not result.errors.is_empty() and result.errors[-1].seq > job.poll.start)
+		if not fresh and not result.reset and now < job.poll.until:
+			# Only errors the filters exclude arrived; wait for the next one
+			job.poll.seen = latest
+			return false
+	else:
+		result = source_log.since(job.poll.since, job.poll.limit)
+	result["success"] = true
+	job.response = {"status": 200, "body": result}
+	job.done = true
+	return true
+
+# HTTP/1.1 defaults to persistent connections unless the client sends "Connection: close"
+func _wants_keep_alive(head: String) -> bool:
+	var connection_header = _parse_headers(head).get("connection", "").to_lower()
+	if connection_header == "close":
+		return false
+	var first_line_end = head.find("\r\n")
+	var request_line = head.substr(0, first_line_end if first_line_end != -1 else head.length())
+	if request_line.to_lower().ends_with("http/1.0"):
+		return connection_header == "keep-alive"
+	return true
+
+# Picks gzip or deflate from Accept-Encoding; "" means send the body as-is
+func _negotiate_encoding(head: String) -> String:
+	var accepted = {}
+	for entry in _parse_headers(head).get("accept-encoding", "").to_lower().split(","):
+		var parts = entry.strip_edges().split(";")
+		var quality = 1.0
+		if parts.size() > 1 and parts[1].strip_edges().begins_with("q="):
+			quality = parts[1].strip_edges().substr(2).to_float()
+		accepted[parts[0].strip_edges()] = quality
+	for encoding in ["gzip", "deflate"]:
+		if accepted.get(encoding, 0.0) > 0.0:
+			return encoding
+	return ""
+
+# X-Deadline carries the absolute Unix time in milliseconds after which the client stops waiting
+func _parse_deadline(head: String) -> float:
+	var value = _parse_headers(head).get("x-deadline", "")
+	if value.is_valid_float():
+		return value.to_float()
+	return 0.0
+
+func _deadline_exceeded() -> bool:
+	return request_deadline_msec > 0.0 and Time.get_unix_time_from_system() * 1000.0 >= request_deadline_msec
+
+# Chunked responses are only understood by HTTP/1.1 clients
+func _is_http11(head: String) -> bool:
+	var first_line_end = head.find("\r\n")
+	var request_line = head.substr(0, first_line_end if first_line_end != -1 else head.length())
+	return request_line.to_upper().ends_with("HTTP/1.1")
 
 func process_request(request: String) -> Dictionary:
-	var lines = request.split("\n")
+	var parsed = parse_request(request)
+	if parsed.has("error_response"):
+		return parsed.error_response
+	return route_request(parsed.method, parsed.path, parsed.body)
+
+# Parses a raw request into {method, path, body}, or {error_response} when malformed.
+# Touches no editor state, so it is safe to call from the I/O thread.
+func parse_request(request: String) -> Dictionary:
+	var header_end = request.find("\r\n\r\n")
+	if header_end == -1:
+		return _build_request(request, "")
+	return _build_request(request.substr(0, header_end), request.substr(header_end + 4))
+
+func _build_request(head: String, body_text: String) -> Dictionary:
+	var lines = head.split("\n")
 	if lines.size() == 0:
-		return {"status": 400, "body": "Bad Request"}
+		return {"error_response": {"status": 400, "body": "Bad Request"}}
 	
 	var request_line = lines[0].strip_edges()
 	var parts = request_line.split(" ")
 	
 	if parts.size() < 2:
-		return {"status": 400, "body": "Bad Request"}
+		return {"error_response": {"status": 400, "body": "Bad Request"}}
 	
 	var method = parts[0]
 	var path_with_query = parts[1]
@@ -86,25 +549,37 @@ func process_request(request: String) -> Dictionary:
 	
 	# Extract JSON body for POST requests
 	var body_json = {}
-	if method == "POST":
-		var body_start = request.find("\r\n\r\n")
-		if body_start != -1:
-			var body = request.substr(body_start + 4)
-			var json = JSON.new()
-			var parse_result = json.parse(body)
-			if parse_result == OK:
-				body_json = json.data
+	if method == "POST" and not body_text.is_empty():
+		var json = JSON.new()
+		var parse_result = json.parse(body_text)
+		if parse_result == OK and json.data is Dictionary:
+			body_json = json.data
 	
 	# Merge query params into body for GET requests
 	if method == "GET" and query_params.size() > 0:
 		body_json = query_params
 	
-	return route_request(method, path, body_json)
+	return {"method": method, "path": path, "body": body_json}
+
+# Class count plus a hash of the loaded GDExtensions; cheap enough for every /health
+func _classdb_fingerprint() -> String:
+	var extensions = GDExtensionManager.get_loaded_extensions()
+	extensions.sort()
+	return "%d-%08x" % [ClassDB.get_class_list().size(), ",".join(extensions).hash()]
 
 func route_request(method: String, path: String, body: Dictionary) -> Dictionary:
 	match [method, path]:
 		["GET", "/health"]:
-			return {"status": 200, "body": {"status": "ok", "plugin": "claude_mcp"}}
+			return {"status": 200, "body": {
+				"status": "ok",
+				"plugin": "claude_mcp",
+				"godot_version": Engine.get_version_info().string,
+				# Changes when GDExtensions add or remove classes, so cached ClassDB dumps
+				# can tell they are out of date
+				"classdb_fingerprint": _classdb_fingerprint(),
+				# Lets a server on the same machine index the project's files directly
+				"project_path": ProjectSettings.globalize_path("res://")
+			}}
 		
 		["GET", "/debug/filesystem"]:
 			var dir = DirAccess.open("res://")
@@ -126,6 +601,9 @@ func route_request(method: String, path: String, body: Dictionary) -> Dictionary
 		["GET", "/scene/current"]:
 			return godot_api.get_current_scene()
 		
+		["GET", "/scene/tree"]:
+			return godot_api.get_scene_tree(body)
+		
 		["GET", "/scene/list"]:
 			return godot_api.list_scenes()
 		
@@ -147,6 +625,9 @@ func route_request(method: String, path: String, body: Dictionary) -> Dictionary
 		["POST", "/node/properties/get"]:
 			return godot_api.get_node_properties(body)
 		
+		["POST", "/node/properties/get_many"]:
+			return godot_api.get_many_node_properties(body)
+		
 		["POST", "/node/properties/set"]:
 			return godot_api.set_node_properties(body)
 		
@@ -278,8 +759,14 @@ func route_request(method: String, path: String, body: Dictionary) -> Dictionary
 		["GET", "/node/list_classes"]:
 			return godot_api.list_node_classes(body)
 		
+		["GET", "/node/classdb_dump"]:
+			return godot_api.get_classdb_dump(body)
+		
+		["POST", "/batch"]:
+			return handle_batch(body)
+		
 		["GET", "/errors"]:
-			return get_error_log()
+			return get_error_log(body)
 		
 		["POST", "/errors/clear"]:
 			return clear_error_log()
@@ -287,56 +774,180 @@ func route_request(method: String, path: String, body: Dictionary) -> Dictionary
 		_:
 			return {"status": 404, "body": "Not Found"}
 
-func send_response(client: StreamPeerTCP, response: Dictionary):
+# Runs an ordered list of {endpoint, method, body} operations in the same frame
+func handle_batch(body: Dictionary) -> Dictionary:
+	var operations = body.get("operations", [])
+	var stop_on_error = body.get("stop_on_error", true)
+	
+	if not operations is Array or operations.is_empty():
+		return {
+			"status": 400,
+			"body": {
+				"success": false,
+				"error": "Operations array is required"
+			}
+		}
+	
+	var results = []
+	var failed_count = 0
+	var stopped_early = false
+	var deadline_exceeded = false
+	
+	for i in range(operations.size()):
+		if _deadline_exceeded():
+			deadline_exceeded = true
+			stopped_early = true
+			break
+		var operation = operations[i]
+		var result = _run_batch_operation(operation if operation is Dictionary else {})
+		result["index"] = i
+		results.append(result)
+		
+		if result.status >= 400:
+			failed_count += 1
+			if stop_on_error:
+				stopped_early = i < operations.size() - 1
+				break
+	
+	return {
+		"status": 200,
+		"body": {
+			"success": failed_count == 0 and not deadline_exceeded,
+			"results": results,
+			"completed": results.size(),
+			"failed": failed_count,
+			"total": operations.size(),
+			"stopped_early": stopped_early,
+			"deadline_exceeded": deadline_exceeded
+		}
+	}
+
+func _run_batch_operation(operation: Dictionary) -> Dictionary:
+	var endpoint = operation.get("endpoint", "")
+	var method = str(operation.get("method", "POST")).to_upper()
+	var op_body = operation.get("body", {})
+	
+	if endpoint.is_empty():
+		return {"endpoint": endpoint, "method": method, "status": 400, "body": {"success": false, "error": "Operation endpoint is required"}}
+	if endpoint == "/batch":
+		return {"endpoint": endpoint, "method": method, "status": 400, "body": {"success": false, "error": "Nested batches are not allowed"}}
+	if not op_body is Dictionary:
+		return {"endpoint": endpoint, "method": method, "status": 400, "body": {"success": false, "error": "Operation body must be an object"}}
+	
+	var response = route_request(method, endpoint, op_body)
+	var status = response.get("status", 200)
+	var response_body = response.get("body", {})
+	# Some handlers report failure in the body with a 200 status
+	if response_body is Dictionary and response_body.get("success", true) == false and status < 400:
+		status = 400
+	
+	return {
+		"endpoint": endpoint,
+		"method": method,
+		"status": status,
+		"body": response_body
+	}
+
+# Blocking write of a complete response, for peers without a connection entry
+func send_response(client: StreamPeerTCP, response: Dictionary, keep_alive: bool = false):
+	for segment in _encode_response(response, keep_alive, false):
+		client.put_data(segment)
+
+# Encodes a response into byte segments ready for the socket. The body is
+# serialised and UTF-8 encoded once; Content-Length counts bytes, not characters.
+# Large bodies are compressed with the negotiated encoding and framed with
+# chunked transfer encoding when allowed.
+func _encode_response(response: Dictionary, keep_alive: bool, allow_chunked: bool, encoding: String = "") -> Array:
 	var status_code = response.get("status", 200)
 	var body = response.get("body", {})
+	var body_bytes = JSON.stringify(body).to_utf8_buffer()
+	
+	var content_encoding = ""
+	if not encoding.is_empty() and body_bytes.size() > compression_threshold_bytes:
+		var mode = FileAccess.COMPRESSION_GZIP if encoding == "gzip" else FileAccess.COMPRESSION_DEFLATE
+		var compressed = body_bytes.compress(mode)
+		if not compressed.is_empty() and compressed.size() < body_bytes.size():
+			body_bytes = compressed
+			content_encoding = encoding
+	var chunked = allow_chunked and body_bytes.size() > stream_threshold_bytes
 	
-	var json_body = JSON.stringify(body)
 	var headers = "HTTP/1.1 %d OK\r\n" % status_code
-	headers += "Content-Type: application/json\r\n"
-	headers += "Content-Length: %d\r\n" % json_body.length()
+	headers += "Content-Type: application/json; charset=utf-8\r\n"
+	if not content_encoding.is_empty():
+		headers += "Content-Encoding: %s\r\n" % content_encoding
+	headers += "Vary: Accept-Encoding\r\n"
+	if chunked:
+		headers += "Transfer-Encoding: chunked\r\n"
+	else:
+		headers += "Content-Length: %d\r\n" % body_bytes.size()
+	if keep_alive:
+		headers += "Connection: keep-alive\r\n"
+		headers += "Keep-Alive: timeout=%d, max=%d\r\n" % [idle_timeout_msec / 1000, max_requests_per_connection]
+	else:
+		headers += "Connection: close\r\n"
 	headers += "Access-Control-Allow-Origin: *\r\n"
 	headers += "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
 	headers += "Access-Control-Allow-Headers: Content-Type\r\n"
 	headers += "\r\n"
 	
-	client.put_data((headers + json_body).to_utf8_buffer())
+	var segments = [headers.to_utf8_buffer()]
+	if not chunked:
+		segments.append(body_bytes)
+		return segments
+	
+	var offset = 0
+	while offset < body_bytes.size():
+		var piece = body_bytes.slice(offset, offset + write_chunk_bytes)
+		segments.append(("%x\r\n" % piece.size()).to_ascii_buffer())
+		segments.append(piece)
+		segments.append("\r\n".to_ascii_buffer())
+		offset += piece.size()
+	segments.append("0\r\n\r\n".to_ascii_buffer())
+	return segments
 
 func _setup_error_capture():
-	# Connect to Godot's internal error signals if available
-	# Since we can't directly capture all Godot errors, we'll use a print override approach
-	pass
+	# Logger subclasses exist from Godot 4.5; the script is loaded by path so older
+	# editors never parse it and fall back to the errors the plugin logs itself
+	if error_capture or not ClassDB.class_exists("Logger") or not OS.has_method("add_logger"):
+		return
+	var script_path = get_script().resource_path.get_base_dir()
+	var ErrorCaptureScript = load(script_path + "/error_capture.gd")
+	error_capture = ErrorCaptureScript.new(error_log)
+	OS.add_logger(error_capture)
 
 func log_error(error_type: String, message: String, source: String = ""):
-	var timestamp = Time.get_datetime_string_from_system()
-	var error_entry = {
-		"timestamp": timestamp,
-		"type": error_type,
-		"message": message,
-		"source": source
-	}
-	
-	error_log.append(error_entry)
-	
-	# Keep log size manageable
-	if error_log.size() > max_log_entries:
-		error_log.pop_front()
-	
-	print("Claude MCP Error Logged: [%s] %s: %s" % [timestamp, error_type, message])
+	error_log.add("error", message, source, error_type)
+	if not error_capture:
+		# With the engine logger installed this print would be captured a second time
+		print("Claude MCP Error Logged: [%s] %s: %s" % [Time.get_datetime_string_from_system(), error_type, message])
+
+# Params (query string): since (seq, default -1 = everything still in the log), severity
+# (comma-separated subset of error_log.SEVERITIES), source (substring of the error's
+# location) and limit. Identical errors are collapsed into one entry with a count.
+func _query_errors(params: Dictionary) -> Dictionary:
+	var severities = []
+	for severity in str(params.get("severity", "")).split(",", false):
+		severities.append(severity.strip_edges().to_lower())
+	var result = error_log.since(
+		str(params.get("since", "-1")).to_int(),
+		severities,
+		str(params.get("source", "")),
+		clamp(str(params.get("limit", "200")).to_int(), 1, 1000)
+	)
+	result["capture"] = "engine_logger" if error_capture else "plugin_only"
+	return result
 
-func get_error_log() -> Dictionary:
+func get_error_log(params: Dictionary = {}) -> Dictionary:
+	var result = _query_errors(params)
+	result["success"] = true
+	result["message"] = "Error log retrieved successfully"
 	return {
 		"status": 200,
-		"body": {
-			"errors": error_log,
-			"count": error_log.size(),
-			"message": "Error log retrieved successfully"
-		}
+		"body": result
 	}
 
 func clear_error_log() -> Dictionary:
-	var cleared_count = error_log.size()
-	error_log.clear()
+	var cleared_count = error_log.clear()
 	return {
 		"status": 200,
 		"body": {
@@ -9,12 +9,19 @@ func _enter_tree():
 	var HTTPServerScript = load(script_path + "/http_server.gd")
 	http_server = HTTPServerScript.new()
 	add_child(http_server)
+	# Editor-level changes for the /events feed; node and filesystem signals are wired by editor_events itself
+	scene_changed.connect(http_server.editor_events.on_scene_changed)
+	scene_saved.connect(http_server.editor_events.on_scene_saved)
+	resource_saved.connect(http_server.editor_events.on_resource_saved)
 	http_server.start_server()
 	print("Claude MCP Plugin: HTTP server started on port 8080")
 
 func _exit_tree():
 	print("Claude MCP Plugin: Stopping...")
 	if http_server:
+		scene_changed.disconnect(http_server.editor_events.on_scene_changed)
+		scene_saved.disconnect(http_server.editor_events.on_scene_saved)
+		resource_saved.disconnect(http_server.editor_events.on_resource_saved)
 		http_server.stop_server()
 		http_server.queue_free()
 	print("Claude MCP Plugin: Stopped")
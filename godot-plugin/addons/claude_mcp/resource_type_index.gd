@@ -0,0 +1,115 @@
+@tool
+extends RefCounted
+
+# Resource class of project files without instantiating them. EditorFileSystem already
+# knows the type of every file it has scanned; for files it hasn't (a scan in progress,
+# directories it skips) the type is read from the file header: the [gd_resource type="..."]
+# line of a text resource or the type string of a binary one, inflating the first block
+# of a compressed ("RSCC") one. Header reads are cached by path and modified time.
+
+const RESOURCE_EXTENSIONS = ["tres", "res"]
+const HEADER_READ_SIZE = 512
+# Longer type strings mean the file isn't a resource; never allocate what it claims
+const MAX_TYPE_LENGTH = 256
+# FileAccessCompressed writes 4 KiB blocks; anything far larger is not a real header
+const MAX_BLOCK_SIZE = 1 << 20
+
+var header_regex: RegEx = RegEx.create_from_string("^\\[gd_resource\\b[^\\]]*?\\btype=\"([^\"]+)\"")
+var header_types: Dictionary = {}  # path -> {"modified": int, "type": String}
+
+# file_type is base_type or one of its subclasses
+static func is_type(file_type: String, base_type: String) -> bool:
+	if file_type == base_type:
+		return true
+	return ClassDB.class_exists(file_type) and ClassDB.is_parent_class(file_type, base_type)
+
+func header_type(path: String) -> String:
+	var modified = FileAccess.get_modified_time(path)
+	var cached = header_types.get(path)
+	if cached != null and cached.modified == modified:
+		return cached.type
+	var file_type = _read_header_type(path)
+	header_types[path] = {"modified": modified, "type": file_type}
+	return file_type
+
+func _read_header_type(path: String) -> String:
+	var file = FileAccess.open(path, FileAccess.READ)
+	if not file:
+		return ""
+	var head = file.get_buffer(HEADER_READ_SIZE)
+	var magic = head.slice(0, 4).get_string_from_ascii()
+	if magic == "RSCC":
+		return _binary_header_type(_first_compressed_block(file, head))
+	if magic == "RSRC":
+		return _binary_header_type(head)
+	var found = header_regex.search(head.get_string_from_utf8().get_slice("\n", 0))
+	return found.get_string(1) if found else ""
+
+# Binary: "RSRC", big_endian, use_real64, version major/minor/format, then the type string
+func _binary_header_type(head: PackedByteArray) -> String:
+	if head.size() < 28 or head.slice(0, 4).get_string_from_ascii() != "RSRC":
+		return ""
+	var stream = StreamPeerBuffer.new()
+	stream.data_array = head
+	stream.seek(4)
+	stream.big_endian = stream.get_u32() != 0
+	stream.seek(24)
+	var length = stream.get_u32()
+	if length == 0 or length > MAX_TYPE_LENGTH or 28 + length > head.size():
+		return ""
+	return head.slice(28, 28 + length).get_string_from_utf8()
+
+# First block of a FileAccessCompressed file, decompressed. After "RSCC" come the mode,
+# block size, uncompressed size and one compressed size per block, then the blocks.
+func _first_compressed_block(file: FileAccess, head: PackedByteArray) -> PackedByteArray:
+	if head.size() < 20:
+		return PackedByteArray()
+	var mode = head.decode_u32(4)
+	var block_size = head.decode_u32(8)
+	var total = head.decode_u32(12)
+	var first_size = head.decode_u32(16)
+	if mode > FileAccess.COMPRESSION_GZIP or block_size == 0 or block_size > MAX_BLOCK_SIZE:
+		return PackedByteArray()
+	var offset = 16 + 4 * (total / block_size + 1)
+	if first_size == 0 or first_size > 2 * block_size or offset + first_size > file.get_length():
+		return PackedByteArray()
+	file.seek(offset)
+	return file.get_buffer(first_size).decompress(min(block_size, total), mode)
+
+# Paths of resources of base_type (or a subclass) under directory, by extension
+func find(base_type: String, directory: String = "res://", recursive: bool = true, extensions: Array = RESOURCE_EXTENSIONS) -> Array:
+	var found = []
+	var dir = EditorInterface.get_resource_filesystem().get_filesystem_path(directory)
+	if dir:
+		_find_in_filesystem(dir, base_type, recursive, extensions, found)
+	else:
+		_find_on_disk(directory, base_type, recursive, extensions, found)
+	found.sort()
+	return found
+
+func _find_in_filesystem(dir: EditorFileSystemDirectory, base_type: String, recursive: bool, extensions: Array, found: Array):
+	for i in range(dir.get_file_count()):
+		var path = dir.get_file_path(i)
+		if not extensions.is_empty() and not path.get_extension().to_lower() in extensions:
+			continue
+		var file_type = str(dir.get_file_type(i))
+		if file_type.is_empty():
+			file_type = header_type(path)
+		if is_type(file_type, base_type):
+			found.append(path)
+	if recursive:
+		for i in range(dir.get_subdir_count()):
+			_find_in_filesystem(dir.get_subdir(i), base_type, recursive, extensions, found)
+
+# Directories EditorFileSystem doesn't track (e.g. under a .gdignore) are read from disk
+func _find_on_disk(directory: String, base_type: String, recursive: bool, extensions: Array, found: Array):
+	var dir = DirAccess.open(directory)
+	if not dir:
+		return
+	for file_name in dir.get_files():
+		var path = directory.path_join(file_name)
+		if (extensions.is_empty() or file_name.get_extension().to_lower() in extensions) and is_type(header_type(path), base_type):
+			found.append(path)
+	if recursive:
+		for subdir in dir.get_directories():
+			_find_on_disk(directory.path_join(subdir), base_type, recursive, extensions, found)
@@ -0,0 +1,242 @@
+@tool
+extends RefCounted
+
+# Typed JSON encoding for Variants that JSON has no type for, shared with the MCP server
+# (mcp-server/src/variant_codec.py). Math types become {"__type": "Vector2", "v": [10, 20]},
+# component lists in constructor order; NodePath / StringName carry their string in "v";
+# resources are referenced by path: {"__type": "Resource", "class": "Texture2D", "path": "res://icon.svg"}.
+# bool, numbers, String, Array and string-keyed Dictionary stay plain JSON.
+
+# Number of components per tagged math type, in Godot constructor order
+const COMPONENT_COUNTS = {
+	TYPE_VECTOR2: 2, TYPE_VECTOR2I: 2, TYPE_VECTOR3: 3, TYPE_VECTOR3I: 3, TYPE_VECTOR4: 4, TYPE_VECTOR4I: 4,
+	TYPE_RECT2: 4, TYPE_RECT2I: 4, TYPE_COLOR: 4, TYPE_QUATERNION: 4, TYPE_PLANE: 4, TYPE_AABB: 6,
+	TYPE_TRANSFORM2D: 6, TYPE_BASIS: 9, TYPE_TRANSFORM3D: 12, TYPE_PROJECTION: 16
+}
+
+const TYPE_NAMES = {
+	TYPE_VECTOR2: "Vector2", TYPE_VECTOR2I: "Vector2i", TYPE_VECTOR3: "Vector3", TYPE_VECTOR3I: "Vector3i",
+	TYPE_VECTOR4: "Vector4", TYPE_VECTOR4I: "Vector4i", TYPE_RECT2: "Rect2", TYPE_RECT2I: "Rect2i",
+	TYPE_COLOR: "Color", TYPE_QUATERNION: "Quaternion", TYPE_PLANE: "Plane", TYPE_AABB: "AABB",
+	TYPE_TRANSFORM2D: "Transform2D", TYPE_BASIS: "Basis", TYPE_TRANSFORM3D: "Transform3D", TYPE_PROJECTION: "Projection",
+	TYPE_NODE_PATH: "NodePath", TYPE_STRING_NAME: "StringName",
+	TYPE_PACKED_BYTE_ARRAY: "PackedByteArray", TYPE_PACKED_INT32_ARRAY: "PackedInt32Array",
+	TYPE_PACKED_INT64_ARRAY: "PackedInt64Array", TYPE_PACKED_FLOAT32_ARRAY: "PackedFloat32Array",
+	TYPE_PACKED_FLOAT64_ARRAY: "PackedFloat64Array", TYPE_PACKED_STRING_ARRAY: "PackedStringArray",
+	TYPE_PACKED_VECTOR2_ARRAY: "PackedVector2Array", TYPE_PACKED_VECTOR3_ARRAY: "PackedVector3Array",
+	TYPE_PACKED_COLOR_ARRAY: "PackedColorArray"
+}
+
+# Element type of the packed arrays whose items are themselves tagged math types
+const PACKED_ELEMENT_TYPES = {
+	TYPE_PACKED_VECTOR2_ARRAY: TYPE_VECTOR2, TYPE_PACKED_VECTOR3_ARRAY: TYPE_VECTOR3, TYPE_PACKED_COLOR_ARRAY: TYPE_COLOR
+}
+
+static func encode(value):
+	var type = typeof(value)
+	if COMPONENT_COUNTS.has(type):
+		return {"__type": TYPE_NAMES[type], "v": components(value)}
+	match type:
+		TYPE_NODE_PATH, TYPE_STRING_NAME:
+			return {"__type": TYPE_NAMES[type], "v": str(value)}
+		TYPE_ARRAY:
+			var items = []
+			for item in value:
+				items.append(encode(item))
+			return items
+		TYPE_DICTIONARY:
+			return _encode_dictionary(value)
+		TYPE_OBJECT:
+			if value == null:
+				return null
+			if value is Resource:
+				return {"__type": "Resource", "class": value.get_class(), "path": value.resource_path}
+			return {"__type": "Object", "class": value.get_class()}
+		TYPE_RID, TYPE_CALLABLE, TYPE_SIGNAL:
+			# Not serialisable; reported as text so reads never fail, rejected on write
+			return {"__type": type_string(type), "v": str(value)}
+	if PACKED_ELEMENT_TYPES.has(type):
+		var items = []
+		for item in value:
+			items.append(components(item))
+		return {"__type": TYPE_NAMES[type], "v": items}
+	if TYPE_NAMES.has(type):
+		return {"__type": TYPE_NAMES[type], "v": Array(value)}
+	return value
+
+static func _encode_dictionary(value: Dictionary):
+	var plain = {}
+	for key in value:
+		if typeof(key) != TYPE_STRING:
+			var pairs = []
+			for k in value:
+				pairs.append([encode(k), encode(value[k])])
+			return {"__type": "Dictionary", "v": pairs}
+		plain[key] = encode(value[key])
+	return plain
+
+# Flat component list of a math type, in the order its constructor takes them
+static func components(value) -> Array:
+	match typeof(value):
+		TYPE_VECTOR2, TYPE_VECTOR2I:
+			return [value.x, value.y]
+		TYPE_VECTOR3, TYPE_VECTOR3I:
+			return [value.x, value.y, value.z]
+		TYPE_VECTOR4, TYPE_VECTOR4I, TYPE_QUATERNION:
+			return [value.x, value.y, value.z, value.w]
+		TYPE_COLOR:
+			return [value.r, value.g, value.b, value.a]
+		TYPE_RECT2, TYPE_RECT2I:
+			return [value.position.x, value.position.y, value.size.x, value.size.y]
+		TYPE_PLANE:
+			return [value.normal.x, value.normal.y, value.normal.z, value.d]
+		TYPE_AABB:
+			return components(value.position) + components(value.size)
+		TYPE_TRANSFORM2D:
+			return components(value.x) + components(value.y) + components(value.origin)
+		TYPE_BASIS:
+			return components(value.x) + components(value.y) + components(value.z)
+		TYPE_TRANSFORM3D:
+			return components(value.basis) + components(value.origin)
+		TYPE_PROJECTION:
+			return components(value.x) + components(value.y) + components(value.z) + components(value.w)
+	return []
+
+# Inverse of components(); null when the list has the wrong length or non-numeric items
+static func from_components(type: int, c: Array):
+	if c.size() != COMPONENT_COUNTS.get(type, -1):
+		return null
+	for item in c:
+		if typeof(item) != TYPE_INT and typeof(item) != TYPE_FLOAT:
+			return null
+	match type:
+		TYPE_VECTOR2: return Vector2(c[0], c[1])
+		TYPE_VECTOR2I: return Vector2i(c[0], c[1])
+		TYPE_VECTOR3: return Vector3(c[0], c[1], c[2])
+		TYPE_VECTOR3I: return Vector3i(c[0], c[1], c[2])
+		TYPE_VECTOR4: return Vector4(c[0], c[1], c[2], c[3])
+		TYPE_VECTOR4I: return Vector4i(c[0], c[1], c[2], c[3])
+		TYPE_QUATERNION: return Quaternion(c[0], c[1], c[2], c[3])
+		TYPE_COLOR: return Color(c[0], c[1], c[2], c[3])
+		TYPE_RECT2: return Rect2(c[0], c[1], c[2], c[3])
+		TYPE_RECT2I: return Rect2i(c[0], c[1], c[2], c[3])
+		TYPE_PLANE: return Plane(c[0], c[1], c[2], c[3])
+		TYPE_AABB: return AABB(Vector3(c[0], c[1], c[2]), Vector3(c[3], c[4], c[5]))
+		TYPE_TRANSFORM2D: return Transform2D(Vector2(c[0], c[1]), Vector2(c[2], c[3]), Vector2(c[4], c[5]))
+		TYPE_BASIS: return Basis(Vector3(c[0], c[1], c[2]), Vector3(c[3], c[4], c[5]), Vector3(c[6], c[7], c[8]))
+		TYPE_TRANSFORM3D:
+			return Transform3D(from_components(TYPE_BASIS, c.slice(0, 9)), Vector3(c[9], c[10], c[11]))
+		TYPE_PROJECTION:
+			return Projection(Vector4(c[0], c[1], c[2], c[3]), Vector4(c[4], c[5], c[6], c[7]),
+				Vector4(c[8], c[9], c[10], c[11]), Vector4(c[12], c[13], c[14], c[15]))
+	return null
+
+# Decode a JSON value for a property of type expected_type (TYPE_NIL when unknown).
+# Returns {"value": decoded} or {"error": message}. Besides tagged values, untagged input is
+# coerced when the property type is known: [10, 20] or "Vector2(10, 20)" for a Vector2,
+# "#ff8800" or "red" for a Color, "res://..." for a resource, whole floats for an int.
+static func decode(value, expected_type: int = TYPE_NIL) -> Dictionary:
+	match typeof(value):
+		TYPE_DICTIONARY:
+			if value.has("__type"):
+				return _decode_tagged(value)
+			var decoded = {}
+			for key in value:
+				var item = decode(value[key])
+				if item.has("error"):
+					return item
+				decoded[key] = item.value
+			return {"value": decoded}
+		TYPE_ARRAY:
+			if COMPONENT_COUNTS.has(expected_type):
+				return _checked(from_components(expected_type, value), expected_type, value)
+			if expected_type >= TYPE_PACKED_BYTE_ARRAY and TYPE_NAMES.has(expected_type):
+				return _decode_tagged({"__type": TYPE_NAMES[expected_type], "v": value})
+			var items = []
+			for element in value:
+				var item = decode(element)
+				if item.has("error"):
+					return item
+				items.append(item.value)
+			return {"value": items}
+		TYPE_FLOAT:
+			if expected_type == TYPE_INT and value == floor(value):
+				return {"value": int(value)}
+		TYPE_STRING:
+			return _decode_string(value, expected_type)
+	return {"value": value}
+
+static func _decode_string(value: String, expected_type: int) -> Dictionary:
+	match expected_type:
+		TYPE_NIL, TYPE_STRING:
+			return {"value": value}
+		TYPE_STRING_NAME:
+			return {"value": StringName(value)}
+		TYPE_NODE_PATH:
+			return {"value": NodePath(value)}
+		TYPE_OBJECT:
+			return _load_resource(value)
+		TYPE_COLOR:
+			if not value.contains("("):
+				var sentinel = Color(0, 0, 0, -1)
+				var color = Color.from_string(value, sentinel)
+				if color != sentinel:
+					return {"value": color}
+	# Godot literal syntax, e.g. "Vector2(10, 20)" or "Rect2(0, 0, 64, 64)"
+	return _checked(str_to_var(value), expected_type, value)
+
+static func _decode_tagged(tagged: Dictionary) -> Dictionary:
+	var type_name = str(tagged["__type"])
+	var v = tagged.get("v")
+	if type_name == "Resource":
+		return _load_resource(str(tagged.get("path", "")))
+	if type_name == "Dictionary":
+		if typeof(v) != TYPE_ARRAY:
+			return {"error": "Dictionary needs a list of [key, value] pairs"}
+		var decoded = {}
+		for pair in v:
+			if typeof(pair) != TYPE_ARRAY or pair.size() != 2:
+				return {"error": "Dictionary needs a list of [key, value] pairs"}
+			var key = decode(pair[0])
+			var item = decode(pair[1])
+			if key.has("error"):
+				return key
+			if item.has("error"):
+				return item
+			decoded[key.value] = item.value
+		return {"value": decoded}
+	var type = TYPE_NAMES.find_key(type_name)
+	if type == null:
+		return {"error": "Cannot decode values of type %s" % type_name}
+	if type == TYPE_NODE_PATH:
+		return {"value": NodePath(str(v))}
+	if type == TYPE_STRING_NAME:
+		return {"value": StringName(str(v))}
+	if typeof(v) != TYPE_ARRAY:
+		return {"error": "%s needs a list in \"v\"" % type_name}
+	if COMPONENT_COUNTS.has(type):
+		return _checked(from_components(type, v), type, tagged)
+	var element_type = PACKED_ELEMENT_TYPES.get(type, TYPE_NIL)
+	var items = []
+	for element in v:
+		if element_type == TYPE_NIL:
+			items.append(element)
+			continue
+		var item = from_components(element_type, element) if typeof(element) == TYPE_ARRAY else null
+		if item == null:
+			return {"error": "Invalid %s element: %s" % [type_name, JSON.stringify(element)]}
+		items.append(item)
+	return {"value": type_convert(items, type)}
+
+static func _load_resource(path: String) -> Dictionary:
+	if path.is_empty():
+		return {"value": null}
+	if not ResourceLoader.exists(path):
+		return {"error": "Resource not found: " + path}
+	return {"value": load(path)}
+
+static func _checked(decoded, expected_type: int, original) -> Dictionary:
+	if decoded == null or (expected_type != TYPE_NIL and typeof(decoded) != expected_type and not (typeof(decoded) in [TYPE_INT, TYPE_FLOAT] and expected_type in [TYPE_INT, TYPE_FLOAT])):
+		var type_name = TYPE_NAMES.get(expected_type, type_string(expected_type))
+		return {"error": "Cannot convert %s to %s" % [JSON.stringify(original), type_name]}
+	return {"value": decoded}
@@ -0,0 +1,441 @@
+import json
+import logging
+import os
+import re
+import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from itertools import chain
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# Snapshots are persisted per Godot version and ClassDB fingerprint (class count and
+# loaded GDExtensions, from /health), so projects with different extensions don't share one
+CLASSDB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "godot-mcp")
+
+# After a failed load (plugin down or too old for /node/classdb_dump), tools fall
+# back to plugin round trips for this long before trying again
+RETRY_AFTER = 60.0
+
+# A loaded snapshot is checked against /health again after this long, to notice an
+# editor restart on another version or extensions registering classes
+RECHECK_INTERVAL = 30.0
+
+# list_node_classes filter names that differ from the base class they select
+FILTER_BASES = {
+    "node": "Node",
+    "control": "Control",
+    "node2d": "Node2D",
+    "node3d": "Node3D",
+    "canvasitem": "CanvasItem"
+}
+
+def normalize_class_name(name: str) -> str:
+    """Case-fold and drop separators, so "rigid_body_2d" and "RigidBody2d" both become "rigidbody2d"
+    
+    Spelled-out dimensions ("2-D", "two d") are folded to the digit form as well.
+    """
+    key = re.sub(r"[^a-z0-9]", "", name.lower())
+    return re.sub(r"(two|three)d$", lambda m: "2d" if m.group(1) == "two" else "3d", key)
+
+def damerau_levenshtein(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Optimal string alignment distance (insert, delete, substitute, swap adjacent)
+    
+    With limit, only the diagonal band |i - j| <= limit is computed and limit + 1 is
+    returned as soon as the distance is known to exceed it.
+    """
+    if a == b:
+        return 0
+    if limit is None:
+        limit = max(len(a), len(b))
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    previous_previous = None
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[0]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            value = previous[j - 1] + (a[i - 1] != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1] and previous_previous[j - 2] + 1 < value:
+                value = previous_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        previous_previous, previous = previous, current
+    return min(previous[-1], over)
+
+def letter_mask(key: str) -> int:
+    """Bit set of the characters in key; one edit changes at most two of its bits,
+    so edit distance >= ceil(popcount(mask_a ^ mask_b) / 2)"""
+    mask = 0
+    for char in key:
+        mask |= 1 << ord(char)
+    return mask
+
+def trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class BKTree:
+    """Burkhard-Keller tree for bounded edit-distance lookups
+    
+    Distances are truncated at cap (min(d, cap) is still a metric), so each comparison
+    can stop early; searches are exact for any tolerance below cap.
+    """
+    
+    def __init__(self, keys, cap: int):
+        self.cap = cap
+        self.root = None
+        for key in keys:
+            self.add(key)
+    
+    def distance(self, a: str, a_mask: int, b: str, b_mask: int) -> int:
+        # Cheap lower bounds first: most pairs are already known to be at least cap apart
+        if abs(len(a) - len(b)) >= self.cap or ((a_mask ^ b_mask).bit_count() + 1) // 2 >= self.cap:
+            return self.cap
+        return damerau_levenshtein(a, b, self.cap - 1)
+    
+    def add(self, key: str):
+        mask = letter_mask(key)
+        if self.root is None:
+            self.root = (key, mask, {})
+            return
+        node = self.root
+        while True:
+            distance = self.distance(key, mask, node[0], node[1])
+            if distance == 0:
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (key, mask, {})
+                return
+            node = child
+    
+    def search(self, key: str, tolerance: int) -> List[tuple]:
+        """(distance, key) pairs within tolerance of key"""
+        mask = letter_mask(key)
+        matches = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node_key, node_mask, children = stack.pop()
+            distance = self.distance(key, mask, node_key, node_mask)
+            if distance <= tolerance:
+                matches.append((distance, node_key))
+            for edge, child in children.items():
+                if distance - tolerance <= edge <= distance + tolerance:
+                    stack.append(child)
+        return matches
+
+class ClassNameIndex:
+    """Ranked "did you mean" suggestions for class names
+    
+    Names are normalized (case, separators, digits) before indexing. Typos within a
+    small edit distance ("Lable" -> "Label") rank first, by distance; partial names
+    ("Sprite" -> "Sprite2D", "AnimatedSprite2D") follow, by trigram overlap.
+    
+    Edit-distance candidates come from the trigram postings: each edit destroys at
+    most four of a key's trigrams, so a key within the tolerance must share at least
+    len(key) + 1 - 4 * tolerance of them. For short keys that bound is useless, so
+    short names are also kept in a BK-tree.
+    """
+    
+    MAX_TOLERANCE = 2
+    SHORT_KEY_LENGTH = 4 * MAX_TOLERANCE
+    
+    def __init__(self, names):
+        self.by_key: Dict[str, List[str]] = {}
+        for name in names:
+            self.by_key.setdefault(normalize_class_name(name), []).append(name)
+        self.key_trigrams = {key: trigrams(key) for key in self.by_key}
+        self.key_masks = {key: letter_mask(key) for key in self.by_key}
+        self.postings: Dict[str, List[str]] = {}
+        for key, grams in self.key_trigrams.items():
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(key)
+        short_keys = [key for key in self.by_key if len(key) <= self.SHORT_KEY_LENGTH + self.MAX_TOLERANCE]
+        self.short_tree = BKTree(short_keys, cap=self.MAX_TOLERANCE + 1)
+        self.ranked_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+    
+    @classmethod
+    def tolerance(cls, key: str) -> int:
+        return 1 if len(key) <= 7 else cls.MAX_TOLERANCE
+    
+    def rank(self, key: str) -> List[str]:
+        """Normalized keys similar to key, best first"""
+        tolerance = self.tolerance(key)
+        query_grams = trigrams(key)
+        shared = Counter(chain.from_iterable(self.postings.get(gram, ()) for gram in query_grams))
+        
+        if len(key) <= self.SHORT_KEY_LENGTH:
+            close = {candidate: distance for distance, candidate in self.short_tree.search(key, tolerance)}
+        else:
+            min_shared = len(query_grams) - 4 * tolerance
+            mask = letter_mask(key)
+            close = {}
+            for candidate, count in shared.items():
+                if (count >= min_shared and abs(len(candidate) - len(key)) <= tolerance
+                        and ((mask ^ self.key_masks[candidate]).bit_count() + 1) // 2 <= tolerance):
+                    distance = damerau_levenshtein(key, candidate, tolerance)
+                    if distance <= tolerance:
+                        close[candidate] = distance
+        
+        scores: Dict[str, tuple] = {}
+        for candidate, count in shared.items():
+            similarity = 2 * count / (len(query_grams) + len(self.key_trigrams[candidate]))
+            if candidate in close:
+                scores[candidate] = (0, close[candidate], -similarity)
+            elif similarity >= 0.3 or key in candidate:
+                scores[candidate] = (1, 0, -similarity)
+        for candidate, distance in close.items():
+            scores.setdefault(candidate, (0, distance, 0.0))
+        
+        return sorted(scores, key=lambda candidate: (*scores[candidate], len(candidate), candidate))
+    
+    def suggest(self, name: str, limit: int = 10, accept=None) -> List[str]:
+        """Up to limit class names similar to name, best first; accept filters candidates"""
+        key = normalize_class_name(name)
+        if not key:
+            return []
+        ranked = self.ranked_cache.get(key)
+        if ranked is None:
+            ranked = self.rank(key)
+            self.ranked_cache[key] = ranked
+            if len(self.ranked_cache) > 256:
+                self.ranked_cache.popitem(last=False)
+        else:
+            self.ranked_cache.move_to_end(key)
+        
+        suggestions = []
+        for candidate in ranked:
+            for class_name in self.by_key[candidate]:
+                if accept is None or accept(class_name):
+                    suggestions.append(class_name)
+            if len(suggestions) >= limit:
+                break
+        return suggestions[:limit]
+
+class ClassDBSnapshot:
+    """In-memory copy of the editor's ClassDB, answering the same queries as the plugin
+    
+    Built from a /node/classdb_dump response. Ancestor sets are precomputed so
+    filtering by base class is a set lookup per class.
+    """
+    
+    def __init__(self, version: str, classes: List[Dict[str, Any]]):
+        self.version = version
+        self.classes: Dict[str, Dict[str, Any]] = {cls["name"]: cls for cls in classes}
+        self.children: Dict[str, List[str]] = {name: [] for name in self.classes}
+        for name, cls in self.classes.items():
+            parent = cls.get("parent", "")
+            if parent in self.children:
+                self.children[parent].append(name)
+        self.ancestors: Dict[str, set] = {name: self._collect_ancestors(name) for name in self.classes}
+        self.sorted_names = sorted(self.classes)
+        self.name_index: Optional[ClassNameIndex] = None
+    
+    def _collect_ancestors(self, name: str) -> set:
+        ancestors = {name}
+        parent = self.classes[name].get("parent", "")
+        while parent and parent in self.classes and parent not in ancestors:
+            ancestors.add(parent)
+            parent = self.classes[parent].get("parent", "")
+        return ancestors
+    
+    def has_class(self, name: str) -> bool:
+        return name in self.classes
+    
+    def is_subclass(self, name: str, base: str) -> bool:
+        """Matches ClassDB.is_parent_class: a class counts as its own subclass"""
+        return base in self.ancestors.get(name, ())
+    
+    def suggestions(self, name: str, limit: int = 10, nodes_only: bool = False) -> List[str]:
+        """Ranked class names similar to name; nodes_only keeps classes add_node can create"""
+        if self.name_index is None:
+            self.name_index = ClassNameIndex(self.classes)
+        accept = None
+        if nodes_only:
+            accept = lambda cls: self.classes[cls].get("can_instantiate", False) and self.classes[cls].get("is_node", False)
+        return self.name_index.suggest(name, limit, accept)
+    
+    def class_info(self, name: str) -> Dict[str, Any]:
+        """Same response shape as the plugin's /node/class_info"""
+        if not name:
+            return {"success": False, "error": "Class name is required"}
+        if name not in self.classes:
+            suggestions = self.suggestions(name)
+            error = f"Class '{name}' does not exist in Godot"
+            if suggestions:
+                error += ". Did you mean: " + ", ".join(suggestions[:5])
+            return {"success": False, "error": error, "suggestions": suggestions}
+        
+        cls = self.classes[name]
+        return {
+            "success": True,
+            "info": {
+                "class_name": name,
+                "exists": True,
+                "can_instantiate": cls.get("can_instantiate", False),
+                "is_node": cls.get("is_node", False),
+                "parent_class": cls.get("parent", ""),
+                "child_classes": list(self.children[name]),
+                "properties": list(cls.get("properties", [])),
+                "methods": list(cls.get("methods", []))
+            }
+        }
+    
+    def list_classes(self, filter_type: str = "all", search_term: str = "", prefix: str = "", offset: int = 0,
+                     limit: int = 0, cursor: str = "", fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Same response shape and paging rules as the plugin's /node/list_classes
+        
+        Results are sorted by name. A page starts at offset, or just after cursor (the
+        last name of the previous page); limit 0 returns everything from there. fields
+        projects each row, name is always included.
+        """
+        base = None
+        if filter_type != "all":
+            base = FILTER_BASES.get(filter_type, filter_type)
+        needle = search_term.lower()
+        prefix_lower = prefix.lower()
+        
+        matches = [name for name in self.sorted_names
+                   if (base is None or self.is_subclass(name, base))
+                   and (not needle or needle in name.lower())
+                   and (not prefix_lower or name.lower().startswith(prefix_lower))]
+        
+        start = bisect_right(matches, cursor) if cursor else max(0, offset)
+        page = matches[start:start + limit] if limit > 0 else matches[start:]
+        
+        classes = []
+        for name in page:
+            cls = self.classes[name]
+            row = {
+                "name": name,
+                "parent": cls.get("parent", ""),
+                "can_instantiate": cls.get("can_instantiate", False),
+                "is_node": cls.get("is_node", False)
+            }
+            if fields:
+                row = {key: value for key, value in row.items() if key == "name" or key in fields}
+            classes.append(row)
+        
+        has_more = start + len(page) < len(matches)
+        return {
+            "success": True,
+            "classes": classes,
+            "total_count": len(matches),
+            "offset": start,
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": page[-1] if has_more else "",
+            "filter": filter_type,
+            "search": search_term,
+            "prefix": prefix
+        }
+    
+    def validate_node_type(self, name: str) -> Optional[str]:
+        """Error message if the plugin would refuse to create a node of this type, else None"""
+        if name not in self.classes:
+            return f"Invalid node type: Class '{name}' does not exist in Godot"
+        cls = self.classes[name]
+        if not cls.get("can_instantiate", False):
+            return f"Invalid node type: Class '{name}' cannot be instantiated (likely abstract)"
+        if not cls.get("is_node", False):
+            return f"Invalid node type: Class '{name}' is not a Node-derived class"
+        return None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"godot_version": self.version, "classes": list(self.classes.values())}
+
+class ClassDBStore:
+    """Loads the ClassDB snapshot once: from disk when this Godot version was seen
+    before, otherwise from the plugin's /node/classdb_dump (then saved to disk)"""
+    
+    def __init__(self, cache_dir: str = CLASSDB_CACHE_DIR, recheck_interval: float = RECHECK_INTERVAL):
+        self.cache_dir = cache_dir
+        self.recheck_interval = recheck_interval
+        self.snapshot: Optional[ClassDBSnapshot] = None
+        self.key = ""  # "<version>" or "<version>-<fingerprint>" the snapshot belongs to
+        self.checked_at = 0.0
+        self.retry_at = 0.0
+    
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"classdb-{re.sub(r'[^A-Za-z0-9._-]', '_', key)}.json")
+    
+    def invalidate(self):
+        """Drop the snapshot, e.g. after the plugin created a class it doesn't know"""
+        self.snapshot = None
+        self.key = ""
+        self.retry_at = 0.0
+    
+    def load_from_disk(self, version: str, key: str) -> Optional[ClassDBSnapshot]:
+        try:
+            with open(self.path_for(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return ClassDBSnapshot(version, data["classes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def save_to_disk(self, snapshot: ClassDBSnapshot, key: str):
+        path = self.path_for(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(snapshot.to_dict(), f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            logger.warning(f"Could not persist ClassDB snapshot to {path}: {e}")
+    
+    async def get(self, godot_client) -> Optional[ClassDBSnapshot]:
+        """The snapshot, or None if it can't be loaded right now (callers fall back to the plugin)
+        
+        A loaded snapshot is revalidated against /health every recheck_interval seconds and
+        replaced when the Godot version or ClassDB fingerprint changed.
+        """
+        now = time.monotonic()
+        if self.snapshot is not None and now - self.checked_at < self.recheck_interval:
+            return self.snapshot
+        if self.snapshot is None and now < self.retry_at:
+            return None
+        
+        health = await godot_client.health_check()
+        version = health.get("godot_version") if isinstance(health, dict) else None
+        if not isinstance(version, str) or not version:
+            if self.snapshot is not None:
+                # Plugin briefly unreachable; keep what we have and look again later
+                self.checked_at = now
+                return self.snapshot
+            self.retry_at = now + RETRY_AFTER
+            return None
+        # Plugins older than classdb_fingerprint only key by version
+        fingerprint = health.get("classdb_fingerprint")
+        key = f"{version}-{fingerprint}" if fingerprint else version
+        self.checked_at = now
+        if self.snapshot is not None and key == self.key:
+            return self.snapshot
+        
+        snapshot = self.load_from_disk(version, key)
+        if snapshot is None:
+            dump = await godot_client.classdb_dump()
+            if not isinstance(dump, dict) or not dump.get("success") or not dump.get("classes"):
+                self.invalidate()
+                self.retry_at = now + RETRY_AFTER
+                return None
+            snapshot = ClassDBSnapshot(version, dump["classes"])
+            self.save_to_disk(snapshot, key)
+        
+        self.snapshot = snapshot
+        self.key = key
+        logger.info(f"Loaded ClassDB snapshot for Godot {version} ({len(snapshot.classes)} classes)")
+        return snapshot
@@ -1,21 +1,529 @@
 import httpx
 import asyncio
+import copy
+import logging
+import random
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 import json
 
+logger = logging.getLogger(__name__)
+
+# Keep-alive pool settings. The expiry is kept below the plugin's idle timeout
+# (30s) so the client never reuses a socket the plugin is about to close.
+MAX_CONNECTIONS = 8
+MAX_KEEPALIVE_CONNECTIONS = 4
+KEEPALIVE_EXPIRY = 20.0
+
+# Encodings the plugin can produce with PackedByteArray.compress(); httpx
+# decodes both transparently.
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Connection supervision: consecutive connection failures before the circuit opens,
+# how long it stays open before a trial request, and how often the plugin is probed
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 5.0
+PROBE_INTERVAL = 5.0
+PROBE_TIMEOUT = 1.0
+
+# Errors that mean the plugin can't be reached. A read timeout only means the editor is
+# slow (a big save or import); whether it is hung is left to the /health probe, which
+# the plugin answers on its I/O thread.
+CONNECTION_ERRORS = (httpx.NetworkError, httpx.ConnectTimeout)
+
+# Idempotent GETs are retried on transport errors with exponential backoff and jitter
+MAX_GET_RETRIES = 2
+RETRY_BASE_DELAY = 0.1
+
+# A read joins an identical in-flight one only if that call's deadline is at most this
+# much earlier than its own; otherwise a long-poll could inherit a short read's timeout
+COALESCE_DEADLINE_SLACK = 0.5
+
+# Timeout (seconds) per endpoint category. The same budget is sent to the plugin as
+# an absolute X-Deadline (Unix ms) so it can drop requests the caller has given up on.
+TIMEOUT_PROFILES = {
+    "read": 10.0,
+    "mutate": 30.0,
+    "filesystem": 120.0,
+    "export": 600.0
+}
+
+# Endpoints whose category differs from the method default (GET: read, POST: mutate)
+ENDPOINT_PROFILES = {
+    "/node/properties/get": "read",
+    "/node/properties/get_many": "read",
+    "/node/class_info": "read",
+    "/script/read": "read",
+    "/theme/properties/get": "read",
+    "/scene/list": "filesystem",
+    "/script/list": "filesystem",
+    "/asset/list": "filesystem",
+    "/asset/import": "filesystem",
+    "/asset/organize": "filesystem",
+    "/theme/list": "filesystem",
+    "/theme/import": "filesystem",
+    "/node/classdb_dump": "filesystem",
+    "/project/export": "export"
+}
+
+# Read-through response cache: entries expire after their endpoint's TTL and the
+# least recently used entries are dropped once CACHE_MAX_BYTES of JSON is held
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Cacheable read endpoints -> (family, ttl seconds). ClassDB never changes while
+# the editor runs; project contents can change outside our own mutations.
+CACHEABLE_ENDPOINTS = {
+    "/node/class_info": ("classdb", 3600.0),
+    "/node/list_classes": ("classdb", 3600.0),
+    "/scene/list": ("scenes", 30.0),
+    "/theme/list": ("themes", 30.0),
+    "/theme/properties/get": ("themes", 30.0),
+    "/project/settings": ("settings", 30.0)
+}
+
+# Mutating endpoint prefix -> cache families it can make stale
+INVALIDATIONS = {
+    "/scene/": ("scenes",),
+    "/theme/": ("themes",),
+    "/project/settings": ("settings",),
+    "/asset/": ("scenes", "themes")
+}
+
+# Editor change feed (GET /events long-poll): how long the plugin may hold a poll,
+# and the backoff between failed polls (plugin down or too old to have /events)
+EVENT_POLL_TIMEOUT = 20.0
+EVENT_RETRY_DELAY = 1.0
+EVENT_MAX_RETRY_DELAY = 30.0
+
+# Editor change event type -> cache families it can make stale
+EVENT_INVALIDATIONS = {
+    "scene_saved": ("scenes",),
+    "resource_saved": ("scenes", "themes"),
+    "filesystem_changed": ("scenes", "themes"),
+    "resources_reimported": ("themes",),
+    # Theme edits made in the inspector are undoable actions too, and change what
+    # /theme/properties/get reads from the loaded Theme before anything is saved.
+    # Node edits can't touch project settings, so "settings" is left alone.
+    "scene_edited": ("themes",)
+}
+
+# Events that change the edited scene's structure; they count as changes for mirrors
+TREE_EVENTS = {"node_added", "node_removed", "node_renamed", "tree_changed", "scene_changed", "scene_edited"}
+
+class ResponseCache:
+    """LRU + TTL cache of plugin read responses, bounded by serialized size
+    
+    Entries belong to a family so mutations can evict everything they affect.
+    Each family has a generation counter: a read that started before an eviction
+    is not stored, so a slow in-flight read can't reinsert stale data. Values are
+    kept as JSON and decoded on every hit, so callers can't alter a cached entry.
+    """
+    
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.total_bytes = 0
+        self.generations: Dict[str, int] = {}
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+    
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        value, family, expires_at, size = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return json.loads(value)
+    
+    def generation(self, family: str) -> int:
+        return self.generations.get(family, 0)
+    
+    def put(self, key: tuple, value: Dict[str, Any], family: str, ttl: float, generation: int):
+        if generation != self.generation(family):
+            return
+        serialized = json.dumps(value, default=str)
+        size = len(serialized)
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (serialized, family, time.monotonic() + ttl, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+            self.stats["evictions"] += 1
+    
+    def invalidate(self, families) -> int:
+        """Drop every entry in the given families; returns how many were removed"""
+        families = set(families)
+        for family in families:
+            self.generations[family] = self.generation(family) + 1
+        stale = [key for key, entry in self.entries.items() if entry[1] in families]
+        for key in stale:
+            self._remove(key)
+        self.stats["invalidations"] += len(stale)
+        return len(stale)
+    
+    def clear(self):
+        self.invalidate({entry[1] for entry in self.entries.values()})
+    
+    def _remove(self, key: tuple):
+        entry = self.entries.pop(key)
+        self.total_bytes -= entry[3]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes
+        }
+
+class CircuitBreaker:
+    """Tracks plugin reachability so calls fail fast while the editor is down
+    
+    closed: requests flow normally. open: requests are rejected without touching
+    the network until reset_timeout has passed. half_open: one trial request is
+    let through while the rest are rejected; its outcome closes or re-opens the
+    circuit, and an inconclusive one (a timeout) hands the trial to the next request.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.last_error = ""
+        self.trial_in_flight = False
+    
+    def allow_request(self) -> bool:
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+            return True
+        return self.state != self.OPEN
+    
+    def release_trial(self):
+        """The trial request ended without telling whether the plugin is reachable"""
+        self.trial_in_flight = False
+    
+    def record_success(self):
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.last_error = ""
+        self.trial_in_flight = False
+    
+    def record_failure(self, error: str):
+        self.consecutive_failures += 1
+        self.last_error = error
+        self.trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Godot plugin unreachable, opening circuit: {error}")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+    
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a trial request through"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
 class GodotClient:
-    def __init__(self, base_url: str = "http://127.0.0.1:8080"):
+    def __init__(self, base_url: str = "http://127.0.0.1:8080", keep_alive: bool = True, compression: bool = True, timeouts: Optional[Dict[str, float]] = None, cache: bool = True):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.keep_alive = keep_alive
+        self.compression = compression
+        self.cache = ResponseCache() if cache else None
+        unknown = set(timeouts or {}) - set(TIMEOUT_PROFILES)
+        if unknown:
+            raise ValueError(f"Unknown timeout categories: {', '.join(sorted(unknown))}")
+        self.timeouts = {**TIMEOUT_PROFILES, **(timeouts or {})}
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS if keep_alive else 0,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        )
+        headers = {"Accept-Encoding": ACCEPT_ENCODING if compression else "identity"}
+        if not keep_alive:
+            headers["Connection"] = "close"
+        self.client = httpx.AsyncClient(timeout=self.timeouts["mutate"], limits=limits, headers=headers)
+        self.breaker = CircuitBreaker()
+        # Singleflight: identical concurrent reads share one in-flight network call.
+        # Values are (task, deadline) so a caller doesn't join a call that gives up sooner
+        self.inflight: Dict[tuple, tuple] = {}
+        self.coalescing = {"reads": 0, "network_calls": 0, "deduplicated": 0}
+        # Bumped after every mutating request and structural editor event, so local
+        # mirrors can tell they are stale
+        self.mutations = 0
+        # Editor change feed state; event_seq is -1 until the first poll syncs it
+        self.event_seq = -1
+        self.events_live = False
+        self.event_listeners: list = []
+        self.event_stats = {"polls": 0, "events": 0, "resets": 0}
+        self.event_task: Optional[asyncio.Task] = None
+        self.supervisor_task: Optional[asyncio.Task] = None
+        self.last_probe: Optional[float] = None
     
-    async def health_check(self) -> Dict[str, Any]:
-        """Check if Godot plugin is running and accessible"""
+    def is_available(self) -> bool:
+        """Cached plugin reachability; does not touch the network"""
+        return self.breaker.state != CircuitBreaker.OPEN
+    
+    def connection_state(self) -> Dict[str, Any]:
+        """Snapshot of the supervisor's view of the plugin connection"""
+        return {
+            "connected": self.is_available(),
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "last_error": self.breaker.last_error,
+            "retry_in": round(self.breaker.retry_in(), 2),
+            "last_probe": self.last_probe
+        }
+    
+    def start_supervisor(self, interval: float = PROBE_INTERVAL):
+        """Start probing /health in the background to keep the circuit state current"""
+        if self.supervisor_task is None or self.supervisor_task.done():
+            self.supervisor_task = asyncio.create_task(self._supervise(interval))
+    
+    async def _supervise(self, interval: float):
+        while True:
+            await self._probe()
+            await asyncio.sleep(interval)
+    
+    async def _probe(self):
+        """Cheap reachability check that bypasses the circuit, so it can close it"""
+        self.last_probe = time.time()
         try:
-            response = await self.client.get(f"{self.base_url}/health")
+            response = await self.client.get(f"{self.base_url}/health", timeout=PROBE_TIMEOUT)
             response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "connected": False}
+            if self.breaker.state != CircuitBreaker.CLOSED:
+                logger.info("Godot plugin reachable again, closing circuit")
+            self.breaker.record_success()
+        except httpx.HTTPError as e:
+            self.breaker.record_failure(str(e) or type(e).__name__)
+    
+    def timeout_for(self, method: str, path: str) -> float:
+        """Timeout in seconds for an endpoint, from its category's profile"""
+        category = ENDPOINT_PROFILES.get(path, "read" if method == "GET" else "mutate")
+        return self.timeouts[category]
+    
+    def _circuit_open_error(self) -> str:
+        retry = (f"retrying in {self.breaker.retry_in():.1f}s" if self.breaker.state == CircuitBreaker.OPEN
+                 else "a trial request is checking whether it is back")
+        return (f"Godot plugin unreachable ({self.breaker.consecutive_failures} consecutive failures, "
+                f"last error: {self.breaker.last_error}). Ensure the Godot editor is running with the "
+                f"plugin enabled; {retry}.")
+    
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Counters for read requests served by an already in-flight identical call"""
+        return {**self.coalescing, "in_flight": len(self.inflight)}
+    
+    def mutation_count(self) -> int:
+        """Number of changes seen so far: mutating requests sent plus structural editor events"""
+        return self.mutations
+    
+    def events_connected(self) -> bool:
+        """Whether the editor change feed is live, i.e. hand edits are reported as they happen"""
+        return self.events_live
+    
+    def add_event_listener(self, callback):
+        """Call callback(event) for every editor change event; a {"type": "reset"} event means
+        some were missed and all derived state should be dropped"""
+        self.event_listeners.append(callback)
+    
+    def start_event_listener(self):
+        """Start long-polling /events in the background, applying each event as it arrives"""
+        if self.event_task is None or self.event_task.done():
+            self.event_task = asyncio.create_task(self._listen_events())
+    
+    async def _listen_events(self):
+        delay = EVENT_RETRY_DELAY
+        while True:
+            result = await self.get_events(self.event_seq, EVENT_POLL_TIMEOUT)
+            if not result.get("success"):
+                self.events_live = False
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, EVENT_MAX_RETRY_DELAY)
+                continue
+            delay = EVENT_RETRY_DELAY
+            self.events_live = True
+            self.apply_events(result)
+    
+    def apply_events(self, result: Dict[str, Any]):
+        """Invalidate cached state for one /events response and pass its events to listeners"""
+        self.event_stats["polls"] += 1
+        if result.get("reset"):
+            # First sync, plugin restart or ring overflow: whatever happened is unknown
+            self.event_stats["resets"] += 1
+            self.mutations += 1
+            if self.cache is not None:
+                self.cache.invalidate({family for family, _ in CACHEABLE_ENDPOINTS.values()})
+            self._notify({"type": "reset"})
+        for event in result.get("events", []):
+            self.event_stats["events"] += 1
+            families = EVENT_INVALIDATIONS.get(event.get("type"), ())
+            if families and self.cache is not None:
+                self.cache.invalidate(families)
+            if event.get("type") in TREE_EVENTS:
+                self.mutations += 1
+            self._notify(event)
+        self.event_seq = result.get("last_seq", self.event_seq)
+    
+    def _notify(self, event: Dict[str, Any]):
+        for listener in self.event_listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Editor event listener failed on {event.get('type')}: {e}")
+    
+    def event_feed_state(self) -> Dict[str, Any]:
+        """Change feed status and counters"""
+        return {"live": self.events_live, "last_seq": self.event_seq, **self.event_stats}
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and size of the response cache"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.snapshot()}
+    
+    def invalidate_cache(self, path: str, body: Optional[Dict[str, Any]] = None):
+        """Evict the cache families a mutation of path can make stale"""
+        if self.cache is None:
+            return
+        if path == "/batch":
+            for operation in (body or {}).get("operations", []):
+                if isinstance(operation, dict):
+                    self.invalidate_cache(str(operation.get("endpoint", "")))
+            return
+        for prefix, families in INVALIDATIONS.items():
+            if path.startswith(prefix):
+                self.cache.invalidate(families)
+    
+    def is_read(self, method: str, path: str) -> bool:
+        return method == "GET" or ENDPOINT_PROFILES.get(path) == "read"
+    
+    async def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None, fallback: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send a request to the plugin over the pooled connection and return its JSON body
+        
+        GET bodies are sent as query parameters, POST bodies as JSON. Failures never
+        raise: they return {"error": ...} merged with fallback (default {"success": False}).
+        While the circuit is open, calls fail immediately without touching the network.
+        timeout overrides the endpoint's profile; retries share the same deadline.
+        
+        Reads are coalesced: a call identical to one still in flight (same method, path,
+        body and fallback) waits for that call's result instead of sending its own,
+        unless that call's deadline is earlier than this one's.
+        """
+        fallback = fallback if fallback is not None else {"success": False}
+        if not self.is_read(method, path):
+            try:
+                return await self._send(method, path, body, fallback, timeout)
+            finally:
+                # Evict even on failure: the mutation may have partially applied
+                self.mutations += 1
+                self.invalidate_cache(path, body)
+        
+        key = (method, path, json.dumps(body, sort_keys=True, default=str), json.dumps(fallback, sort_keys=True, default=str))
+        cacheable = self.cache is not None and path in CACHEABLE_ENDPOINTS
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        self.coalescing["reads"] += 1
+        deadline = time.monotonic() + (timeout if timeout is not None else self.timeout_for(method, path))
+        task, task_deadline = self.inflight.get(key, (None, 0.0))
+        if task is None or task_deadline < deadline - COALESCE_DEADLINE_SLACK:
+            self.coalescing["network_calls"] += 1
+            task = asyncio.ensure_future(self._read(key, method, path, body, fallback, timeout, cacheable))
+            self.inflight[key] = (task, deadline)
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        else:
+            self.coalescing["deduplicated"] += 1
+        # Shielded so one waiter being cancelled doesn't cancel the shared call
+        result = await asyncio.shield(task)
+        # Every waiter gets its own copy, nested lists and dicts included
+        return copy.deepcopy(result)
+    
+    def _forget_inflight(self, key: tuple, task: asyncio.Task):
+        # A longer-deadline call may have taken the slot over; leave that one in place
+        if self.inflight.get(key, (None,))[0] is task:
+            del self.inflight[key]
+    
+    async def _read(self, key: tuple, method: str, path: str, body: Optional[Dict[str, Any]], fallback: Dict[str, Any], timeout: Optional[float], cacheable: bool) -> Dict[str, Any]:
+        if not cacheable:
+            return await self._send(method, path, body, fallback, timeout)
+        family, ttl = CACHEABLE_ENDPOINTS[path]
+        generation = self.cache.generation(family)
+        result = await self._send(method, path, body, fallback, timeout)
+        if isinstance(result, dict) and "error" not in result and result.get("success", True) is not False:
+            self.cache.put(key, result, family, ttl, generation)
+        return result
+    
+    async def _send(self, method: str, path: str, body: Optional[Dict[str, Any]], fallback: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        if not self.breaker.allow_request():
+            return {"error": self._circuit_open_error(), **fallback}
+        trial = self.breaker.state == CircuitBreaker.HALF_OPEN
+        try:
+            return await self._send_allowed(method, path, body, fallback, timeout)
+        finally:
+            # A trial that got neither a response nor a connection error (a timeout, or
+            # cancellation) leaves the circuit half-open for the next request to try
+            if trial and self.breaker.state == CircuitBreaker.HALF_OPEN:
+                self.breaker.release_trial()
+    
+    async def _send_allowed(self, method: str, path: str, body: Optional[Dict[str, Any]], fallback: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        url = f"{self.base_url}{path}"
+        deadline = time.time() + (timeout if timeout is not None else self.timeout_for(method, path))
+        attempts = 1 + (MAX_GET_RETRIES if method == "GET" else 0)
+        for attempt in range(attempts):
+            remaining = deadline - time.time()
+            options = {"timeout": max(remaining, 0.001), "headers": {"X-Deadline": str(int(deadline * 1000))}}
+            try:
+                if method == "GET":
+                    response = await self.client.get(url, params=body, **options)
+                else:
+                    response = await self.client.post(url, json=body, **options)
+            except CONNECTION_ERRORS as e:
+                # Connection-level failure: the plugin may be down
+                delay = RETRY_BASE_DELAY * (2 ** attempt)
+                if attempt + 1 < attempts and self.breaker.state == CircuitBreaker.CLOSED and time.time() + 2 * delay < deadline:
+                    await asyncio.sleep(delay + random.uniform(0, delay))
+                    continue
+                # One failure per request, however many attempts it took
+                self.breaker.record_failure(str(e) or type(e).__name__)
+                return {"error": str(e), **fallback}
+            except Exception as e:
+                return {"error": str(e), **fallback}
+            
+            # Any HTTP response means the plugin is reachable
+            self.breaker.record_success()
+            try:
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                return {"error": str(e), **fallback}
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check if Godot plugin is running and accessible"""
+        return await self.request("GET", "/health", fallback={"connected": False})
     
     async def create_scene(self, name: str, path: Optional[str] = None, root_node_type: Optional[str] = None, create_directories: Optional[bool] = None) -> Dict[str, Any]:
         """Create a new scene in Godot"""
@@ -27,32 +535,51 @@ class GodotClient:
         if create_directories is not None:
             data["create_directories"] = create_directories
         
-        try:
-            response = await self.client.post(f"{self.base_url}/scene/create", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/scene/create", data)
     
     async def open_scene(self, path: str) -> Dict[str, Any]:
         """Open an existing scene in Godot"""
         data = {"path": path}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/scene/open", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/scene/open", data)
     
     async def get_current_scene(self) -> Dict[str, Any]:
         """Get information about the currently open scene"""
-        try:
-            response = await self.client.get(f"{self.base_url}/scene/current")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "scene": None}
+        return await self.request("GET", "/scene/current", fallback={"scene": None})
+    
+    async def get_events(self, since: int = -1, timeout: float = 0.0) -> Dict[str, Any]:
+        """Editor change events after sequence number since, waiting up to timeout seconds for one"""
+        data = {"since": since}
+        if timeout:
+            data["timeout"] = timeout
+        
+        # The plugin holds the poll for up to timeout, so allow that on top of the read budget
+        return await self.request("GET", "/events", data, fallback={"success": False, "events": []},
+                                  timeout=timeout + self.timeouts["read"])
+    
+    async def get_scene_tree(self, root_path: str = ".", depth: int = -1, offset: int = 0, limit: int = 0, properties: Optional[list] = None, after: str = "", count: bool = False) -> Dict[str, Any]:
+        """One page of the edited scene's hierarchy (paths, types, owners, groups), in pre-order
+        
+        after is the previous page's next_after cursor, which the plugin resumes from without
+        walking the nodes before it. total_count is only reported with count.
+        """
+        data = {}
+        if root_path and root_path != ".":
+            data["root_path"] = root_path
+        if depth >= 0:
+            data["depth"] = depth
+        if after:
+            data["after"] = after
+        elif offset:
+            data["offset"] = offset
+        if count:
+            data["count"] = True
+        if limit:
+            data["limit"] = limit
+        if properties:
+            data["properties"] = ",".join(properties)
+        
+        return await self.request("GET", "/scene/tree", data, fallback={"success": False, "nodes": []})
     
     async def add_node(self, node_type: str, name: str, parent_path: str = "") -> Dict[str, Any]:
         """Add a new node to the current scene"""
@@ -62,12 +589,7 @@ class GodotClient:
             "parent_path": parent_path
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/node/add", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/node/add", data)
     
     async def create_script(self, path: str, content: Optional[str] = None, attach_to_node: str = "") -> Dict[str, Any]:
         """Create a new GDScript file"""
@@ -77,21 +599,11 @@ class GodotClient:
         if attach_to_node:
             data["attach_to_node"] = attach_to_node
         
-        try:
-            response = await self.client.post(f"{self.base_url}/script/create", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/script/create", data)
     
     async def list_scenes(self) -> Dict[str, Any]:
         """List all scenes in the Godot project"""
-        try:
-            response = await self.client.get(f"{self.base_url}/scene/list")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "scenes": []}
+        return await self.request("GET", "/scene/list", fallback={"scenes": []})
     
     async def duplicate_scene(self, source_path: str, target_path: Optional[str] = None, new_name: Optional[str] = None) -> Dict[str, Any]:
         """Duplicate an existing scene"""
@@ -101,34 +613,19 @@ class GodotClient:
         if new_name:
             data["new_name"] = new_name
         
-        try:
-            response = await self.client.post(f"{self.base_url}/scene/duplicate", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/scene/duplicate", data)
     
     async def delete_scene(self, path: str, confirm: bool = False) -> Dict[str, Any]:
         """Delete a scene file"""
         data = {"path": path, "confirm": confirm}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/scene/delete", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/scene/delete", data)
     
     async def delete_node(self, node_path: str, confirm: bool = False) -> Dict[str, Any]:
         """Delete a node from the current scene"""
         data = {"node_path": node_path, "confirm": confirm}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/node/delete", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/node/delete", data)
     
     async def move_node(self, node_path: str, new_parent_path: str = "", new_index: int = -1) -> Dict[str, Any]:
         """Move a node to a new parent or position"""
@@ -138,94 +635,87 @@ class GodotClient:
         if new_index >= 0:
             data["new_index"] = new_index
         
-        try:
-            response = await self.client.post(f"{self.base_url}/node/move", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/node/move", data)
     
-    async def get_node_properties(self, node_path: str) -> Dict[str, Any]:
-        """Get properties of a node"""
+    async def get_node_properties(self, node_path: str, names: Optional[list] = None, non_default_only: bool = False) -> Dict[str, Any]:
+        """Get properties of a node, optionally only the named ones and/or only those changed from their defaults"""
         data = {"node_path": node_path}
+        if names:
+            data["names"] = names
+        if non_default_only:
+            data["non_default_only"] = True
         
-        try:
-            response = await self.client.post(f"{self.base_url}/node/properties/get", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/node/properties/get", data)
+    
+    async def get_many_node_properties(self, node_paths: Optional[list] = None, root_path: str = "", depth: int = -1, names: Optional[list] = None, non_default_only: bool = False) -> Dict[str, Any]:
+        """Get properties of several nodes in one request: the listed paths, or root_path's subtree down to depth (-1 = unlimited)"""
+        data = {}
+        if node_paths:
+            data["node_paths"] = node_paths
+        else:
+            data["root_path"] = root_path
+            if depth >= 0:
+                data["depth"] = depth
+        if names:
+            data["names"] = names
+        if non_default_only:
+            data["non_default_only"] = True
+        
+        return await self.request("POST", "/node/properties/get_many", data, fallback={"success": False, "nodes": []})
     
     async def set_node_properties(self, node_path: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Set properties of a node"""
         data = {"node_path": node_path, "properties": properties}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/node/properties/set", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/node/properties/set", data)
     
     async def list_scripts(self) -> Dict[str, Any]:
         """List all script files in the Godot project"""
-        try:
-            response = await self.client.get(f"{self.base_url}/script/list")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "scripts": []}
+        return await self.request("GET", "/script/list", fallback={"scripts": []})
     
     async def read_script(self, path: str) -> Dict[str, Any]:
         """Read the content of a script file"""
         data = {"path": path}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/script/read", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/script/read", data)
     
     async def modify_script(self, path: str, content: str) -> Dict[str, Any]:
         """Modify the content of a script file"""
         data = {"path": path, "content": content}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/script/modify", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/script/modify", data)
     
     async def delete_script(self, path: str, confirm: bool = False) -> Dict[str, Any]:
         """Delete a script file"""
         data = {"path": path, "confirm": confirm}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/script/delete", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/script/delete", data)
 
-    async def get_errors(self) -> Dict[str, Any]:
-        """Get error log from Godot plugin"""
-        try:
-            response = await self.client.get(f"{self.base_url}/errors")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "errors": []}
+    async def get_errors(self, since: int = -1, timeout: float = 0.0, severity: Optional[list] = None, source: str = "", limit: int = 0) -> Dict[str, Any]:
+        """Get error log entries after sequence number since from Godot plugin
+        
+        severity restricts to a subset of error, warning, script_error and shader_error;
+        source to errors whose location contains the string. With timeout the plugin
+        waits up to that many seconds for a matching error before answering.
+        """
+        data = {}
+        if since >= 0:
+            data["since"] = since
+        if timeout:
+            data["timeout"] = timeout
+        if severity:
+            data["severity"] = ",".join(severity)
+        if source:
+            data["source"] = source
+        if limit:
+            data["limit"] = limit
+        
+        return await self.request("GET", "/errors", data or None, fallback={"errors": []},
+                                  timeout=timeout + self.timeouts["read"] if timeout else None)
     
     async def clear_errors(self) -> Dict[str, Any]:
         """Clear error log from Godot plugin"""
-        try:
-            response = await self.client.post(f"{self.base_url}/errors/clear")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/errors/clear")
 
     # Asset management methods
     async def import_asset(self, source_path: str, target_path: Optional[str] = None, asset_type: str = "other") -> Dict[str, Any]:
@@ -234,36 +724,40 @@ class GodotClient:
         if target_path:
             data["target_path"] = target_path
         
-        try:
-            response = await self.client.post(f"{self.base_url}/asset/import", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/asset/import", data)
     
-    async def list_resources(self, directory: str = "res://", file_types: Optional[list] = None, recursive: bool = True) -> Dict[str, Any]:
-        """List project resources with optional filtering"""
+    async def list_resources(self, directory: str = "res://", file_types: Optional[list] = None, recursive: bool = True,
+                             offset: int = 0, limit: int = 0, sort: str = "", descending: bool = False, glob: Optional[list] = None,
+                             resource_type: str = "") -> Dict[str, Any]:
+        """One page of project resources with optional filtering
+        
+        glob patterns containing "/" match the whole res:// path, others the file name.
+        sort is one of path, name, modified, type or extension. resource_type keeps
+        resources of that class or a subclass, determined without loading them.
+        """
         params = {"directory": directory, "recursive": recursive}
         if file_types:
             params["file_types"] = ",".join(file_types)  # Convert list to comma-separated string
+        if glob:
+            params["glob"] = ",".join(glob)
+        if offset:
+            params["offset"] = offset
+        if limit:
+            params["limit"] = limit
+        if sort:
+            params["sort"] = sort
+        if descending:
+            params["descending"] = True
+        if resource_type:
+            params["resource_type"] = resource_type
         
-        try:
-            response = await self.client.get(f"{self.base_url}/asset/list", params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "resources": []}
+        return await self.request("GET", "/asset/list", params, fallback={"resources": []})
     
     async def organize_assets(self, source_path: str, target_path: str, update_references: bool = True) -> Dict[str, Any]:
         """Move or rename asset files with reference updates"""
         data = {"source_path": source_path, "target_path": target_path, "update_references": update_references}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/asset/organize", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/asset/organize", data)
     
     # Project management methods
     async def get_project_settings(self, setting_path: Optional[str] = None) -> Dict[str, Any]:
@@ -272,23 +766,13 @@ class GodotClient:
         if setting_path:
             params["setting_path"] = setting_path
         
-        try:
-            response = await self.client.get(f"{self.base_url}/project/settings", params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("GET", "/project/settings", params)
     
     async def modify_project_settings(self, setting_path: str, value: Any, create_if_missing: bool = False) -> Dict[str, Any]:
         """Modify project settings"""
         data = {"setting_path": setting_path, "value": value, "create_if_missing": create_if_missing}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/project/settings", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/project/settings", data)
     
     async def export_project(self, preset_name: Optional[str] = None, output_path: Optional[str] = None, debug_mode: bool = False) -> Dict[str, Any]:
         """Export project using specified preset"""
@@ -298,12 +782,7 @@ class GodotClient:
         if output_path:
             data["output_path"] = output_path
         
-        try:
-            response = await self.client.post(f"{self.base_url}/project/export", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/project/export", data)
     
     # UI Control methods
     async def set_control_anchors(self, node_path: str, anchor_left: float, anchor_top: float, anchor_right: float, anchor_bottom: float) -> Dict[str, Any]:
@@ -316,12 +795,7 @@ class GodotClient:
             "anchor_bottom": anchor_bottom
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/anchors", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/anchors", data)
     
     async def center_control(self, node_path: str, horizontal: bool = True, vertical: bool = True) -> Dict[str, Any]:
         """Center a Control node in its parent"""
@@ -331,12 +805,7 @@ class GodotClient:
             "vertical": vertical
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/center", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/center", data)
     
     async def position_control(self, node_path: str, x: float, y: float, anchor_preset: Optional[str] = None) -> Dict[str, Any]:
         """Set absolute position for a Control node with optional anchor preset"""
@@ -348,12 +817,7 @@ class GodotClient:
         if anchor_preset:
             data["anchor_preset"] = anchor_preset
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/position", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/position", data)
     
     async def fit_control_to_parent(self, node_path: str, margin: float = 0) -> Dict[str, Any]:
         """Make a Control node fill its parent container"""
@@ -362,12 +826,7 @@ class GodotClient:
             "margin": margin
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/fit", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/fit", data)
     
     async def set_anchor_margins(self, node_path: str, margin_left: float, margin_top: float, margin_right: float, margin_bottom: float) -> Dict[str, Any]:
         """Set margin values from anchor points for a Control node"""
@@ -379,12 +838,7 @@ class GodotClient:
             "margin_bottom": margin_bottom
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/margins", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/margins", data)
     
     async def configure_size_flags(self, node_path: str, horizontal_flags: list = None, vertical_flags: list = None) -> Dict[str, Any]:
         """Configure how a Control expands and shrinks in containers"""
@@ -394,12 +848,7 @@ class GodotClient:
             "vertical_flags": vertical_flags or []
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/size_flags", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/size_flags", data)
     
     async def setup_control_rect(self, node_path: str, x: float, y: float, width: float, height: float, anchor_preset: Optional[str] = None) -> Dict[str, Any]:
         """Set complete position and size for a Control with anchor calculation"""
@@ -413,12 +862,7 @@ class GodotClient:
         if anchor_preset:
             data["anchor_preset"] = anchor_preset
         
-        try:
-            response = await self.client.post(f"{self.base_url}/control/rect", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/control/rect", data)
 
     # Smart UI Creation Helper methods
     async def create_centered_ui(self, node_type: str, name: str, parent_path: str = "", width: float = 100, height: float = 100, text: str = "") -> Dict[str, Any]:
@@ -432,12 +876,7 @@ class GodotClient:
             "text": text
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/ui/create_centered", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/ui/create_centered", data)
     
     async def create_fullscreen_ui(self, node_type: str, name: str, parent_path: str = "", margin: float = 0) -> Dict[str, Any]:
         """Create a UI element that fills the entire screen or parent container"""
@@ -448,12 +887,7 @@ class GodotClient:
             "margin": margin
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/ui/create_fullscreen", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/ui/create_fullscreen", data)
     
     async def setup_ui_container_with_children(self, container_type: str, container_name: str, parent_path: str, positioning: str, children: list, spacing: Optional[float] = None, x: Optional[float] = None, y: Optional[float] = None, width: Optional[float] = None, height: Optional[float] = None) -> Dict[str, Any]:
         """Create a container UI element with properly positioned child elements"""
@@ -475,12 +909,7 @@ class GodotClient:
         if height is not None:
             data["height"] = height
         
-        try:
-            response = await self.client.post(f"{self.base_url}/ui/container_with_children", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/ui/container_with_children", data)
     
     async def apply_common_ui_patterns(self, pattern: str, parent_path: str = "", name_prefix: str = "", customization: Dict[str, Any] = None) -> Dict[str, Any]:
         """Apply pre-configured UI layouts and patterns"""
@@ -491,12 +920,7 @@ class GodotClient:
             "customization": customization or {}
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/ui/apply_pattern", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/ui/apply_pattern", data)
 
     # UI Layout Management methods
     async def create_ui_layout(self, container_type: str, name: str, parent_path: str, positioning: str, x: Optional[float] = None, y: Optional[float] = None, width: Optional[float] = None, height: Optional[float] = None, spacing: Optional[float] = None, columns: Optional[int] = None) -> Dict[str, Any]:
@@ -520,12 +944,7 @@ class GodotClient:
         if columns is not None:
             data["columns"] = columns
         
-        try:
-            response = await self.client.post(f"{self.base_url}/layout/create", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/layout/create", data)
     
     async def set_anchor_preset(self, node_path: str, preset: str, keep_offsets: bool = False) -> Dict[str, Any]:
         """Apply common anchor presets to Control nodes"""
@@ -535,12 +954,7 @@ class GodotClient:
             "keep_offsets": keep_offsets
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/layout/anchor_preset", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/layout/anchor_preset", data)
     
     async def align_controls(self, node_paths: list, alignment: str, reference: str = "first") -> Dict[str, Any]:
         """Align multiple UI elements relative to each other"""
@@ -550,12 +964,7 @@ class GodotClient:
             "reference": reference
         }
         
-        try:
-            response = await self.client.post(f"{self.base_url}/layout/align", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/layout/align", data)
     
     async def distribute_controls(self, node_paths: list, direction: str, spacing: Optional[float] = None, start_position: Optional[float] = None, end_position: Optional[float] = None) -> Dict[str, Any]:
         """Evenly distribute UI elements horizontally or vertically"""
@@ -570,37 +979,55 @@ class GodotClient:
         if end_position is not None:
             data["end_position"] = end_position
         
-        try:
-            response = await self.client.post(f"{self.base_url}/layout/distribute", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/layout/distribute", data)
 
     async def get_node_class_info(self, class_name: str) -> Dict[str, Any]:
         """Get information about a specific Godot node class"""
         data = {"class_name": class_name}
         
-        try:
-            response = await self.client.post(f"{self.base_url}/node/class_info", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("POST", "/node/class_info", data)
 
-    async def list_node_classes(self, filter_type: str = "all", search_term: str = "") -> Dict[str, Any]:
-        """List available Godot node classes with optional filtering"""
+    async def list_node_classes(self, filter_type: str = "all", search_term: str = "", prefix: str = "", offset: int = 0, limit: int = 0, cursor: str = "", fields: Optional[list] = None) -> Dict[str, Any]:
+        """List available Godot node classes with optional filtering, paging and field projection"""
         data = {"filter": filter_type}
         if search_term:
             data["search"] = search_term
+        if prefix:
+            data["prefix"] = prefix
+        if offset:
+            data["offset"] = offset
+        if limit:
+            data["limit"] = limit
+        if cursor:
+            data["cursor"] = cursor
+        if fields:
+            data["fields"] = ",".join(fields)  # Convert list to comma-separated string
         
-        try:
-            response = await self.client.get(f"{self.base_url}/node/list_classes", params=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"error": str(e), "success": False}
+        return await self.request("GET", "/node/list_classes", data)
+    
+    async def classdb_dump(self) -> Dict[str, Any]:
+        """Export the editor's full class hierarchy with properties and methods"""
+        return await self.request("GET", "/node/classdb_dump", fallback={"success": False, "classes": []})
+
+    async def batch(self, operations: list, stop_on_error: bool = True) -> Dict[str, Any]:
+        """Run several plugin operations in one round trip
+        
+        Each operation is a dict with "endpoint" (e.g. "/node/add"), an optional
+        "method" (defaults to POST) and an optional "body".
+        """
+        data = {"operations": operations, "stop_on_error": stop_on_error}
+        
+        return await self.request("POST", "/batch", data, fallback={"success": False, "results": []})
 
     async def close(self):
-        """Close the HTTP client"""
+        """Stop the connection supervisor and event listener and close the HTTP client"""
+        for task in (self.supervisor_task, self.event_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.supervisor_task = None
+        self.event_task = None
         await self.client.aclose()
\ No newline at end of file
@@ -0,0 +1,564 @@
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import logging
+import os
+import re
+import struct
+import sys
+import time
+import zlib
+from stat import S_ISREG
+from typing import Dict, Any, Optional, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Set to the project directory (the one holding project.godot) when the plugin's
+# /health can't report it, e.g. for plugins older than project_path
+PROJECT_PATH_ENV = "GODOT_PROJECT_PATH"
+
+# Without inotify (non-Linux, or out of watches) the index is rebuilt when it is older
+# than this or a mutating request went through GodotClient since the last scan
+RESCAN_INTERVAL = 30.0
+
+# After failing to locate the project, list tools use the plugin for this long
+RETRY_AFTER = 60.0
+
+# Asset type by extension, as the plugin's _get_asset_type_from_extension reports it
+ASSET_TYPES = {
+    **dict.fromkeys(["png", "jpg", "jpeg", "bmp", "tga", "webp"], "image"),
+    **dict.fromkeys(["ogg", "wav", "mp3"], "audio"),
+    **dict.fromkeys(["gltf", "glb", "obj", "fbx", "dae"], "model"),
+    **dict.fromkeys(["ttf", "otf", "woff", "woff2"], "font"),
+    "tscn": "scene",
+    "gd": "script",
+    "tres": "resource",
+    "res": "resource"
+}
+
+# list_resources paging and sort keys, as in the plugin's /asset/list. The index has no
+# resource classes, so "type" sorts by asset type there
+RESOURCE_PAGE_SIZE = 500
+RESOURCE_MAX_PAGE_SIZE = 5000
+RESOURCE_SORT_KEYS = {
+    "path": lambda entry: entry.path,
+    "name": lambda entry: entry.name.lower(),
+    "modified": lambda entry: entry.mtime,
+    "type": lambda entry: entry.asset_type,
+    "extension": lambda entry: entry.extension
+}
+
+TEXT_RESOURCE_HEADER = re.compile(rb'^\[gd_resource\b[^\]]*?\btype="([^"]+)"')
+
+# read_resource_type result for a compressed ("RSCC") resource whose first block can't
+# be decoded here; only the editor's EditorFileSystem knows its type
+UNKNOWN_TYPE = "?"
+
+# FileAccessCompressed modes (Compression::Mode) and how to inflate one block. ZSTD,
+# the editor's default, needs Python 3.14's compression.zstd
+def _inflate_zstd(data: bytes) -> bytes:
+    from compression import zstd
+    return zstd.decompress(data)
+
+RSCC_DECODERS = {
+    1: zlib.decompress,  # DEFLATE (zlib stream)
+    2: _inflate_zstd,
+    3: lambda data: zlib.decompress(data, 31)  # GZIP
+}
+
+class FileEntry(NamedTuple):
+    path: str  # res:// path
+    name: str  # file name without extension
+    directory: str  # res:// directory in the plugin's form: "res://" or "res://a/b"
+    extension: str  # lower case, no dot
+    size: int
+    mtime: float
+    asset_type: str
+
+def join_res(directory: str, name: str) -> str:
+    return directory + name if directory == "res://" else directory + "/" + name
+
+def normalize_res_dir(directory: str) -> str:
+    """"res://", "res://a/", "a" and "/a" all name the same directory; the result has no trailing slash"""
+    directory = (directory or "res://").strip()
+    if directory.startswith("res://"):
+        directory = directory[len("res://"):]
+    directory = directory.strip("/")
+    return "res://" + directory
+
+def read_resource_type(abs_path: str) -> Optional[str]:
+    """Resource class from a .tres header line or a binary .res header, without loading it
+    
+    Compressed binary resources are read from their first block; UNKNOWN_TYPE when that
+    block's compression can't be decoded here.
+    """
+    try:
+        with open(abs_path, "rb") as f:
+            head = f.read(512)
+            if head[:4] == b"RSCC":
+                head = _read_first_rscc_block(f, head)
+                if head is None:
+                    return UNKNOWN_TYPE
+    except OSError:
+        return None
+    match = TEXT_RESOURCE_HEADER.match(head)
+    if match:
+        return match.group(1).decode("utf-8", "replace")
+    # Binary: "RSRC", big_endian, use_real64, version major/minor/format, then the type as a length-prefixed string
+    if head[:4] == b"RSRC" and len(head) >= 28:
+        order = ">" if struct.unpack_from("<I", head, 4)[0] else "<"
+        length = struct.unpack_from(order + "I", head, 24)[0]
+        return head[28:28 + length].rstrip(b"\0").decode("utf-8", "replace") or None
+    return None
+
+def _read_first_rscc_block(f, head: bytes) -> Optional[bytes]:
+    """Decompressed first block of a FileAccessCompressed file, or None if it can't be decoded
+    
+    Layout after "RSCC": mode, block size, uncompressed size, one compressed size per
+    block (uncompressed size // block size + 1 of them), then the blocks.
+    """
+    if len(head) < 20:
+        return None
+    mode, block_size, total = struct.unpack_from("<3I", head, 4)
+    decode = RSCC_DECODERS.get(mode)
+    if decode is None or block_size == 0:
+        return None
+    block_count = total // block_size + 1
+    first_size = struct.unpack_from("<I", head, 16)[0]
+    f.seek(16 + 4 * block_count)
+    data = f.read(min(first_size, block_size * 2 + 1024))
+    try:
+        return decode(data)
+    except Exception:
+        return None
+
+class InotifyWatcher:
+    """Directory watches on one non-blocking inotify descriptor (Linux only, through libc)"""
+    
+    IN_MODIFY = 0x2
+    IN_ATTRIB = 0x4
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_FROM = 0x40
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ONLYDIR = 0x1000000
+    IN_ISDIR = 0x40000000
+    
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: Dict[int, str] = {}  # watch descriptor -> absolute directory
+    
+    @staticmethod
+    def available() -> bool:
+        return sys.platform.startswith("linux")
+    
+    def add(self, abs_dir: str) -> int:
+        """Watch a directory; raises OSError (ENOSPC when fs.inotify.max_user_watches is exhausted)"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(abs_dir), self.WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, f"inotify_add_watch {abs_dir}: {os.strerror(error)}")
+        self.paths[wd] = abs_dir
+        return wd
+    
+    def remove(self, wd: int):
+        if self.paths.pop(wd, None) is not None:
+            self.libc.inotify_rm_watch(self.fd, wd)
+    
+    def read(self) -> List[tuple]:
+        """Queued events as (absolute directory, name, mask); never blocks"""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return events
+            except OSError:
+                return events
+            offset = 0
+            while offset + self.EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & self.IN_IGNORED:
+                    self.paths.pop(wd, None)
+                    continue
+                events.append((self.paths.get(wd), name, mask))
+    
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+        self.paths.clear()
+
+class ProjectIndex:
+    """In-memory index of every file in the Godot project, for the list_* tools
+    
+    The project directory is located once (GODOT_PROJECT_PATH, or project_path from the
+    plugin's /health when the server runs on the same machine), scanned with os.scandir,
+    and then kept current from inotify events. Listings are answered from per-extension
+    and per-directory maps, so they cost O(matches) instead of a recursive DirAccess walk
+    on the editor's main thread. Like DirAccess, names starting with "." are skipped.
+    
+    When the project isn't reachable from here, ensure() returns False and the tools fall
+    back to the plugin's own listing endpoints.
+    """
+    
+    def __init__(self, root: Optional[str] = None, watch: bool = True, rescan_interval: float = RESCAN_INTERVAL):
+        self.root = os.path.realpath(root) if root else None
+        self.watch = watch
+        self.rescan_interval = rescan_interval
+        self.files: Dict[str, FileEntry] = {}
+        self.by_extension: Dict[str, Dict[str, FileEntry]] = {}
+        self.by_directory: Dict[str, Dict[str, FileEntry]] = {}
+        self.subdirs: Dict[str, set] = {}  # res:// directory -> res:// child directories
+        self.resource_types: Dict[str, tuple] = {}  # res:// path -> (mtime, size, class or None)
+        self.watcher: Optional[InotifyWatcher] = None
+        self.watches: Dict[str, int] = {}  # res:// directory -> watch descriptor
+        self.scanned_at = 0.0
+        self.mutation_count = -1
+        self.retry_at = 0.0
+        self.scan_lock = asyncio.Lock()
+        self.stats = {"scans": 0, "events": 0}
+    
+    # Paths
+    
+    def to_res(self, abs_path: str) -> str:
+        relative = os.path.relpath(abs_path, self.root)
+        return "res://" if relative == "." else "res://" + relative.replace(os.sep, "/")
+    
+    def to_abs(self, res_path: str) -> str:
+        return os.path.join(self.root, *res_path[len("res://"):].split("/"))
+    
+    # Freshness
+    
+    def is_live(self) -> bool:
+        return self.watcher is not None
+    
+    def is_fresh(self, godot_client) -> bool:
+        if not self.scanned_at:
+            return False
+        if self.is_live():
+            return True
+        return (self.mutation_count == godot_client.mutation_count()
+                and time.monotonic() - self.scanned_at < self.rescan_interval)
+    
+    async def locate_root(self, godot_client) -> Optional[str]:
+        candidates = [os.environ.get(PROJECT_PATH_ENV)]
+        health = await godot_client.health_check()
+        if isinstance(health, dict):
+            candidates.append(health.get("project_path"))
+        for candidate in candidates:
+            if isinstance(candidate, str) and candidate and os.path.isfile(os.path.join(candidate, "project.godot")):
+                return os.path.realpath(candidate)
+        return None
+    
+    async def ensure(self, godot_client) -> bool:
+        """Make the index current; False when the project directory can't be read from here"""
+        if self.is_live() and self.scanned_at:
+            # Apply what the kernel has queued, so files written by a request that just
+            # returned are visible even if the event loop hasn't woken the reader yet
+            self.apply_events()
+        if self.is_fresh(godot_client):
+            return True
+        if self.root is None:
+            if time.monotonic() < self.retry_at:
+                return False
+            self.root = await self.locate_root(godot_client)
+            if self.root is None:
+                self.retry_at = time.monotonic() + RETRY_AFTER
+                return False
+        
+        async with self.scan_lock:
+            if self.is_fresh(godot_client):
+                return True
+            mutation_count = godot_client.mutation_count()
+            if not os.path.isdir(self.root):
+                logger.warning(f"Project directory {self.root} is gone; listing through the plugin")
+                self.close()
+                self.root = None
+                return False
+            self.close()
+            # Built off the event loop into a separate index, so readers keep a consistent
+            # (if stale) view until it is swapped in
+            fresh = ProjectIndex(self.root, self.watch, self.rescan_interval)
+            if self.watch and InotifyWatcher.available():
+                try:
+                    fresh.watcher = InotifyWatcher()
+                except OSError as e:
+                    logger.info(f"inotify unavailable ({e}); project index is rescanned every {self.rescan_interval:.0f}s")
+            started = time.perf_counter()
+            await asyncio.to_thread(fresh.scan)
+            self.files, self.by_extension, self.by_directory = fresh.files, fresh.by_extension, fresh.by_directory
+            self.subdirs, self.watcher, self.watches = fresh.subdirs, fresh.watcher, fresh.watches
+            self.mutation_count = mutation_count
+            self.scanned_at = time.monotonic()
+            self.stats["scans"] += 1
+            if self.watcher is not None:
+                asyncio.get_running_loop().add_reader(self.watcher.fd, self.apply_events)
+            logger.info(f"Indexed {len(self.files)} project files under {self.root} in "
+                        f"{(time.perf_counter() - started) * 1000:.0f} ms ({'inotify' if self.is_live() else 'polling'})")
+            return True
+    
+    def close(self):
+        if self.watcher is not None:
+            try:
+                asyncio.get_running_loop().remove_reader(self.watcher.fd)
+            except RuntimeError:
+                pass
+            self.watcher.close()
+            self.watcher = None
+        self.watches = {}
+        self.scanned_at = 0.0
+    
+    def state(self) -> Dict[str, Any]:
+        return {
+            "root": self.root,
+            "files": len(self.files),
+            "mode": "inotify" if self.is_live() else ("polling" if self.scanned_at else "unavailable"),
+            "watched_directories": len(self.watches),
+            **self.stats
+        }
+    
+    # Building and incremental updates
+    
+    def scan(self, directory: str = "res://"):
+        """(Re)index the tree under a res:// directory, watching each directory before listing it"""
+        self._remove_directory(directory)
+        parent = directory.rsplit("/", 1)[0] if directory != "res://" else None
+        if parent is not None:
+            self.subdirs.setdefault("res://" if parent == "res:/" else parent, set()).add(directory)
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            abs_dir = self.to_abs(current)
+            self.subdirs.setdefault(current, set())
+            self.by_directory.setdefault(current, {})
+            self._watch(current, abs_dir)
+            try:
+                iterator = os.scandir(abs_dir)
+            except OSError:
+                continue
+            with iterator:
+                for entry in iterator:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            child = join_res(current, entry.name)
+                            self.subdirs[current].add(child)
+                            stack.append(child)
+                        elif entry.is_file():
+                            self._add(current, entry.name, entry.stat())
+                    except OSError:
+                        continue
+    
+    def _watch(self, directory: str, abs_dir: str):
+        if self.watcher is None:
+            return
+        try:
+            self.watches[directory] = self.watcher.add(abs_dir)
+        except OSError as e:
+            # Typically ENOSPC (fs.inotify.max_user_watches); fall back to periodic rescans
+            if e.errno != errno.ENOENT:
+                logger.warning(f"Cannot watch {abs_dir} ({e}); project index falls back to polling")
+                self.watcher.close()
+                self.watcher = None
+                self.watches = {}
+    
+    def _add(self, directory: str, file_name: str, stat: os.stat_result):
+        path = join_res(directory, file_name)
+        self._discard(path)
+        base, dot, extension = file_name.rpartition(".")
+        extension = extension.lower() if dot else ""
+        entry = FileEntry(path, base if dot else file_name, directory, extension, stat.st_size, stat.st_mtime,
+                          ASSET_TYPES.get(extension, "other"))
+        self.files[path] = entry
+        self.by_extension.setdefault(extension, {})[path] = entry
+        self.by_directory.setdefault(directory, {})[path] = entry
+    
+    def _discard(self, path: str):
+        entry = self.files.pop(path, None)
+        if entry is not None:
+            self.by_extension.get(entry.extension, {}).pop(path, None)
+            self.by_directory.get(entry.directory, {}).pop(path, None)
+    
+    def _remove_directory(self, directory: str):
+        """Drop a directory's subtree from the index and stop watching it"""
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            stack.extend(self.subdirs.pop(current, ()))
+            for path in list(self.by_directory.pop(current, {})):
+                self._discard(path)
+            wd = self.watches.pop(current, None)
+            if wd is not None and self.watcher is not None:
+                self.watcher.remove(wd)
+        if directory != "res://":
+            parent = directory.rsplit("/", 1)[0]
+            self.subdirs.get("res://" if parent == "res:/" else parent, set()).discard(directory)
+    
+    def apply_events(self):
+        """Fold queued inotify events into the index"""
+        if self.watcher is None:
+            return
+        events = self.watcher.read()
+        if not events:
+            return
+        self.stats["events"] += len(events)
+        w = InotifyWatcher
+        touched = {}
+        for abs_dir, name, mask in events:
+            if mask & w.IN_Q_OVERFLOW:
+                logger.info("inotify queue overflowed; rescanning the project")
+                self.scan()
+                return
+            if abs_dir is None:
+                continue
+            if not name:
+                if mask & (w.IN_DELETE_SELF | w.IN_MOVE_SELF) and abs_dir == self.root:
+                    # The project itself moved or was deleted; ensure() finds out on next use
+                    self.close()
+                    return
+                continue
+            if name.startswith("."):
+                continue
+            directory = self.to_res(abs_dir)
+            path = join_res(directory, name)
+            if mask & w.IN_ISDIR:
+                if mask & (w.IN_CREATE | w.IN_MOVED_TO):
+                    if directory in self.subdirs:
+                        self.scan(path)
+                elif mask & (w.IN_DELETE | w.IN_MOVED_FROM):
+                    self._remove_directory(path)
+                continue
+            # Several events per file (modify, close_write) collapse into one stat
+            touched[path] = (directory, name)
+        for path, (directory, name) in touched.items():
+            if directory not in self.subdirs:
+                continue
+            try:
+                stat = os.stat(os.path.join(self.to_abs(directory), name))
+            except OSError:
+                self._discard(path)
+                continue
+            if S_ISREG(stat.st_mode):
+                self._add(directory, name, stat)
+    
+    # Queries
+    
+    def query(self, file_types: Optional[List[str]] = None, directory: str = "res://", recursive: bool = True) -> List[FileEntry]:
+        """Files under directory (just in it, when not recursive) whose names end with one of
+        file_types (".png", "png" or "png.import"; case-insensitive), sorted by path"""
+        directory = normalize_res_dir(directory)
+        if recursive:
+            prefix = directory if directory == "res://" else directory + "/"
+            in_scope = lambda entry: entry.directory == directory or entry.path.startswith(prefix)
+        else:
+            in_scope = lambda entry: entry.directory == directory
+        
+        if file_types:
+            suffixes = {file_type.lower().lstrip(".") for file_type in file_types if file_type.strip(".")}
+            matches = {}
+            for suffix in suffixes:
+                extension = suffix.rsplit(".", 1)[-1]
+                # Without recursion the directory's own listing is usually the smaller set
+                candidates = self.by_directory.get(directory, {}) if not recursive else self.by_extension.get(extension, {})
+                for path, entry in candidates.items():
+                    if entry.extension == extension and in_scope(entry) and (suffix == extension or path.lower().endswith("." + suffix)):
+                        matches[path] = entry
+            return sorted(matches.values(), key=lambda entry: entry.path)
+        
+        directories = [directory]
+        if recursive:
+            stack = [directory]
+            while stack:
+                children = self.subdirs.get(stack.pop(), ())
+                directories.extend(children)
+                stack.extend(children)
+        return sorted((entry for d in directories for entry in self.by_directory.get(d, {}).values()), key=lambda entry: entry.path)
+    
+    def has_directory(self, directory: str) -> bool:
+        return normalize_res_dir(directory) in self.subdirs
+    
+    def resource_type(self, entry: FileEntry) -> Optional[str]:
+        """Class of a .tres/.res file from its header, cached until its mtime or size changes"""
+        cached = self.resource_types.get(entry.path)
+        if cached is not None and cached[:2] == (entry.mtime, entry.size):
+            return cached[2]
+        resource_type = read_resource_type(self.to_abs(entry.path))
+        self.resource_types[entry.path] = (entry.mtime, entry.size, resource_type)
+        return resource_type
+    
+    # Plugin-shaped responses for the list tools
+    
+    def list_scenes(self) -> Dict[str, Any]:
+        scenes = [{"name": e.name, "path": e.path, "directory": e.directory} for e in self.query(["tscn"])]
+        return {"scenes": scenes, "count": len(scenes)}
+    
+    def list_scripts(self) -> Dict[str, Any]:
+        scripts = [{"name": e.name, "path": e.path, "directory": e.directory} for e in self.query(["gd"])]
+        return {"scripts": scripts, "count": len(scripts)}
+    
+    def list_resources(self, directory: str = "res://", file_types: Optional[List[str]] = None, recursive: bool = True,
+                       offset: int = 0, limit: int = 0, sort: str = "", descending: bool = False,
+                       glob: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Same paging, sorting and glob semantics as the plugin's /asset/list"""
+        if not self.has_directory(directory):
+            return {"success": False, "error": f"Directory not found: {directory}"}
+        sort = sort or "path"
+        if sort not in RESOURCE_SORT_KEYS:
+            return {"success": False, "error": f"Unknown sort key: {sort} (expected one of {', '.join(RESOURCE_SORT_KEYS)})"}
+        
+        matches = self.query(file_types, directory, recursive)
+        if glob:
+            patterns = [pattern.lower() for pattern in glob]
+            matches = [e for e in matches
+                       if any(fnmatch.fnmatchcase((e.path if "/" in p else e.path.rsplit("/", 1)[-1]).lower(), p) for p in patterns)]
+        if sort != "path" or descending:
+            # Stable sorts: path order breaks ties, as in the plugin
+            matches.sort(key=RESOURCE_SORT_KEYS[sort], reverse=descending)
+        
+        offset = max(offset, 0)
+        limit = min(max(limit, 1), RESOURCE_MAX_PAGE_SIZE) if limit else RESOURCE_PAGE_SIZE
+        page = matches[offset:offset + limit]
+        has_more = offset + len(page) < len(matches)
+        resources = [
+            {"name": e.name, "path": e.path, "directory": e.directory, "size": f"{e.size} bytes",
+             "type": e.asset_type, "extension": e.extension, "modified": int(e.mtime)}
+            for e in page
+        ]
+        return {"success": True, "resources": resources, "count": len(resources), "total_count": len(matches),
+                "offset": offset, "limit": limit, "has_more": has_more,
+                "next_offset": offset + len(page) if has_more else -1, "directory": directory, "sort": sort}
+    
+    def list_themes(self, directory: str = "res://", recursive: bool = True) -> Optional[Dict[str, Any]]:
+        """Themes by resource header; None when a compressed resource's type can't be read
+        here, so the caller asks the plugin instead"""
+        themes = []
+        for e in self.query(["tres", "res"], directory, recursive):
+            resource_type = self.resource_type(e)
+            if resource_type == UNKNOWN_TYPE:
+                return None
+            if resource_type == "Theme":
+                themes.append({"name": e.name, "path": e.path, "size": f"{e.size} bytes"})
+        return {"success": True, "themes": themes, "count": len(themes), "directory": directory, "recursive": recursive}
+
+# Shared by the scene, script, asset and theme tools
+project_index = ProjectIndex()
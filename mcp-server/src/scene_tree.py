@@ -0,0 +1,152 @@
+import logging
+import time
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# Nodes requested per /scene/tree page while mirroring
+PAGE_SIZE = 1000
+
+# Paged fetches tried before settling for a snapshot that a concurrent change may have split
+FETCH_ATTEMPTS = 3
+
+# Without the editor change feed, edits made by hand don't reach GodotClient,
+# so a mirror is then also considered stale after this many seconds
+MIRROR_TTL = 30.0
+
+def normalize_node_path(path: str) -> str:
+    """Scene-root-relative form used by /scene/tree: "." for the root, no leading "./" or trailing "/" """
+    path = (path or "").strip().strip("/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path or "."
+
+class SceneTreeMirror:
+    """Local copy of the edited scene's hierarchy from the plugin's /scene/tree
+    
+    Structural questions (children, path existence, nodes by type or group) are answered
+    from the copy. It is dropped as soon as GodotClient sends any mutating request or
+    receives a structural editor change event, and after MIRROR_TTL seconds while the
+    change feed is down.
+    """
+    
+    def __init__(self, ttl: float = MIRROR_TTL):
+        self.ttl = ttl
+        self.scene_path: Optional[str] = None
+        self.nodes: Dict[str, Dict[str, Any]] = {}  # path -> node entry from /scene/tree
+        self.children_of: Dict[str, List[str]] = {}  # path -> child paths in index order
+        self.mutation_count = -1
+        self.loaded_at = 0.0
+        self.stale = False  # The scene kept changing during every fetch attempt
+        self.error = ""  # Why the last refresh failed
+    
+    def load(self, nodes: List[Dict[str, Any]], scene_path: str = "", mutation_count: int = 0):
+        """Replace the mirror with a full /scene/tree node list (pre-order)"""
+        self.scene_path = scene_path
+        self.nodes = {normalize_node_path(node["path"]): node for node in nodes}
+        self.children_of = {path: [] for path in self.nodes}
+        for path, node in self.nodes.items():
+            parent = node.get("parent")
+            if parent:
+                self.children_of.setdefault(normalize_node_path(parent), []).append(path)
+        for paths in self.children_of.values():
+            paths.sort(key=lambda p: self.nodes[p].get("index", 0))
+        self.mutation_count = mutation_count
+        self.loaded_at = time.monotonic()
+    
+    def invalidate(self):
+        self.scene_path = None
+        self.nodes = {}
+        self.children_of = {}
+        self.mutation_count = -1
+        self.stale = False
+    
+    def is_fresh(self, godot_client) -> bool:
+        return (self.scene_path is not None
+                and self.mutation_count == godot_client.mutation_count()
+                and (godot_client.events_connected() or time.monotonic() - self.loaded_at < self.ttl))
+    
+    async def refresh(self, godot_client, force: bool = False) -> bool:
+        """Make sure the mirror is current, fetching the tree page by page if needed
+        
+        Returns False (leaving the mirror empty and the reason in error) when the plugin
+        can't provide it. If the scene changes during every one of FETCH_ATTEMPTS fetches,
+        the last one is kept with stale set, and the next call fetches again.
+        """
+        if not force and self.is_fresh(godot_client):
+            return True
+        
+        stale = True
+        for attempt in range(FETCH_ATTEMPTS):
+            mutation_count = godot_client.mutation_count()
+            nodes = []
+            after = ""
+            scene_path = ""
+            while True:
+                page = await godot_client.get_scene_tree(after=after, limit=PAGE_SIZE)
+                if not isinstance(page, dict) or not page.get("success"):
+                    break
+                nodes.extend(page.get("nodes", []))
+                scene_path = page.get("scene_path", "")
+                if not page.get("has_more") or not page.get("next_after") or page["next_after"] == after:
+                    break
+                after = page["next_after"]
+            
+            if not isinstance(page, dict) or not page.get("success"):
+                # Past the first page the cursor node may just have been removed; fetch again
+                if after and attempt + 1 < FETCH_ATTEMPTS:
+                    continue
+                self.invalidate()
+                error = page.get("error") if isinstance(page, dict) else None
+                self.error = error or "no scene open or plugin unreachable"
+                return False
+            
+            # A mutation that landed while pages were being fetched may have split the snapshot
+            if godot_client.mutation_count() == mutation_count:
+                stale = False
+                break
+            logger.debug(f"Scene changed while fetching its tree (attempt {attempt + 1} of {FETCH_ATTEMPTS})")
+        
+        # A stale snapshot is loaded under an impossible count, so it is never considered fresh
+        self.load(nodes, scene_path, -1 if stale else mutation_count)
+        self.stale = stale
+        self.error = ""
+        logger.debug(f"Mirrored scene tree of {scene_path or 'unsaved scene'} ({len(nodes)} nodes)")
+        return True
+    
+    def exists(self, path: str) -> bool:
+        return normalize_node_path(path) in self.nodes
+    
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        return self.nodes.get(normalize_node_path(path))
+    
+    def children(self, path: str = ".") -> Optional[List[str]]:
+        """Paths of the node's direct children, or None if the node isn't in the scene"""
+        path = normalize_node_path(path)
+        if path not in self.nodes:
+            return None
+        return list(self.children_of.get(path, []))
+    
+    def descendants(self, path: str = ".", max_depth: int = -1) -> List[str]:
+        """Pre-order paths below (and including) path, down to max_depth levels (-1 = unlimited)"""
+        path = normalize_node_path(path)
+        if path not in self.nodes:
+            return []
+        result = []
+        stack = [(path, 0)]
+        while stack:
+            current, depth = stack.pop()
+            result.append(current)
+            if max_depth < 0 or depth < max_depth:
+                stack.extend((child, depth + 1) for child in reversed(self.children_of.get(current, [])))
+        return result
+    
+    def nodes_by_type(self, node_type: str, classdb=None) -> List[str]:
+        """Paths of nodes of exactly node_type, or of any subclass when a ClassDBSnapshot is given"""
+        if classdb is not None and classdb.has_class(node_type):
+            return [path for path, node in self.nodes.items() if classdb.is_subclass(node["type"], node_type)]
+        return [path for path, node in self.nodes.items() if node["type"] == node_type]
+    
+    def nodes_in_group(self, group: str) -> List[str]:
+        return [path for path, node in self.nodes.items() if group in node.get("groups", [])]
+
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import logging
 from typing import Any, Sequence
 from mcp.server import Server
@@ -6,104 +7,129 @@ from mcp.types import Resource, Tool, TextContent, ImageContent, EmbeddedResourc
 from mcp.server.stdio import stdio_server
 
 from godot_client import GodotClient
-from tools.scene_tools import get_scene_tools, handle_scene_tool
-from tools.script_tools import get_script_tools, handle_script_tool
-from tools.error_tools import get_error_tools, handle_error_tool
-from tools.asset_tools import get_asset_tools, handle_asset_tool
-from tools.project_tools import get_project_tools, handle_project_tool
-from tools.theme_tools import get_theme_tools, handle_theme_tool
-from tools.animation_tools import get_animation_tools, handle_animation_tool
+from project_index import project_index
+from tools.scene_tools import handle_scene_tool
+from tools.script_tools import handle_script_tool
+from tools.error_tools import handle_error_tool
+from tools.asset_tools import handle_asset_tool
+from tools.project_tools import handle_project_tool
+from tools.theme_tools import handle_theme_tool
+from tools.animation_tools import handle_animation_tool
+from tools.batch_tools import handle_batch_tool
+from tools.registry import ToolRegistry, tool_handler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Handlers in tools/list order; each is bound to its tool list with @tool_handler
+TOOL_HANDLERS = [
+    handle_scene_tool,
+    handle_script_tool,
+    handle_error_tool,
+    handle_asset_tool,
+    handle_project_tool,
+    handle_theme_tool,
+    handle_animation_tool,
+    handle_batch_tool,
+]
+
+def get_health_tools() -> list[Tool]:
+    return [
+        Tool(
+            name="godot_health_check",
+            description="Check if Godot editor plugin is running and accessible",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
+        )
+    ]
+
+@tool_handler(get_health_tools)
+async def handle_health_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
+    """Handle the health check tool"""
+    result = await godot_client.health_check()
+    if result.get("connected", True) and not result.get("error"):
+        return [TextContent(
+            type="text",
+            text=f"Godot plugin is running. Status: {result.get('status', 'unknown')}"
+        )]
+    else:
+        return [TextContent(
+            type="text", 
+            text=f"Cannot connect to Godot plugin: {result.get('error', 'Unknown error')}"
+        )]
+
+def get_diagnostics_tools() -> list[Tool]:
+    return [
+        Tool(
+            name="godot_client_diagnostics",
+            description="Show MCP server connection state, response cache hit/miss/eviction stats, read coalescing counters and editor change feed status",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "clear_cache": {
+                        "type": "boolean",
+                        "description": "Drop all cached responses after reporting stats",
+                        "default": False
+                    }
+                }
+            }
+        )
+    ]
+
+@tool_handler(get_diagnostics_tools)
+async def handle_diagnostics_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
+    """Handle the client diagnostics tool"""
+    diagnostics = {
+        "connection": godot_client.connection_state(),
+        "cache": godot_client.cache_stats(),
+        "coalescing": godot_client.coalescing_stats(),
+        "events": godot_client.event_feed_state(),
+        "project_index": project_index.state()
+    }
+    if arguments.get("clear_cache") and godot_client.cache is not None:
+        godot_client.cache.clear()
+        diagnostics["cache_cleared"] = True
+    return [TextContent(
+        type="text",
+        text=f"Godot MCP client diagnostics:\n{json.dumps(diagnostics, indent=2)}"
+    )]
+
+def build_tool_registry() -> ToolRegistry:
+    """Build the tool name -> handler registry once at startup"""
+    registry = ToolRegistry()
+    for handler in TOOL_HANDLERS:
+        registry.register_handler(handler)
+    registry.register_handler(handle_health_tool)
+    registry.register_handler(handle_diagnostics_tool)
+    return registry
+
 class GodotMCPServer:
     def __init__(self):
         logger.info("🔧 Initializing Godot MCP Server...")
         self.server = Server("godot-mcp-server")
         self.godot_client = GodotClient()
+        self.registry = build_tool_registry()
         logger.info("📡 Setting up MCP tool handlers...")
         self.setup_handlers()
-        logger.info("🛠️  Registered tools: scene management, script creation, asset management, project settings, theme management, animation & interaction, error monitoring, health check")
+        logger.info(f"🛠️  Registered {len(self.registry)} tools: scene management, script creation, asset management, project settings, theme management, animation & interaction, batch operations, error monitoring, health check, diagnostics")
     
     def setup_handlers(self):
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools"""
-            tools = []
-            tools.extend(get_scene_tools())
-            tools.extend(get_script_tools())
-            tools.extend(get_error_tools())
-            tools.extend(get_asset_tools())
-            tools.extend(get_project_tools())
-            tools.extend(get_theme_tools())
-            tools.extend(get_animation_tools())
-            
-            # Add health check tool
-            tools.append(Tool(
-                name="godot_health_check",
-                description="Check if Godot editor plugin is running and accessible",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            ))
-            
-            return tools
+            return self.registry.tools
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
             """Handle tool calls"""
             logger.info(f"Tool called: {name} with arguments: {arguments}")
             
-            if name == "godot_health_check":
-                result = await self.godot_client.health_check()
-                if result.get("connected", True) and not result.get("error"):
-                    return [TextContent(
-                        type="text",
-                        text=f"Godot plugin is running. Status: {result.get('status', 'unknown')}"
-                    )]
-                else:
-                    return [TextContent(
-                        type="text", 
-                        text=f"Cannot connect to Godot plugin: {result.get('error', 'Unknown error')}"
-                    )]
-            
-            # Handle scene tools
-            scene_tools = [tool.name for tool in get_scene_tools()]
-            if name in scene_tools:
-                return await handle_scene_tool(name, arguments, self.godot_client)
-            
-            # Handle script tools  
-            script_tools = [tool.name for tool in get_script_tools()]
-            if name in script_tools:
-                return await handle_script_tool(name, arguments, self.godot_client)
-            
-            # Handle error tools
-            error_tools = [tool.name for tool in get_error_tools()]
-            if name in error_tools:
-                return await handle_error_tool(name, arguments, self.godot_client)
-            
-            # Handle asset tools
-            asset_tools = [tool.name for tool in get_asset_tools()]
-            if name in asset_tools:
-                return await handle_asset_tool(name, arguments, self.godot_client)
-            
-            # Handle project tools
-            project_tools = [tool.name for tool in get_project_tools()]
-            if name in project_tools:
-                return await handle_project_tool(name, arguments, self.godot_client)
-            
-            # Handle theme tools
-            theme_tools = [tool.name for tool in get_theme_tools()]
-            if name in theme_tools:
-                return await handle_theme_tool(name, arguments, self.godot_client)
-            
-            # Handle animation tools
-            animation_tools = [tool.name for tool in get_animation_tools()]
-            if name in animation_tools:
-                return await handle_animation_tool(name, arguments, self.godot_client)
+            handler = self.registry.get_handler(name)
+            if handler:
+                return await handler(name, arguments, self.godot_client)
             
             # Unknown tool
             return [TextContent(
@@ -114,11 +140,14 @@ class GodotMCPServer:
     async def run(self):
         """Run the MCP server"""
         try:
+            self.godot_client.start_supervisor()
+            self.godot_client.start_event_listener()
             async with stdio_server() as streams:
                 await self.server.run(
                     streams[0], streams[1], self.server.create_initialization_options()
                 )
         finally:
+            project_index.close()
             await self.godot_client.close()
 
 async def main():
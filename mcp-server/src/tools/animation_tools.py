@@ -5,6 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from tools.registry import tool_handler
 
 # UI Animation & Interaction tools
 def get_animation_tools() -> list[Tool]:
@@ -59,12 +60,12 @@ def get_animation_tools() -> list[Tool]:
                     "auto_start": {
                         "type": "boolean",
                         "description": "Whether to automatically start the animation",
-                        "default": false
+                        "default": False
                     },
                     "loop": {
                         "type": "boolean", 
                         "description": "Whether the animation should loop",
-                        "default": false
+                        "default": False
                     }
                 },
                 "required": ["target_node_path"]
@@ -101,7 +102,7 @@ def get_animation_tools() -> list[Tool]:
                                 "create_method": {
                                     "type": "boolean",
                                     "description": "Whether to create the method if it doesn't exist",
-                                    "default": true
+                                    "default": True
                                 },
                                 "method_parameters": {
                                     "type": "array",
@@ -123,7 +124,7 @@ def get_animation_tools() -> list[Tool]:
                     "auto_attach_script": {
                         "type": "boolean",
                         "description": "Whether to automatically attach script to target node",
-                        "default": true
+                        "default": True
                     }
                 },
                 "required": ["node_path", "signals"]
@@ -149,13 +150,13 @@ def get_animation_tools() -> list[Tool]:
                     "wrap_around": {
                         "type": "boolean",
                         "description": "Whether focus wraps from last to first element",
-                        "default": true
+                        "default": True
                     },
                     "focus_visual_settings": {
                         "type": "object",
                         "description": "Visual settings for focused elements",
                         "properties": {
-                            "enable_focus_outline": {"type": "boolean", "default": true},
+                            "enable_focus_outline": {"type": "boolean", "default": True},
                             "outline_color": {"type": "string", "description": "Color for focus outline (hex format)"},
                             "outline_thickness": {"type": "number", "description": "Thickness of focus outline in pixels"}
                         }
@@ -164,8 +165,8 @@ def get_animation_tools() -> list[Tool]:
                         "type": "object",
                         "description": "Keyboard navigation settings",
                         "properties": {
-                            "enable_arrow_keys": {"type": "boolean", "default": true},
-                            "enable_wasd": {"type": "boolean", "default": false},
+                            "enable_arrow_keys": {"type": "boolean", "default": True},
+                            "enable_wasd": {"type": "boolean", "default": False},
                             "custom_key_bindings": {
                                 "type": "object",
                                 "description": "Custom key bindings for navigation",
@@ -200,7 +201,7 @@ def get_animation_tools() -> list[Tool]:
                     "reverse": {
                         "type": "boolean",
                         "description": "Whether to play animation in reverse",
-                        "default": false
+                        "default": False
                     },
                     "speed_scale": {
                         "type": "number",
@@ -259,7 +260,7 @@ def get_animation_tools() -> list[Tool]:
                     "auto_execute": {
                         "type": "boolean",
                         "description": "Whether to execute transition immediately",
-                        "default": false
+                        "default": False
                     }
                 },
                 "required": ["transition_name", "from_state", "to_state"]
@@ -267,11 +268,10 @@ def get_animation_tools() -> list[Tool]:
         )
     ]
 
-async def handle_create_ui_animation(arguments: dict) -> Sequence[TextContent]:
+async def handle_create_ui_animation(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Create Tween nodes for UI animations"""
     try:
-        client = GodotClient()
-        response = await client.post('/animation/create', arguments)
+        response = await client.request("POST", "/animation/create", arguments)
         
         if response.get('success'):
             return [TextContent(
@@ -286,11 +286,10 @@ async def handle_create_ui_animation(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error creating UI animation: {str(e)}")]
 
-async def handle_configure_ui_signals(arguments: dict) -> Sequence[TextContent]:
+async def handle_configure_ui_signals(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Connect UI signals to script methods"""
     try:
-        client = GodotClient()
-        response = await client.post('/animation/signals', arguments)
+        response = await client.request("POST", "/animation/signals", arguments)
         
         if response.get('success'):
             signals_connected = response.get('signals_connected', 0)
@@ -307,11 +306,10 @@ async def handle_configure_ui_signals(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error configuring UI signals: {str(e)}")]
 
-async def handle_setup_focus_navigation(arguments: dict) -> Sequence[TextContent]:
+async def handle_setup_focus_navigation(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Configure tab order and focus behavior"""
     try:
-        client = GodotClient()
-        response = await client.post('/animation/focus', arguments)
+        response = await client.request("POST", "/animation/focus", arguments)
         
         if response.get('success'):
             nodes_configured = response.get('nodes_configured', 0)
@@ -327,11 +325,10 @@ async def handle_setup_focus_navigation(arguments: dict) -> Sequence[TextContent
     except Exception as e:
         return [TextContent(type="text", text=f"Error setting up focus navigation: {str(e)}")]
 
-async def handle_start_ui_animation(arguments: dict) -> Sequence[TextContent]:
+async def handle_start_ui_animation(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Start or control existing UI animations"""
     try:
-        client = GodotClient()
-        response = await client.post('/animation/control', arguments)
+        response = await client.request("POST", "/animation/control", arguments)
         
         if response.get('success'):
             action = arguments.get('action', 'start')
@@ -347,11 +344,10 @@ async def handle_start_ui_animation(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error controlling animation: {str(e)}")]
 
-async def handle_create_ui_transition(arguments: dict) -> Sequence[TextContent]:
+async def handle_create_ui_transition(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Create smooth transitions between UI states"""
     try:
-        client = GodotClient()
-        response = await client.post('/animation/transition', arguments)
+        response = await client.request("POST", "/animation/transition", arguments)
         
         if response.get('success'):
             return [TextContent(
@@ -367,17 +363,18 @@ async def handle_create_ui_transition(arguments: dict) -> Sequence[TextContent]:
         return [TextContent(type="text", text=f"Error creating UI transition: {str(e)}")]
 
 # Main animation tool handler
-async def handle_animation_tool(name: str, arguments: dict, client: GodotClient = None) -> Sequence[TextContent]:
+@tool_handler(get_animation_tools)
+async def handle_animation_tool(name: str, arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Handle animation tool calls"""
     if name == "create_ui_animation":
-        return await handle_create_ui_animation(arguments)
+        return await handle_create_ui_animation(arguments, client)
     elif name == "configure_ui_signals":
-        return await handle_configure_ui_signals(arguments)
+        return await handle_configure_ui_signals(arguments, client)
     elif name == "setup_focus_navigation":
-        return await handle_setup_focus_navigation(arguments)
+        return await handle_setup_focus_navigation(arguments, client)
     elif name == "start_ui_animation":
-        return await handle_start_ui_animation(arguments)
+        return await handle_start_ui_animation(arguments, client)
     elif name == "create_ui_transition":
-        return await handle_create_ui_transition(arguments)
+        return await handle_create_ui_transition(arguments, client)
     else:
         return [TextContent(type="text", text=f"Unknown animation tool: {name}")]
\ No newline at end of file
@@ -5,6 +5,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from project_index import project_index
+from tools.registry import tool_handler
+
+# Resources listed per list_resources call unless the caller asks for another page size
+RESOURCE_LIST_LIMIT = 200
+RESOURCE_SORT_KEYS = ["path", "name", "modified", "type", "extension"]
 
 # Asset management tools
 def get_asset_tools() -> list[Tool]:
@@ -50,6 +56,35 @@ def get_asset_tools() -> list[Tool]:
                     "recursive": {
                         "type": "boolean",
                         "description": "Search subdirectories recursively (defaults to true)"
+                    },
+                    "glob": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Wildcard patterns (* and ?), e.g. ['player_*.png']; patterns containing '/' match the whole res:// path"
+                    },
+                    "resource_type": {
+                        "type": "string",
+                        "description": "Only resources of this class or a subclass, e.g. 'Texture2D' or 'Theme'"
+                    },
+                    "sort": {
+                        "type": "string",
+                        "enum": RESOURCE_SORT_KEYS,
+                        "description": "Sort order of the listing (defaults to path)"
+                    },
+                    "descending": {
+                        "type": "boolean",
+                        "description": "Reverse the sort order",
+                        "default": False
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of matches to skip, for paging",
+                        "default": 0
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": f"Maximum resources to return (defaults to {RESOURCE_LIST_LIMIT})",
+                        "default": RESOURCE_LIST_LIMIT
                     }
                 }
             }
@@ -78,6 +113,7 @@ def get_asset_tools() -> list[Tool]:
         )
     ]
 
+@tool_handler(get_asset_tools)
 async def handle_asset_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
     """Handle asset-related tool calls"""
     
@@ -103,24 +139,53 @@ async def handle_asset_tool(name: str, arguments: dict, godot_client: GodotClien
         directory = arguments.get("directory", "res://")
         file_types = arguments.get("file_types")
         recursive = arguments.get("recursive", True)
+        page = {
+            "offset": arguments.get("offset", 0),
+            "limit": arguments.get("limit", RESOURCE_LIST_LIMIT),
+            "sort": arguments.get("sort", ""),
+            "descending": arguments.get("descending", False),
+            "glob": arguments.get("glob")
+        }
         
-        result = await godot_client.list_resources(directory, file_types, recursive)
+        resource_type = arguments.get("resource_type", "")
+        
+        # Class filters go to the plugin: it knows the class hierarchy and already has
+        # every file's type from EditorFileSystem
+        if not resource_type and await project_index.ensure(godot_client):
+            result = project_index.list_resources(directory, file_types, recursive, **page)
+        else:
+            result = await godot_client.list_resources(directory, file_types, recursive, resource_type=resource_type, **page)
         
         if result.get("resources") is not None:
             resources = result.get("resources", [])
+            total = result.get("total_count", len(resources))
             if not resources:
                 return [TextContent(
                     type="text",
-                    text=f"No resources found in {directory}"
+                    text=f"No resources found in {directory}" + (f" past offset {page['offset']} ({total} total)" if total else "")
                 )]
             
-            resource_list = "\n".join([
-                f"- {resource['name']} ({resource['path']}) - {resource.get('size', 'unknown size')} - {resource.get('type', 'unknown type')}"
-                for resource in resources
-            ])
+            resource_lines = []
+            for resource in resources:
+                details = [resource["size"]] if resource.get("size") else []
+                resource_type = resource.get("type", "unknown type")
+                if resource.get("resource_type"):
+                    resource_type += f" ({resource['resource_type']})"
+                details.append(resource_type)
+                resource_lines.append(f"- {resource['name']} ({resource['path']}) - " + " - ".join(details))
+            
+            header = f"Found {total} resource(s) in {directory}"
+            if len(resources) < total:
+                start = result.get("offset", 0) + 1
+                header += f" (showing {start}-{start + len(resources) - 1})"
+            text = header + ":\n" + "\n".join(resource_lines)
+            if result.get("has_more"):
+                text += f"\n\nMore resources follow; call again with offset={result.get('next_offset')}"
+            if result.get("scanning"):
+                text += "\n\nThe editor is still scanning the project, so this listing may be incomplete"
             return [TextContent(
                 type="text",
-                text=f"Found {len(resources)} resource(s) in {directory}:\n{resource_list}"
+                text=text
             )]
         else:
             return [TextContent(
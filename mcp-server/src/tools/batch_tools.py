@@ -0,0 +1,103 @@
+from mcp.types import Tool, TextContent
+import json
+from typing import Any, Sequence
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from godot_client import GodotClient
+from tools.registry import tool_handler
+
+# Batch execution tools
+def get_batch_tools() -> list[Tool]:
+    return [
+        Tool(
+            name="batch_operations",
+            description="Run many Godot plugin operations in a single round trip, in order. Use this to build whole scenes or menus (e.g. dozens of add_node/set_node_properties calls) in one call instead of one call per node.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "description": "Ordered list of operations to run",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "endpoint": {
+                                    "type": "string",
+                                    "description": "Plugin endpoint path (e.g. '/node/add', '/node/properties/set', '/control/rect')"
+                                },
+                                "method": {
+                                    "type": "string",
+                                    "description": "HTTP method of the endpoint (defaults to POST)",
+                                    "enum": ["GET", "POST"]
+                                },
+                                "body": {
+                                    "type": "object",
+                                    "description": "Request body for the endpoint, same fields as the plugin endpoint expects (e.g. {'type': 'Label', 'name': 'Title', 'parent_path': 'VBox'} for /node/add)"
+                                }
+                            },
+                            "required": ["endpoint"]
+                        }
+                    },
+                    "stop_on_error": {
+                        "type": "boolean",
+                        "description": "Stop at the first failing operation (defaults to true). Set to false to run every operation and report failures individually."
+                    }
+                },
+                "required": ["operations"]
+            }
+        )
+    ]
+
+@tool_handler(get_batch_tools)
+async def handle_batch_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
+    """Handle batch-related tool calls"""
+    
+    if name == "batch_operations":
+        operations = arguments["operations"]
+        stop_on_error = arguments.get("stop_on_error", True)
+        
+        result = await godot_client.batch(operations, stop_on_error)
+        
+        if result.get("error") and not result.get("results"):
+            return [TextContent(
+                type="text",
+                text=f"Failed to run batch: {result.get('error', 'Unknown error')}"
+            )]
+        
+        results = result.get("results", [])
+        completed = result.get("completed", len(results))
+        failed = result.get("failed", 0)
+        total = result.get("total", len(operations))
+        
+        response_text = f"Batch finished: {completed - failed}/{total} operation(s) succeeded"
+        if failed:
+            response_text += f", {failed} failed"
+        if result.get("stopped_early"):
+            response_text += f" (stopped after operation {completed - 1}; {total - completed} not run)"
+        
+        lines = []
+        for op_result in results:
+            body = op_result.get("body", {})
+            status = op_result.get("status", 200)
+            prefix = f"[{op_result.get('index')}] {op_result.get('method', 'POST')} {op_result.get('endpoint')}"
+            if status >= 400:
+                error = body.get("error", "Unknown error") if isinstance(body, dict) else body
+                lines.append(f"{prefix}: FAILED - {error}")
+            else:
+                message = body.get("message", "ok") if isinstance(body, dict) else "ok"
+                lines.append(f"{prefix}: {message}")
+        
+        if lines:
+            response_text += ":\n" + "\n".join(lines)
+        
+        return [TextContent(
+            type="text",
+            text=response_text
+        )]
+    
+    else:
+        return [TextContent(
+            type="text",
+            text=f"Unknown batch tool: {name}"
+        )]
@@ -4,15 +4,47 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from tools.registry import tool_handler
+
+# Errors the plugin keeps are sequence-numbered; the last seq returned by get_godot_errors
+# is remembered so new_only can tail just what was logged since the previous call
+MAX_WAIT_SECONDS = 20.0
+SEVERITIES = ["error", "warning", "script_error", "shader_error"]
+
+error_cursor = -1
 
 def get_error_tools() -> list[Tool]:
     return [
         Tool(
             name="get_godot_errors",
-            description="Get recent errors and warnings from Godot editor",
+            description="Get recent errors and warnings from Godot editor (engine, script and shader errors). Identical errors are collapsed with a repeat count. Use new_only after an edit to see only errors logged since the previous call.",
             inputSchema={
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "new_only": {
+                        "type": "boolean",
+                        "description": "Only errors logged since the previous get_godot_errors call",
+                        "default": False
+                    },
+                    "since": {
+                        "type": "integer",
+                        "description": "Only errors with a sequence number greater than this (overrides new_only)"
+                    },
+                    "wait_seconds": {
+                        "type": "number",
+                        "description": f"Wait up to this many seconds (max {int(MAX_WAIT_SECONDS)}) for a matching error if there is none yet",
+                        "default": 0
+                    },
+                    "severity": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": SEVERITIES},
+                        "description": "Only these severities (default: all)"
+                    },
+                    "source": {
+                        "type": "string",
+                        "description": "Only errors whose source location contains this text, e.g. a script path"
+                    }
+                }
             }
         ),
         Tool(
@@ -25,18 +57,45 @@ def get_error_tools() -> list[Tool]:
         )
     ]
 
+@tool_handler(get_error_tools)
 async def handle_error_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
     """Handle error-related tool calls"""
+    global error_cursor
     
     if name == "get_godot_errors":
-        result = await godot_client.get_errors()
+        since = arguments.get("since")
+        if since is None:
+            since = error_cursor if arguments.get("new_only") else -1
+        wait_seconds = min(max(float(arguments.get("wait_seconds", 0) or 0), 0.0), MAX_WAIT_SECONDS)
+        result = await godot_client.get_errors(
+            since=since,
+            timeout=wait_seconds,
+            severity=arguments.get("severity"),
+            source=arguments.get("source", "")
+        )
         
         if result.get("errors") is not None:
             errors = result.get("errors", [])
+            last_seq = result.get("last_seq")
+            if last_seq is not None:
+                error_cursor = last_seq
+            
+            notes = []
+            if result.get("reset"):
+                notes.append("Some errors after the requested point were dropped from the log (or Godot restarted)")
+            if result.get("has_more"):
+                notes.append(f"More errors follow; call again with since={last_seq}")
+            elif last_seq is not None:
+                notes.append(f"Latest sequence number: {last_seq} (new_only or since={last_seq} returns only newer errors)")
+            if result.get("capture") == "plugin_only":
+                notes.append("Engine errors are only captured on Godot 4.5+; this log holds plugin errors only")
+            footer = "\n\n" + "\n".join(notes) if notes else ""
+            
             if not errors:
+                scope = "new " if since >= 0 else ""
                 return [TextContent(
                     type="text",
-                    text="No errors currently logged in Godot"
+                    text=f"No {scope}errors currently logged in Godot" + footer
                 )]
             
             error_list = []
@@ -45,15 +104,18 @@ async def handle_error_tool(name: str, arguments: dict, godot_client: GodotClien
                 error_type = error.get("type", "UNKNOWN")
                 message = error.get("message", "No message")
                 source = error.get("source", "")
+                count = error.get("count", 1)
                 
                 error_line = f"[{timestamp}] {error_type}: {message}"
                 if source:
                     error_line += f" (Source: {source})"
+                if count > 1:
+                    error_line += f" x{count}"
                 error_list.append(error_line)
             
             return [TextContent(
                 type="text",
-                text=f"Found {len(errors)} error(s) in Godot:\n\n" + "\n".join(error_list)
+                text=f"Found {len(errors)} error(s) in Godot:\n\n" + "\n".join(error_list) + footer
             )]
         else:
             return [TextContent(
@@ -5,6 +5,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from tools.registry import tool_handler
 
 # Project management tools
 def get_project_tools() -> list[Tool]:
@@ -66,6 +67,7 @@ def get_project_tools() -> list[Tool]:
         )
     ]
 
+@tool_handler(get_project_tools)
 async def handle_project_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
     """Handle project-related tool calls"""
     
@@ -0,0 +1,46 @@
+from mcp.types import Tool
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+ToolHandler = Callable[[str, dict, Any], Awaitable[Sequence[Any]]]
+
+def tool_handler(get_tools: Callable[[], list[Tool]]):
+    """Bind a module's tool handler to the function that lists its tools
+    
+    The handler is returned unchanged; ToolRegistry.register_handler() reads the
+    binding once at startup instead of rebuilding tool lists on every call.
+    """
+    def decorator(handler: ToolHandler) -> ToolHandler:
+        handler.get_tools = get_tools
+        return handler
+    return decorator
+
+class ToolRegistry:
+    """Tool name -> handler map and cached Tool list, built once at startup"""
+    
+    def __init__(self):
+        self.tools: list[Tool] = []
+        self.handlers: dict[str, ToolHandler] = {}
+    
+    def register(self, get_tools: Callable[[], list[Tool]], handler: ToolHandler):
+        """Register every tool returned by get_tools with handler"""
+        for tool in get_tools():
+            if tool.name in self.handlers:
+                raise ValueError(f"Duplicate tool name: {tool.name}")
+            self.tools.append(tool)
+            self.handlers[tool.name] = handler
+    
+    def register_handler(self, handler: ToolHandler):
+        """Register a handler decorated with @tool_handler"""
+        get_tools = getattr(handler, "get_tools", None)
+        if get_tools is None:
+            raise ValueError(f"{handler.__name__} is not decorated with @tool_handler")
+        self.register(get_tools, handler)
+    
+    def get_handler(self, name: str) -> Optional[ToolHandler]:
+        return self.handlers.get(name)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.handlers
+    
+    def __len__(self) -> int:
+        return len(self.tools)
@@ -5,6 +5,21 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from classdb import ClassDBStore
+from scene_tree import SceneTreeMirror, normalize_node_path
+from project_index import project_index
+import variant_codec
+from tools.registry import tool_handler
+
+# Class introspection and add_node type checks are answered from this snapshot
+# when it can be loaded, instead of a plugin round trip
+classdb_store = ClassDBStore()
+
+# Structure of the edited scene, refreshed from /scene/tree after any mutation
+scene_tree_mirror = SceneTreeMirror()
+
+# Longest listing get_scene_tree renders before asking for a narrower query
+MAX_TREE_LINES = 500
 
 # Scene management tools
 def get_scene_tools() -> list[Tool]:
@@ -58,6 +73,38 @@ def get_scene_tools() -> list[Tool]:
                 "properties": {}
             }
         ),
+        Tool(
+            name="get_scene_tree",
+            description="Show the hierarchy of the open scene (paths, types, groups, scripts, instanced scenes), or find nodes by type or group. Answered from a local copy of the tree that is refreshed after any change",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "root_path": {
+                        "type": "string",
+                        "description": "Only show this node and its descendants (default: scene root)",
+                        "default": "."
+                    },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Levels below root_path to show (-1 = unlimited)",
+                        "default": -1
+                    },
+                    "node_type": {
+                        "type": "string",
+                        "description": "Only list nodes of this class or its subclasses (e.g. 'Button', 'Control')"
+                    },
+                    "group": {
+                        "type": "string",
+                        "description": "Only list nodes in this group"
+                    },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Re-read the tree from the editor even if the local copy looks current",
+                        "default": False
+                    }
+                }
+            }
+        ),
         Tool(
             name="add_node",
             description="Add a new node to the current scene",
@@ -170,18 +217,61 @@ def get_scene_tools() -> list[Tool]:
         ),
         Tool(
             name="get_node_properties",
-            description="Get the properties of a node",
+            description="Get the properties of a node. Values are shown in Godot syntax (e.g. Vector2(10, 20), Color(1, 0, 0, 1)), which set_node_properties accepts back unchanged",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "node_path": {
                         "type": "string",
                         "description": "Path to the node"
+                    },
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these properties (optional, default all stored properties)"
+                    },
+                    "non_default_only": {
+                        "type": "boolean",
+                        "description": "Only return properties whose value differs from the default for the node's class or script",
+                        "default": False
                     }
                 },
                 "required": ["node_path"]
             }
         ),
+        Tool(
+            name="get_many_node_properties",
+            description="Get the properties of many nodes in one call: a list of node paths, or every node under a root down to a depth. Nodes that don't exist are reported individually. Use this instead of repeated get_node_properties calls",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "node_paths": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Paths of the nodes to read"
+                    },
+                    "root_path": {
+                        "type": "string",
+                        "description": "Read this node and its descendants instead of node_paths ('.' for the scene root)"
+                    },
+                    "depth": {
+                        "type": "integer",
+                        "description": "Levels below root_path to include (0 = root only, -1 = unlimited)",
+                        "default": -1
+                    },
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these properties (optional, default all stored properties)"
+                    },
+                    "non_default_only": {
+                        "type": "boolean",
+                        "description": "Only return properties whose value differs from the default for the node's class or script",
+                        "default": False
+                    }
+                }
+            }
+        ),
         Tool(
             name="set_node_properties",
             description="Set properties of a node",
@@ -194,7 +284,7 @@ def get_scene_tools() -> list[Tool]:
                     },
                     "properties": {
                         "type": "object",
-                        "description": "Dictionary of property names and values to set"
+                        "description": "Dictionary of property names and values to set. Non-JSON types can be given in Godot syntax (\"Vector2(10, 20)\", \"#ff8800\"), as a component list ([10, 20]), as typed JSON ({\"__type\": \"Vector2\", \"v\": [10, 20]}), or as a res:// path for resources"
                     }
                 },
                 "required": ["node_path", "properties"]
@@ -749,12 +839,49 @@ def get_scene_tools() -> list[Tool]:
                     "search": {
                         "type": "string",
                         "description": "Search term to filter class names (optional)"
+                    },
+                    "prefix": {
+                        "type": "string",
+                        "description": "Only classes whose name starts with this, case-insensitive (optional)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of classes to return (0 for all)",
+                        "default": 50
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of matching classes to skip",
+                        "default": 0
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "Continue after this class name (the cursor returned with the previous page); overrides offset"
+                    },
+                    "fields": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": ["parent", "can_instantiate", "is_node"]
+                        },
+                        "description": "Fields to include besides the class name (default: all)"
                     }
                 }
             }
         )
     ]
 
+def format_property_lines(properties: dict) -> list:
+    """One "  name: value" line per decoded property, values in Godot syntax
+    
+    Plain strings are shown unquoted so they can be passed back to set_node_properties as-is.
+    """
+    return [
+        f"  {key}: {value if type(value) is str else variant_codec.to_literal(value)}"
+        for key, value in properties.items()
+    ]
+
+@tool_handler(get_scene_tools)
 async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
     """Handle scene-related tool calls"""
     
@@ -782,10 +909,8 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
             if "/" in scene_path:
                 directory = "/".join(scene_path.split("/")[:-1])
                 if directory and directory != "res:":
-                    # Check if directory exists by attempting to get current scene info first
-                    # This validates connection and then we'll check directory
-                    health_check = await godot_client.health_check()
-                    if not health_check.get("connected", False):
+                    # Use the supervisor's cached connection state instead of a health round trip
+                    if not godot_client.is_available():
                         return [TextContent(
                             type="text",
                             text=f"Cannot connect to Godot plugin. Please ensure Godot is running with the plugin enabled."
@@ -850,14 +975,90 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
                 text="No scene currently open"
             )]
     
+    elif name == "get_scene_tree":
+        if not await scene_tree_mirror.refresh(godot_client, force=arguments.get("refresh", False)):
+            return [TextContent(
+                type="text",
+                text=f"Failed to get scene tree: {scene_tree_mirror.error}"
+            )]
+        
+        root_path = normalize_node_path(arguments.get("root_path", "."))
+        if not scene_tree_mirror.exists(root_path):
+            return [TextContent(
+                type="text",
+                text=f"Node not found: {root_path}"
+            )]
+        
+        paths = scene_tree_mirror.descendants(root_path, arguments.get("max_depth", -1))
+        node_type = arguments.get("node_type", "")
+        group = arguments.get("group", "")
+        if node_type or group:
+            selected = set(paths)
+            if node_type:
+                # Subclass matching needs the ClassDB snapshot; without it only exact types match
+                classdb = await classdb_store.get(godot_client)
+                selected &= set(scene_tree_mirror.nodes_by_type(node_type, classdb))
+            if group:
+                selected &= set(scene_tree_mirror.nodes_in_group(group))
+            paths = [path for path in paths if path in selected]
+            criteria = " and ".join(filter(None, [f"type {node_type}" if node_type else "", f"group '{group}'" if group else ""]))
+            header = f"{len(paths)} nodes with {criteria} under {root_path}:"
+            lines = [f"{path} ({scene_tree_mirror.get(path)['type']})" for path in paths]
+        else:
+            header = f"Scene tree of {scene_tree_mirror.scene_path or 'unsaved scene'} ({len(scene_tree_mirror.nodes)} nodes):"
+            base_depth = 0 if root_path == "." else root_path.count("/") + 1
+            lines = []
+            for path in paths:
+                node = scene_tree_mirror.get(path)
+                depth = (0 if path == "." else path.count("/") + 1) - base_depth
+                line = f"{'  ' * depth}{node['name']} ({node['type']})"
+                if node.get("instance"):
+                    line += f" instance of {node['instance']}"
+                if node.get("script"):
+                    line += f" script {node['script']}"
+                if node.get("groups"):
+                    line += f" groups: {', '.join(node['groups'])}"
+                lines.append(line)
+        
+        if len(lines) > MAX_TREE_LINES:
+            omitted = len(lines) - MAX_TREE_LINES
+            lines = lines[:MAX_TREE_LINES] + [f"... {omitted} more; narrow root_path, max_depth, node_type or group"]
+        if scene_tree_mirror.stale:
+            lines.append("Note: the scene changed while it was being read, so this snapshot may be out of date")
+        return [TextContent(
+            type="text",
+            text=header + ("\n" + "\n".join(lines) if lines else "")
+        )]
+    
     elif name == "add_node":
         node_type = arguments["type"]
         node_name = arguments["name"]
         parent_path = arguments.get("parent_path", "")
         
+        classdb = await classdb_store.get(godot_client)
+        # Classes the snapshot doesn't know may still exist (an extension registered after
+        # the dump), so only known abstract or non-Node classes are refused locally
+        if classdb is not None and classdb.has_class(node_type):
+            type_error = classdb.validate_node_type(node_type)
+            if type_error:
+                error_msg = type_error
+                suggestions = classdb.suggestions(node_type, nodes_only=True)
+                if suggestions:
+                    error_msg += f"\n\nDid you mean one of these? {', '.join(suggestions[:5])}"
+                    if len(suggestions) > 5:
+                        error_msg += f" (and {len(suggestions) - 5} more similar classes)"
+                error_msg += f"\n\nUse 'list_node_classes' to see all available node types or 'get_node_class_info' to learn about a specific class."
+                return [TextContent(
+                    type="text",
+                    text=f"Failed to add node: {error_msg}"
+                )]
+        
         result = await godot_client.add_node(node_type, node_name, parent_path)
         
         if result.get("success"):
+            if classdb is not None and not classdb.has_class(node_type):
+                # The editor knows a class the snapshot lacks; load a fresh one next time
+                classdb_store.invalidate()
             return [TextContent(
                 type="text",
                 text=f"Node '{node_name}' of type '{node_type}' added successfully"
@@ -867,9 +1068,12 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
             
             # If the error suggests invalid node type, try to provide suggestions
             if "Invalid node type" in error_msg or "does not exist" in error_msg:
-                class_info_result = await godot_client.get_node_class_info(node_type)
-                if not class_info_result.get("success") and class_info_result.get("suggestions"):
-                    suggestions = class_info_result.get("suggestions", [])
+                if classdb is not None:
+                    suggestions = classdb.suggestions(node_type, nodes_only=True)
+                else:
+                    class_info_result = await godot_client.get_node_class_info(node_type)
+                    suggestions = class_info_result.get("suggestions", []) if not class_info_result.get("success") else []
+                if suggestions:
                     error_msg += f"\n\nDid you mean one of these? {', '.join(suggestions[:5])}"
                     if len(suggestions) > 5:
                         error_msg += f" (and {len(suggestions) - 5} more similar classes)"
@@ -881,7 +1085,10 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
             )]
     
     elif name == "list_scenes":
-        result = await godot_client.list_scenes()
+        if await project_index.ensure(godot_client):
+            result = project_index.list_scenes()
+        else:
+            result = await godot_client.list_scenes()
         
         if result.get("scenes") is not None:
             scenes = result.get("scenes", [])
@@ -982,23 +1189,84 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
     
     elif name == "get_node_properties":
         node_path = arguments["node_path"]
+        names = arguments.get("names") or None
+        non_default_only = arguments.get("non_default_only", False)
         
-        result = await godot_client.get_node_properties(node_path)
+        result = await godot_client.get_node_properties(node_path, names, non_default_only)
         
         if result.get("success"):
             properties = result.get("properties", {})
             node_type = result.get("node_type", "Unknown")
+            missing = result.get("missing_properties", [])
+            missing_text = f"\nNo such properties: {', '.join(missing)}" if missing else ""
             
             if not properties:
+                state = "no properties changed from their defaults" if non_default_only else "no accessible properties"
+                return [TextContent(
+                    type="text",
+                    text=f"Node '{node_path}' (type: {node_type}) has {state}{missing_text}"
+                )]
+            
+            try:
+                properties = variant_codec.decode(properties)
+            except ValueError as e:
                 return [TextContent(
                     type="text",
-                    text=f"Node '{node_path}' (type: {node_type}) has no accessible properties"
+                    text=f"Failed to get node properties: malformed value from plugin: {e}"
                 )]
             
-            props_text = "\n".join([f"  {key}: {value}" for key, value in properties.items()])
+            props_text = "\n".join(format_property_lines(properties))
+            return [TextContent(
+                type="text",
+                text=f"{'Non-default properties' if non_default_only else 'Properties'} of node '{node_path}' (type: {node_type}):\n{props_text}{missing_text}"
+            )]
+        else:
+            return [TextContent(
+                type="text",
+                text=f"Failed to get node properties: {result.get('error', 'Unknown error')}"
+            )]
+    
+    elif name == "get_many_node_properties":
+        node_paths = arguments.get("node_paths") or None
+        root_path = arguments.get("root_path", "")
+        if not node_paths and not root_path:
+            return [TextContent(
+                type="text",
+                text="Failed to get node properties: provide node_paths or root_path"
+            )]
+        
+        result = await godot_client.get_many_node_properties(
+            node_paths, root_path, arguments.get("depth", -1),
+            arguments.get("names") or None, arguments.get("non_default_only", False)
+        )
+        
+        if result.get("success"):
+            sections = []
+            for entry in result.get("nodes", []):
+                if not entry.get("success"):
+                    sections.append(f"{entry.get('node_path')}: {entry.get('error', 'not found')}")
+                    continue
+                try:
+                    properties = variant_codec.decode(entry.get("properties", {}))
+                except ValueError as e:
+                    sections.append(f"{entry.get('node_path')}: malformed value from plugin: {e}")
+                    continue
+                lines = [f"{entry.get('node_path')} ({entry.get('node_type', 'Unknown')}):"]
+                lines += format_property_lines(properties)
+                if entry.get("missing_properties"):
+                    lines.append(f"  No such properties: {', '.join(entry['missing_properties'])}")
+                sections.append("\n".join(lines))
+            
+            missing = result.get("missing_nodes", [])
+            found = len(result.get("nodes", [])) - len(missing)
+            header = f"Properties of {found} nodes"
+            if missing:
+                header += f" ({len(missing)} not found)"
+            if result.get("truncated"):
+                header += " - truncated, narrow root_path or depth to see the rest"
             return [TextContent(
                 type="text",
-                text=f"Properties of node '{node_path}' (type: {node_type}):\n{props_text}"
+                text=header + ":\n" + "\n".join(sections)
             )]
         else:
             return [TextContent(
@@ -1010,17 +1278,30 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
         node_path = arguments["node_path"]
         properties = arguments["properties"]
         
+        # Reject malformed typed values here rather than after a round trip
+        try:
+            properties = {key: variant_codec.encode(variant_codec.decode(value)) for key, value in properties.items()}
+        except ValueError as e:
+            return [TextContent(
+                type="text",
+                text=f"Failed to set node properties: {e}"
+            )]
+        
         result = await godot_client.set_node_properties(node_path, properties)
         
         if result.get("success"):
             set_props = result.get("set_properties", [])
             failed_props = result.get("failed_properties", [])
+            errors = result.get("errors", {})
             
             response_text = f"Node '{node_path}' properties updated"
             if set_props:
                 response_text += f"\nSet successfully: {', '.join(set_props)}"
             if failed_props:
                 response_text += f"\nFailed to set: {', '.join(failed_props)}"
+                for prop in failed_props:
+                    if prop in errors:
+                        response_text += f"\n  {prop}: {errors[prop]}"
             
             return [TextContent(
                 type="text",
@@ -1363,7 +1644,11 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
     elif name == "get_node_class_info":
         class_name = arguments["class_name"]
         
-        result = await godot_client.get_node_class_info(class_name)
+        classdb = await classdb_store.get(godot_client)
+        if classdb is not None:
+            result = classdb.class_info(class_name)
+        else:
+            result = await godot_client.get_node_class_info(class_name)
         
         if result.get("success"):
             info = result.get("info", {})
@@ -1410,8 +1695,17 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
     elif name == "list_node_classes":
         filter_type = arguments.get("filter", "node")
         search_term = arguments.get("search", "")
+        prefix = arguments.get("prefix", "")
+        limit = arguments.get("limit", 50)
+        offset = arguments.get("offset", 0)
+        cursor = arguments.get("cursor", "")
+        fields = arguments.get("fields")
         
-        result = await godot_client.list_node_classes(filter_type, search_term)
+        classdb = await classdb_store.get(godot_client)
+        if classdb is not None:
+            result = classdb.list_classes(filter_type, search_term, prefix, offset, limit, cursor, fields)
+        else:
+            result = await godot_client.list_node_classes(filter_type, search_term, prefix, offset, limit, cursor, fields)
         
         if result.get("success"):
             classes = result.get("classes", [])
@@ -1420,7 +1714,7 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
             if not classes:
                 return [TextContent(
                     type="text",
-                    text=f"No classes found with filter '{filter_type}'" + (f" and search '{search_term}'" if search_term else "")
+                    text=f"No classes found with filter '{filter_type}'" + (f" and search '{search_term}'" if search_term else "") + (f" and prefix '{prefix}'" if prefix else "")
                 )]
             
             response_text = f"Found {total_count} classes"
@@ -1428,26 +1722,23 @@ async def handle_scene_tool(name: str, arguments: dict, godot_client: GodotClien
                 response_text += f" (filter: {filter_type})"
             if search_term:
                 response_text += f" (search: {search_term})"
-            response_text += ":\n\n"
-            
-            # Group by instantiable vs non-instantiable
-            instantiable = [cls for cls in classes if cls.get('can_instantiate', False)]
-            non_instantiable = [cls for cls in classes if not cls.get('can_instantiate', False)]
+            if prefix:
+                response_text += f" (prefix: {prefix})"
+            first = result.get("offset", 0) + 1
+            response_text += f", showing {first}-{first + len(classes) - 1}:\n\n"
             
-            if instantiable:
-                response_text += "**Instantiable classes:**\n"
-                for cls in instantiable[:20]:  # Show first 20
-                    response_text += f"- {cls['name']}"
-                    if cls.get('parent') and cls['parent'] != 'Object':
-                        response_text += f" (extends {cls['parent']})"
-                    response_text += "\n"
-                if len(instantiable) > 20:
-                    response_text += f"... and {len(instantiable) - 20} more instantiable classes\n"
+            for cls in classes:
+                response_text += f"- {cls['name']}"
+                if cls.get('parent') and cls['parent'] != 'Object':
+                    response_text += f" (extends {cls['parent']})"
+                if cls.get('can_instantiate') is False:
+                    response_text += " (abstract)"
+                if cls.get('is_node') is False:
+                    response_text += " (not a node)"
+                response_text += "\n"
             
-            if non_instantiable and len(non_instantiable) <= 10:
-                response_text += "\n**Abstract/Non-instantiable classes:**\n"
-                for cls in non_instantiable:
-                    response_text += f"- {cls['name']} (abstract)\n"
+            if result.get("has_more"):
+                response_text += f"\nMore classes available: call list_node_classes again with cursor '{result.get('next_cursor')}'"
             
             return [TextContent(
                 type="text",
@@ -4,6 +4,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from project_index import project_index
+from tools.registry import tool_handler
 
 def get_script_tools() -> list[Tool]:
     return [
@@ -89,6 +91,7 @@ def get_script_tools() -> list[Tool]:
         )
     ]
 
+@tool_handler(get_script_tools)
 async def handle_script_tool(name: str, arguments: dict, godot_client: GodotClient) -> Sequence[TextContent]:
     """Handle script-related tool calls"""
     
@@ -111,7 +114,10 @@ async def handle_script_tool(name: str, arguments: dict, godot_client: GodotClie
             )]
     
     elif name == "list_scripts":
-        result = await godot_client.list_scripts()
+        if await project_index.ensure(godot_client):
+            result = project_index.list_scripts()
+        else:
+            result = await godot_client.list_scripts()
         
         if result.get("scripts") is not None:
             scripts = result.get("scripts", [])
@@ -5,6 +5,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from godot_client import GodotClient
+from project_index import project_index
+from tools.registry import tool_handler
 
 # Theme management tools
 def get_theme_tools() -> list[Tool]:
@@ -85,7 +87,7 @@ def get_theme_tools() -> list[Tool]:
                     "recursive": {
                         "type": "boolean",
                         "description": "Whether to apply theme recursively to all child Control nodes",
-                        "default": true
+                        "default": True
                     }
                 },
                 "required": ["theme_path"]
@@ -163,7 +165,7 @@ def get_theme_tools() -> list[Tool]:
                     "overwrite": {
                         "type": "boolean",
                         "description": "Whether to overwrite existing theme with same name",
-                        "default": false
+                        "default": False
                     }
                 },
                 "required": ["source_path"]
@@ -192,7 +194,7 @@ def get_theme_tools() -> list[Tool]:
                     "include_dependencies": {
                         "type": "boolean",
                         "description": "Whether to include dependent resources (fonts, textures)",
-                        "default": true
+                        "default": True
                     }
                 },
                 "required": ["theme_path", "export_path"]
@@ -212,7 +214,7 @@ def get_theme_tools() -> list[Tool]:
                     "recursive": {
                         "type": "boolean",
                         "description": "Whether to search recursively in subdirectories",
-                        "default": true
+                        "default": True
                     }
                 }
             }
@@ -239,11 +241,10 @@ def get_theme_tools() -> list[Tool]:
         )
     ]
 
-async def handle_create_theme(arguments: dict) -> Sequence[TextContent]:
+async def handle_create_theme(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Create a new Theme resource with specified properties"""
     try:
-        client = GodotClient()
-        response = await client.post('/theme/create', arguments)
+        response = await client.request("POST", "/theme/create", arguments)
         
         if response.get('success'):
             return [TextContent(
@@ -258,11 +259,10 @@ async def handle_create_theme(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error creating theme: {str(e)}")]
 
-async def handle_apply_theme(arguments: dict) -> Sequence[TextContent]:
+async def handle_apply_theme(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Apply a theme to Control nodes or scenes"""
     try:
-        client = GodotClient()
-        response = await client.post('/theme/apply', arguments)
+        response = await client.request("POST", "/theme/apply", arguments)
         
         if response.get('success'):
             target_info = response.get('applied_to', 'unknown target')
@@ -278,11 +278,10 @@ async def handle_apply_theme(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error applying theme: {str(e)}")]
 
-async def handle_modify_theme_properties(arguments: dict) -> Sequence[TextContent]:
+async def handle_modify_theme_properties(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Modify properties of an existing theme"""
     try:
-        client = GodotClient()
-        response = await client.post('/theme/modify', arguments)
+        response = await client.request("POST", "/theme/modify", arguments)
         
         if response.get('success'):
             modified_count = response.get('properties_modified', 0)
@@ -299,11 +298,10 @@ async def handle_modify_theme_properties(arguments: dict) -> Sequence[TextConten
     except Exception as e:
         return [TextContent(type="text", text=f"Error modifying theme: {str(e)}")]
 
-async def handle_import_theme(arguments: dict) -> Sequence[TextContent]:
+async def handle_import_theme(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Import external theme files"""
     try:
-        client = GodotClient()
-        response = await client.post('/theme/import', arguments)
+        response = await client.request("POST", "/theme/import", arguments)
         
         if response.get('success'):
             return [TextContent(
@@ -318,11 +316,10 @@ async def handle_import_theme(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error importing theme: {str(e)}")]
 
-async def handle_export_theme(arguments: dict) -> Sequence[TextContent]:
+async def handle_export_theme(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Export theme resources for external use"""
     try:
-        client = GodotClient()
-        response = await client.post('/theme/export', arguments)
+        response = await client.request("POST", "/theme/export", arguments)
         
         if response.get('success'):
             return [TextContent(
@@ -337,11 +334,14 @@ async def handle_export_theme(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error exporting theme: {str(e)}")]
 
-async def handle_list_themes(arguments: dict) -> Sequence[TextContent]:
+async def handle_list_themes(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """List all theme resources in the project"""
     try:
-        client = GodotClient()
-        response = await client.get('/theme/list', arguments)
+        response = None
+        if await project_index.ensure(client):
+            response = project_index.list_themes(arguments.get("directory", "res://"), arguments.get("recursive", True))
+        if response is None:
+            response = await client.request("GET", "/theme/list", arguments)
         
         if response.get('success'):
             themes = response.get('themes', [])
@@ -364,11 +364,10 @@ async def handle_list_themes(arguments: dict) -> Sequence[TextContent]:
     except Exception as e:
         return [TextContent(type="text", text=f"Error listing themes: {str(e)}")]
 
-async def handle_get_theme_properties(arguments: dict) -> Sequence[TextContent]:
+async def handle_get_theme_properties(arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Get properties from an existing theme"""
     try:
-        client = GodotClient()
-        response = await client.post('/theme/properties/get', arguments)
+        response = await client.request("POST", "/theme/properties/get", arguments)
         
         if response.get('success'):
             properties = response.get('properties', {})
@@ -401,21 +400,22 @@ async def handle_get_theme_properties(arguments: dict) -> Sequence[TextContent]:
         return [TextContent(type="text", text=f"Error getting theme properties: {str(e)}")]
 
 # Main theme tool handler
-async def handle_theme_tool(name: str, arguments: dict, client: GodotClient = None) -> Sequence[TextContent]:
+@tool_handler(get_theme_tools)
+async def handle_theme_tool(name: str, arguments: dict, client: GodotClient) -> Sequence[TextContent]:
     """Handle theme tool calls"""
     if name == "create_theme":
-        return await handle_create_theme(arguments)
+        return await handle_create_theme(arguments, client)
     elif name == "apply_theme":
-        return await handle_apply_theme(arguments)
+        return await handle_apply_theme(arguments, client)
     elif name == "modify_theme_properties":
-        return await handle_modify_theme_properties(arguments)
+        return await handle_modify_theme_properties(arguments, client)
     elif name == "import_theme":
-        return await handle_import_theme(arguments)
+        return await handle_import_theme(arguments, client)
     elif name == "export_theme":
-        return await handle_export_theme(arguments)
+        return await handle_export_theme(arguments, client)
     elif name == "list_themes":
-        return await handle_list_themes(arguments)
+        return await handle_list_themes(arguments, client)
     elif name == "get_theme_properties":
-        return await handle_get_theme_properties(arguments)
+        return await handle_get_theme_properties(arguments, client)
     else:
         return [TextContent(type="text", text=f"Unknown theme tool: {name}")]
\ No newline at end of file
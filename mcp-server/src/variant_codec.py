@@ -0,0 +1,177 @@
+"""Typed JSON encoding of Godot Variants, the Python side of the plugin's variant_codec.gd
+
+Property values JSON has no type for travel as {"__type": "Vector2", "v": [10, 20]}: math
+types as their components in constructor order, NodePath / StringName as a string, packed
+arrays as a list, resources by path. decode() turns them into the named tuples and str
+subclasses below, encode() turns those back into the tagged form, and to_literal() renders
+a value in Godot's own syntax ("Vector2(10, 20)"), which the plugin also accepts on writes.
+"""
+
+import json
+import math
+from collections import namedtuple
+from typing import Any
+
+Vector2 = namedtuple("Vector2", "x y")
+Vector2i = namedtuple("Vector2i", "x y")
+Vector3 = namedtuple("Vector3", "x y z")
+Vector3i = namedtuple("Vector3i", "x y z")
+Vector4 = namedtuple("Vector4", "x y z w")
+Vector4i = namedtuple("Vector4i", "x y z w")
+Rect2 = namedtuple("Rect2", "x y width height")
+Rect2i = namedtuple("Rect2i", "x y width height")
+Color = namedtuple("Color", "r g b a")
+Quaternion = namedtuple("Quaternion", "x y z w")
+Plane = namedtuple("Plane", "x y z d")
+AABB = namedtuple("AABB", "x y z width height depth")
+Transform2D = namedtuple("Transform2D", "xx xy yx yy ox oy")
+Basis = namedtuple("Basis", "xx xy xz yx yy yz zx zy zz")
+Transform3D = namedtuple("Transform3D", "xx xy xz yx yy yz zx zy zz ox oy oz")
+Projection = namedtuple("Projection", "xx xy xz xw yx yy yz yw zx zy zz zw wx wy wz ww")
+
+# Resource reference; path is empty for resources embedded in the scene
+Resource = namedtuple("Resource", "path class_name")
+
+# Packed*Array; items of PackedVector2Array, PackedVector3Array and PackedColorArray are named tuples
+PackedArray = namedtuple("PackedArray", "type items")
+
+# Values that can be read but not written back (RID, Callable, Signal, non-resource Object)
+Opaque = namedtuple("Opaque", "type data")
+
+MATH_TYPES = {cls.__name__: cls for cls in (
+    Vector2, Vector2i, Vector3, Vector3i, Vector4, Vector4i, Rect2, Rect2i, Color, Quaternion,
+    Plane, AABB, Transform2D, Basis, Transform3D, Projection
+)}
+MATH_CLASSES = tuple(MATH_TYPES.values())
+
+PACKED_ELEMENT_TYPES = {
+    "PackedByteArray": None,
+    "PackedInt32Array": None,
+    "PackedInt64Array": None,
+    "PackedFloat32Array": None,
+    "PackedFloat64Array": None,
+    "PackedStringArray": None,
+    "PackedVector2Array": Vector2,
+    "PackedVector3Array": Vector3,
+    "PackedColorArray": Color
+}
+
+
+class NodePath(str):
+    """A Godot NodePath; compares equal to the plain path string"""
+    __slots__ = ()
+
+
+class StringName(str):
+    """A Godot StringName; compares equal to the plain string"""
+    __slots__ = ()
+
+
+def decode(data: Any) -> Any:
+    """Turn a JSON value from the plugin into Python values, recursing into lists and dicts
+    
+    Raises ValueError for a tagged value with the wrong shape.
+    """
+    if isinstance(data, list):
+        return [decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "__type" not in data:
+        return {key: decode(value) for key, value in data.items()}
+    
+    type_name = data["__type"]
+    v = data.get("v")
+    if type_name in MATH_TYPES:
+        return _from_components(MATH_TYPES[type_name], v)
+    if type_name == "NodePath":
+        return NodePath(v if v is not None else "")
+    if type_name == "StringName":
+        return StringName(v if v is not None else "")
+    if type_name == "Resource":
+        return Resource(data.get("path", ""), data.get("class", "Resource"))
+    if type_name in PACKED_ELEMENT_TYPES:
+        if not isinstance(v, list):
+            raise ValueError(f"{type_name} needs a list in \"v\"")
+        element_type = PACKED_ELEMENT_TYPES[type_name]
+        items = [_from_components(element_type, item) for item in v] if element_type else list(v)
+        return PackedArray(type_name, items)
+    if type_name == "Dictionary":
+        if not isinstance(v, list) or not all(isinstance(pair, list) and len(pair) == 2 for pair in v):
+            raise ValueError("Dictionary needs a list of [key, value] pairs")
+        return {_hashable(decode(key)): decode(value) for key, value in v}
+    return Opaque(type_name, {key: value for key, value in data.items() if key != "__type"})
+
+def encode(value: Any) -> Any:
+    """Turn Python values into the JSON the plugin accepts; plain JSON values pass through unchanged"""
+    if isinstance(value, NodePath):
+        return {"__type": "NodePath", "v": str(value)}
+    if isinstance(value, StringName):
+        return {"__type": "StringName", "v": str(value)}
+    if isinstance(value, Resource):
+        return {"__type": "Resource", "class": value.class_name, "path": value.path}
+    if isinstance(value, PackedArray):
+        items = [list(item) if isinstance(item, tuple) else item for item in value.items]
+        return {"__type": value.type, "v": items}
+    if isinstance(value, Opaque):
+        return {"__type": value.type, **value.data}
+    if isinstance(value, MATH_CLASSES):
+        return {"__type": type(value).__name__, "v": list(value)}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        if all(type(key) is str for key in value):
+            return {key: encode(item) for key, item in value.items()}
+        return {"__type": "Dictionary", "v": [[encode(key), encode(item)] for key, item in value.items()]}
+    return value
+
+def to_literal(value: Any) -> str:
+    """Render a decoded value in Godot syntax, e.g. Vector2(10, 20) or NodePath("Player/Sprite")"""
+    if isinstance(value, NodePath):
+        return f"NodePath({json.dumps(str(value))})"
+    if isinstance(value, StringName):
+        return f"&{json.dumps(str(value))}"
+    if isinstance(value, Resource):
+        # The bare path is what the plugin accepts for resource-typed properties
+        return value.path if value.path else f"<{value.class_name}>"
+    if isinstance(value, PackedArray):
+        return f"{value.type}([{', '.join(to_literal(item) for item in value.items)}])"
+    if isinstance(value, Opaque):
+        detail = value.data.get("v") or value.data.get("class")
+        return f"<{value.type} {detail}>" if detail else f"<{value.type}>"
+    if isinstance(value, MATH_CLASSES):
+        return f"{type(value).__name__}({', '.join(_number(c) for c in value)})"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(to_literal(item) for item in value)}]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{to_literal(key)}: {to_literal(item)}" for key, item in value.items()) + "}"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, float):
+        return _number(value)
+    if isinstance(value, str):
+        return json.dumps(value)
+    return str(value)
+
+def _from_components(cls, v):
+    if not isinstance(v, list) or len(v) != len(cls._fields):
+        raise ValueError(f"{cls.__name__} needs {len(cls._fields)} components, got {json.dumps(v)}")
+    if not all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in v):
+        raise ValueError(f"{cls.__name__} components must be numbers, got {json.dumps(v)}")
+    return cls(*v)
+
+def _number(c) -> str:
+    """Whole floats without the trailing .0, as Godot prints them"""
+    if isinstance(c, float) and math.isfinite(c) and c.is_integer():
+        return str(int(c))
+    return str(c)
+
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, PackedArray):
+        return PackedArray(value.type, tuple(value.items))
+    return value
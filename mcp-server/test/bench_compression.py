@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Measure bytes on the wire and latency for large plugin responses with and
+without gzip/deflate response compression
+
+Requires a running Godot editor with the claude_mcp plugin enabled.
+Usage: python test/bench_compression.py [--repeat N] [--base-url URL]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.godot_client import GodotClient
+
+# (label, path, query params) for the largest read endpoints
+ENDPOINTS = [
+    ("list_node_classes(all)", "/node/list_classes", {"filter": "all"}),
+    ("get_project_settings", "/project/settings", {}),
+    ("list_resources", "/asset/list", {"directory": "res://", "recursive": True}),
+]
+
+
+async def measure(compression: bool, path: str, params: dict, repeat: int, base_url: str) -> tuple:
+    """Return (wire bytes, decoded bytes, median latency ms) for one endpoint"""
+    client = GodotClient(base_url, compression=compression)
+    latencies = []
+    wire_bytes = decoded_bytes = 0
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = await client.client.get(f"{base_url}{path}", params=params)
+            response.raise_for_status()
+            body = response.content
+            latencies.append((time.perf_counter() - start) * 1000)
+            wire_bytes = response.num_bytes_downloaded
+            decoded_bytes = len(body)
+    finally:
+        await client.close()
+    return wire_bytes, decoded_bytes, statistics.median(latencies)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8080")
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<24} {'mode':<10} {'wire bytes':>12} {'json bytes':>12} {'median ms':>10}")
+    try:
+        for label, path, params in ENDPOINTS:
+            for compression in (False, True):
+                wire, decoded, latency = await measure(compression, path, params, args.repeat, args.base_url)
+                mode = "gzip" if compression else "identity"
+                print(f"{label:<24} {mode:<10} {wire:>12} {decoded:>12} {latency:>10.2f}")
+    except Exception as e:
+        print(f"❌ Plugin not reachable: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of per-call tool dispatch overhead in GodotMCPServer
+
+Compares the previous call_tool lookup (rebuilding every module's tool list and
+name list on each call) with the precomputed ToolRegistry. No plugin needed.
+Usage: python test/bench_dispatch.py [--iterations N]
+"""
+
+import argparse
+import sys
+import os
+import timeit
+
+# Add parent and src directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from src.server import build_tool_registry, TOOL_HANDLERS, get_health_tools
+
+
+def legacy_lookup(name: str):
+    """Previous call_tool behaviour: rebuild each tool list until the name matches"""
+    if name == "godot_health_check":
+        return get_health_tools
+    for handler in TOOL_HANDLERS:
+        names = [tool.name for tool in handler.get_tools()]
+        if name in names:
+            return handler
+    return None
+
+
+def legacy_list_tools():
+    """Previous list_tools behaviour: rebuild every Tool on each request"""
+    tools = []
+    for handler in TOOL_HANDLERS:
+        tools.extend(handler.get_tools())
+    tools.extend(get_health_tools())
+    return tools
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    registry = build_tool_registry()
+    cases = [
+        ("call_tool create_scene (first module)", "create_scene"),
+        ("call_tool create_ui_transition (late module)", "create_ui_transition"),
+        ("call_tool unknown tool (full scan)", "nonexistent_tool"),
+    ]
+
+    print(f"{'case':<46} {'before (us)':>12} {'after (us)':>12} {'speedup':>9}")
+    for label, name in cases:
+        before = timeit.timeit(lambda: legacy_lookup(name), number=args.iterations) / args.iterations * 1e6
+        after = timeit.timeit(lambda: registry.get_handler(name), number=args.iterations) / args.iterations * 1e6
+        print(f"{label:<46} {before:>12.2f} {after:>12.3f} {before / after:>8.0f}x")
+
+    before = timeit.timeit(legacy_list_tools, number=args.iterations) / args.iterations * 1e6
+    after = timeit.timeit(lambda: registry.tools, number=args.iterations) / args.iterations * 1e6
+    print(f"{'list_tools':<46} {before:>12.2f} {after:>12.3f} {before / after:>8.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
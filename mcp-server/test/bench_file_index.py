@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the project file index behind list_scenes/list_scripts/list_resources/list_themes
+
+Builds a synthetic Godot project (50k files by default) in a temporary directory and
+compares a full recursive walk per call (what the plugin's DirAccess listings do) with
+the index: initial os.scandir pass, per-listing query time, and how long a batch of
+new files takes to show up through inotify. No plugin needed.
+Usage: python test/bench_file_index.py [--files N] [--repeat N] [--keep DIR]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Add parent and src directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from src.project_index import ProjectIndex, read_resource_type
+
+# Extension mix of a texture-heavy project; every imported asset has a .import sidecar
+EXTENSIONS = [("png", 30), ("ogg", 6), ("glb", 3), ("tscn", 8), ("gd", 8), ("tres", 6), ("res", 1), ("ttf", 1)]
+IMPORTED = {"png", "ogg", "glb", "ttf"}
+
+
+class StubClient:
+    """Just enough of GodotClient for ProjectIndex.ensure()"""
+
+    def __init__(self, root):
+        self.root = root
+
+    async def health_check(self):
+        return {"status": "ok", "project_path": self.root}
+
+    def mutation_count(self):
+        return 0
+
+
+def build_project(root: str, file_count: int) -> int:
+    rng = random.Random(1)
+    with open(os.path.join(root, "project.godot"), "w") as f:
+        f.write("config_version=5\n")
+    directories = [""]
+    for top in ["art", "audio", "models", "scenes", "scripts", "ui", "addons"]:
+        for i in range(12):
+            for j in range(20):
+                directories.append(f"{top}/group_{i}/set_{j}")
+    for directory in directories:
+        os.makedirs(os.path.join(root, directory), exist_ok=True)
+
+    names, weights = zip(*EXTENSIONS)
+    written = 0
+    while written < file_count:
+        extension = rng.choices(names, weights)[0]
+        path = os.path.join(root, rng.choice(directories), f"file_{written}.{extension}")
+        with open(path, "w") as f:
+            if extension == "tres":
+                f.write(f'[gd_resource type="{"Theme" if written % 20 == 0 else "StyleBoxFlat"}" format=3]\n')
+            else:
+                f.write("x" * (written % 64))
+        written += 1
+        if extension in IMPORTED and written < file_count:
+            open(path + ".import", "w").close()
+            written += 1
+    return len(directories)
+
+
+def walk(root: str, match):
+    """One full recursive listing with a stat per match, like the plugin's DirAccess scans"""
+    results = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+        for name in files:
+            path = os.path.join(directory, name)
+            if match(path):
+                results.append((path, os.stat(path).st_size))
+    return results
+
+
+def timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - started) / repeat * 1e3, result
+
+
+async def main_async(args) -> int:
+    root = args.keep or tempfile.mkdtemp(prefix="godot-index-bench-")
+    try:
+        if not os.path.isfile(os.path.join(root, "project.godot")):
+            started = time.perf_counter()
+            directory_count = build_project(root, args.files)
+            print(f"Built {args.files} files in {directory_count} directories ({time.perf_counter() - started:.1f}s)")
+
+        index = ProjectIndex()
+        client = StubClient(root)
+        started = time.perf_counter()
+        await index.ensure(client)
+        scan_ms = (time.perf_counter() - started) * 1e3
+        print(f"Initial scan: {len(index.files)} files in {scan_ms:.0f} ms ({index.state()['mode']})\n")
+
+        cases = [
+            ("list_scenes", lambda path: path.endswith(".tscn"), index.list_scenes),
+            ("list_scripts", lambda path: path.endswith(".gd"), index.list_scripts),
+            ("list_resources .png", lambda path: path.endswith(".png"), lambda: index.list_resources("res://", [".png"])),
+            ("list_resources art/group_3", None, lambda: index.list_resources("res://art/group_3")),
+            ("list_themes", lambda path: path.endswith((".tres", ".res")) and read_resource_type(path) == "Theme", index.list_themes),
+        ]
+        print(f"{'listing':<28} {'matches':>8} {'walk (ms)':>10} {'index (ms)':>11} {'speedup':>8}")
+        for label, match, query in cases:
+            if match is None:
+                walk_ms, _ = timed(lambda: walk(os.path.join(root, "art", "group_3"), lambda path: True), args.repeat)
+            else:
+                walk_ms, _ = timed(lambda: walk(root, match), args.repeat)
+            index_ms, result = timed(query, args.repeat)
+            matches = result.get("count", 0)
+            print(f"{label:<28} {matches:>8} {walk_ms:>10.1f} {index_ms:>11.2f} {walk_ms / max(index_ms, 1e-6):>7.0f}x")
+
+        if index.is_live():
+            batch = 200
+            started = time.perf_counter()
+            for i in range(batch):
+                with open(os.path.join(root, "scenes", "group_0", "set_0", f"new_{i}.tscn"), "w") as f:
+                    f.write("x")
+            written_ms = (time.perf_counter() - started) * 1e3
+            started = time.perf_counter()
+            await index.ensure(client)
+            applied_ms = (time.perf_counter() - started) * 1e3
+            visible = sum(1 for s in index.list_scenes()["scenes"] if s["name"].startswith("new_"))
+            print(f"\nIncremental: {batch} new scenes written in {written_ms:.1f} ms, "
+                  f"{visible} visible after applying events in {applied_ms:.1f} ms (scans: {index.state()['scans']})")
+        index.close()
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", help="Build (or reuse) the synthetic project in this directory instead of a temp dir")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
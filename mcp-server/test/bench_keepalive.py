@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential GodotClient call latency with and without keep-alive
+
+Requires a running Godot editor with the claude_mcp plugin enabled.
+Usage: python test/bench_keepalive.py [--calls N] [--base-url URL]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.godot_client import GodotClient
+
+
+async def run_sequential(keep_alive: bool, calls: int, base_url: str) -> list:
+    """Issue `calls` sequential health checks and return per-call latencies in ms"""
+    client = GodotClient(base_url, keep_alive=keep_alive)
+    latencies = []
+    try:
+        # Warm up so the first handshake is not counted against keep-alive
+        await client.health_check()
+        for _ in range(calls):
+            start = time.perf_counter()
+            result = await client.health_check()
+            latencies.append((time.perf_counter() - start) * 1000)
+            if result.get("error"):
+                raise RuntimeError(f"Plugin not reachable: {result['error']}")
+    finally:
+        await client.close()
+    return latencies
+
+
+def report(label: str, latencies: list):
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<16} total {sum(latencies):8.1f} ms | "
+          f"mean {statistics.mean(latencies):6.2f} ms | "
+          f"median {statistics.median(latencies):6.2f} ms | p95 {p95:6.2f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8080")
+    args = parser.parse_args()
+
+    print(f"Sequential /health calls: {args.calls}")
+    try:
+        without = await run_sequential(False, args.calls, args.base_url)
+        with_keep_alive = await run_sequential(True, args.calls, args.base_url)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    report("no keep-alive", without)
+    report("keep-alive", with_keep_alive)
+    speedup = sum(without) / sum(with_keep_alive)
+    print(f"Speedup: {speedup:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of class-name suggestions for add_node / get_node_class_info errors
+
+Times ClassNameIndex lookups (trigram index + BK-tree) for typical misspellings.
+Uses a persisted ClassDB snapshot when given one (see ~/.cache/godot-mcp), otherwise
+a synthetic list of ~1000 Godot-like class names. No plugin needed.
+Usage: python test/bench_suggest.py [--snapshot PATH] [--iterations N]
+"""
+
+import argparse
+import json
+import random
+import sys
+import os
+import timeit
+
+# Add parent and src directories to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
+
+from src.classdb import ClassNameIndex
+
+QUERIES = ["Lable", "Buton", "RigidBody2d", "rigid_body_2d", "CollisonShape2D", "AnimationPlyer",
+           "VBoxContaner", "Sprite", "Camera", "Tmier", "TextureRec", "xyzzy"]
+
+COMMON = ["Node", "Node2D", "Node3D", "Control", "Label", "Button", "Timer", "Sprite2D", "Sprite3D",
+          "AnimatedSprite2D", "RigidBody2D", "RigidBody3D", "StaticBody2D", "CharacterBody2D",
+          "CollisionShape2D", "CollisionShape3D", "VBoxContainer", "HBoxContainer", "AnimationPlayer",
+          "Camera2D", "Camera3D", "TextureRect", "ColorRect", "LineEdit", "TextEdit", "Area2D"]
+
+
+def synthetic_names(count: int = 1000) -> list:
+    """Godot-like class names: the common ones plus prefix/suffix combinations"""
+    prefixes = ["", "Editor", "Visual", "GLTF", "Physics", "Shader", "Resource", "Texture",
+                "Audio", "Animation", "Navigation", "Multiplayer", "Text", "Theme", "Tile"]
+    suffixes = ["Node", "Resource", "Server", "Effect", "Plugin", "Importer", "Property", "State",
+                "Transition", "Blend", "Data", "Layer", "Map", "Shape", "Mesh", "Player", "Stream"]
+    rng = random.Random(1)
+    names = set(COMMON)
+    while len(names) < count:
+        names.add(rng.choice(prefixes) + rng.choice(suffixes) + rng.choice(["", "2D", "3D", "Base"]))
+    return sorted(names)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--snapshot", help="classdb-<version>.json written by the MCP server")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.snapshot:
+        with open(args.snapshot, "r", encoding="utf-8") as f:
+            names = [cls["name"] for cls in json.load(f)["classes"]]
+    else:
+        names = synthetic_names()
+
+    build_ms = timeit.timeit(lambda: ClassNameIndex(names), number=5) / 5 * 1e3
+    print(f"Index build over {len(names)} classes: {build_ms:.1f} ms\n")
+
+    index = ClassNameIndex(names)
+    print(f"{'query':<18} {'cold (us)':>10} {'cached (us)':>12}  suggestions")
+    for query in QUERIES:
+        def cold():
+            index.ranked_cache.clear()
+            return index.suggest(query, 5)
+        cold_us = timeit.timeit(cold, number=args.iterations) / args.iterations * 1e6
+        cached_us = timeit.timeit(lambda: index.suggest(query, 5), number=args.iterations) / args.iterations * 1e6
+        print(f"{query:<18} {cold_us:>10.1f} {cached_us:>12.1f}  {', '.join(index.suggest(query, 3))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -46,7 +46,15 @@ def main():
         "test/test_godot_client.py",
         "test/test_tool_registration.py", 
         "test/test_scene_tools.py",
-        "test/test_script_tools.py"
+        "test/test_script_tools.py",
+        "test/test_batch_tools.py",
+        "test/test_theme_animation_tools.py",
+        "test/test_tool_registry.py",
+        "test/test_classdb.py",
+        "test/test_variant_codec.py",
+        "test/test_scene_tree.py",
+        "test/test_error_tools.py",
+        "test/test_project_index.py"
     ]
     
     # Check that all test files exist
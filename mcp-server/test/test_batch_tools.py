@@ -0,0 +1,99 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+from mcp.types import TextContent
+from src.tools.batch_tools import handle_batch_tool, get_batch_tools
+from src.godot_client import GodotClient
+
+
+class TestBatchTools:
+    
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock GodotClient for testing"""
+        return AsyncMock(spec=GodotClient)
+    
+    @pytest.mark.asyncio
+    async def test_batch_operations_success(self, mock_client):
+        """Test a batch where every operation succeeds"""
+        operations = [
+            {"endpoint": "/node/add", "body": {"type": "VBoxContainer", "name": "Menu"}},
+            {"endpoint": "/node/add", "body": {"type": "Button", "name": "Play", "parent_path": "Menu"}}
+        ]
+        mock_client.batch.return_value = {
+            "success": True,
+            "results": [
+                {"index": 0, "endpoint": "/node/add", "method": "POST", "status": 200, "body": {"success": True, "message": "Node added successfully"}},
+                {"index": 1, "endpoint": "/node/add", "method": "POST", "status": 200, "body": {"success": True, "message": "Node added successfully"}}
+            ],
+            "completed": 2,
+            "failed": 0,
+            "total": 2,
+            "stopped_early": False
+        }
+        
+        result = await handle_batch_tool("batch_operations", {"operations": operations}, mock_client)
+        
+        mock_client.batch.assert_called_once_with(operations, True)
+        assert len(result) == 1
+        assert isinstance(result[0], TextContent)
+        assert "2/2 operation(s) succeeded" in result[0].text
+        assert "[1] POST /node/add: Node added successfully" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_batch_operations_stopped_on_error(self, mock_client):
+        """Test a batch that stops at the first failing operation"""
+        operations = [
+            {"endpoint": "/node/add", "body": {"type": "Lable", "name": "Title"}},
+            {"endpoint": "/node/add", "body": {"type": "Button", "name": "Play"}}
+        ]
+        mock_client.batch.return_value = {
+            "success": False,
+            "results": [
+                {"index": 0, "endpoint": "/node/add", "method": "POST", "status": 400, "body": {"success": False, "error": "Invalid node type: Lable"}}
+            ],
+            "completed": 1,
+            "failed": 1,
+            "total": 2,
+            "stopped_early": True
+        }
+        
+        result = await handle_batch_tool("batch_operations", {"operations": operations}, mock_client)
+        
+        assert "0/2 operation(s) succeeded, 1 failed" in result[0].text
+        assert "1 not run" in result[0].text
+        assert "FAILED - Invalid node type: Lable" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_batch_operations_continue_on_error(self, mock_client):
+        """Test that stop_on_error is forwarded to the client"""
+        mock_client.batch.return_value = {"success": True, "results": [], "completed": 0, "failed": 0, "total": 0}
+        
+        await handle_batch_tool("batch_operations", {"operations": [], "stop_on_error": False}, mock_client)
+        
+        mock_client.batch.assert_called_once_with([], False)
+    
+    @pytest.mark.asyncio
+    async def test_batch_operations_connection_failure(self, mock_client):
+        """Test batch when the plugin cannot be reached"""
+        mock_client.batch.return_value = {"error": "Connection refused", "success": False, "results": []}
+        
+        result = await handle_batch_tool("batch_operations", {"operations": [{"endpoint": "/health", "method": "GET"}]}, mock_client)
+        
+        assert "Failed to run batch: Connection refused" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, mock_client):
+        """Test handling of unknown batch tool"""
+        result = await handle_batch_tool("unknown_tool", {}, mock_client)
+        
+        assert "Unknown batch tool: unknown_tool" in result[0].text
+    
+    def test_batch_tool_names(self):
+        """Test that the batch tool is registered"""
+        tool_names = [tool.name for tool in get_batch_tools()]
+        assert tool_names == ["batch_operations"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,320 @@
+import pytest
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+from src.classdb import ClassDBSnapshot, ClassDBStore, ClassNameIndex, BKTree, damerau_levenshtein, normalize_class_name
+from src.tools.scene_tools import handle_scene_tool
+from src.godot_client import GodotClient
+
+
+SAMPLE_CLASSES = [
+    {"name": "Object", "parent": "", "can_instantiate": True, "is_node": False, "properties": [], "methods": ["get_class"]},
+    {"name": "Node", "parent": "Object", "can_instantiate": True, "is_node": True, "properties": [{"name": "name", "type": "StringName", "usage": 6}], "methods": ["add_child"]},
+    {"name": "CanvasItem", "parent": "Node", "can_instantiate": False, "is_node": True, "properties": [{"name": "visible", "type": "bool", "usage": 6}], "methods": ["show", "hide"]},
+    {"name": "Control", "parent": "CanvasItem", "can_instantiate": True, "is_node": True, "properties": [], "methods": []},
+    {"name": "Label", "parent": "Control", "can_instantiate": True, "is_node": True, "properties": [{"name": "text", "type": "String", "usage": 6}], "methods": []},
+    {"name": "Button", "parent": "Control", "can_instantiate": True, "is_node": True, "properties": [], "methods": []},
+    {"name": "Node2D", "parent": "CanvasItem", "can_instantiate": True, "is_node": True, "properties": [], "methods": []},
+    {"name": "Sprite2D", "parent": "Node2D", "can_instantiate": True, "is_node": True, "properties": [], "methods": []},
+    {"name": "Resource", "parent": "Object", "can_instantiate": True, "is_node": False, "properties": [], "methods": []}
+]
+
+
+class TestClassDBSnapshot:
+    
+    @pytest.fixture
+    def snapshot(self):
+        return ClassDBSnapshot("4.3.stable", SAMPLE_CLASSES)
+    
+    def test_list_classes_filters_by_base(self, snapshot):
+        """Test that filters select a base class and all its descendants"""
+        result = snapshot.list_classes("control")
+        
+        assert result["success"] is True
+        assert [cls["name"] for cls in result["classes"]] == ["Button", "Control", "Label"]
+        assert result["total_count"] == 3
+    
+    def test_list_classes_search(self, snapshot):
+        """Test case-insensitive search within a filter"""
+        result = snapshot.list_classes("node", "2d")
+        
+        assert [cls["name"] for cls in result["classes"]] == ["Node2D", "Sprite2D"]
+    
+    def test_list_classes_pages_with_cursor(self, snapshot):
+        """Test that a cursor continues after the last name of the previous page"""
+        first = snapshot.list_classes("node", limit=3)
+        second = snapshot.list_classes("node", limit=3, cursor=first["next_cursor"])
+        last = snapshot.list_classes("node", limit=3, cursor=second["next_cursor"])
+        
+        assert [cls["name"] for cls in first["classes"]] == ["Button", "CanvasItem", "Control"]
+        assert first["has_more"] is True
+        assert first["next_cursor"] == "Control"
+        assert [cls["name"] for cls in second["classes"]] == ["Label", "Node", "Node2D"]
+        assert second["offset"] == 3
+        assert [cls["name"] for cls in last["classes"]] == ["Sprite2D"]
+        assert last["has_more"] is False
+        assert last["next_cursor"] == ""
+        assert last["total_count"] == 7
+    
+    def test_list_classes_offset_prefix_and_fields(self, snapshot):
+        """Test offset paging, case-insensitive prefix search and field projection"""
+        result = snapshot.list_classes("all", prefix="no", offset=1, limit=5, fields=["parent"])
+        
+        assert result["classes"] == [{"name": "Node2D", "parent": "CanvasItem"}]
+        assert result["total_count"] == 2
+        assert result["has_more"] is False
+    
+    def test_class_info(self, snapshot):
+        """Test that class info matches the plugin response shape"""
+        result = snapshot.class_info("CanvasItem")
+        
+        assert result["success"] is True
+        info = result["info"]
+        assert info["parent_class"] == "Node"
+        assert sorted(info["child_classes"]) == ["Control", "Node2D"]
+        assert info["methods"] == ["show", "hide"]
+        assert info["can_instantiate"] is False
+    
+    def test_class_info_unknown_class_suggests(self, snapshot):
+        """Test that unknown classes get suggestions"""
+        result = snapshot.class_info("Sprite")
+        
+        assert result["success"] is False
+        assert "Sprite2D" in result["suggestions"]
+    
+    def test_validate_node_type(self, snapshot):
+        """Test the same instantiation rules the plugin applies in add_node"""
+        assert snapshot.validate_node_type("Label") is None
+        assert "does not exist" in snapshot.validate_node_type("Lable")
+        assert "cannot be instantiated" in snapshot.validate_node_type("CanvasItem")
+        assert "not a Node-derived" in snapshot.validate_node_type("Resource")
+
+
+class TestClassNameIndex:
+    
+    @pytest.fixture
+    def index(self):
+        return ClassNameIndex([
+            "Label", "Label3D", "RichTextLabel", "Button", "CheckButton", "RigidBody2D", "RigidBody3D",
+            "StaticBody2D", "Sprite2D", "Sprite3D", "AnimatedSprite2D", "CollisionShape2D",
+            "CollisionPolygon2D", "VBoxContainer", "HBoxContainer", "Timer", "Node2D"
+        ])
+    
+    def test_normalize_class_name(self):
+        """Test case, separator and spelled-out dimension normalisation"""
+        assert normalize_class_name("RigidBody2d") == "rigidbody2d"
+        assert normalize_class_name("rigid_body_2D") == "rigidbody2d"
+        assert normalize_class_name("Rigid Body Two D") == "rigidbody2d"
+    
+    def test_damerau_levenshtein(self):
+        """Test adjacent transpositions count as one edit and the limit short-circuits"""
+        assert damerau_levenshtein("lable", "label") == 1
+        assert damerau_levenshtein("buton", "button") == 1
+        assert damerau_levenshtein("kitten", "sitting") == 3
+        assert damerau_levenshtein("kitten", "sitting", limit=1) == 2
+    
+    def test_bk_tree_search(self):
+        """Test that BK-tree lookups find every key within the tolerance"""
+        keys = ["label", "lapel", "level", "button", "timer", "time", "tier"]
+        tree = BKTree(keys, cap=3)
+        
+        found = sorted(key for distance, key in tree.search("timer", 1))
+        
+        assert found == sorted(key for key in keys if damerau_levenshtein("timer", key) <= 1)
+    
+    def test_typos_rank_first(self, index):
+        """Test that typo corrections come before partial matches"""
+        assert index.suggest("Lable")[0] == "Label"
+        assert index.suggest("Lbael")[0] == "Label"
+        assert index.suggest("Buton")[0] == "Button"
+        assert index.suggest("CollisonShape2D")[0] == "CollisionShape2D"
+        assert index.suggest("VBoxContaner")[0] == "VBoxContainer"
+    
+    def test_case_and_digit_variants(self, index):
+        """Test that case and dimension spelling variants resolve exactly"""
+        assert index.suggest("RigidBody2d")[0] == "RigidBody2D"
+        assert index.suggest("rigid_body_2d")[0] == "RigidBody2D"
+        assert index.suggest("rigidbody three d")[0] == "RigidBody3D"
+    
+    def test_partial_names(self, index):
+        """Test that partial names suggest the classes containing them"""
+        suggestions = index.suggest("Sprite")
+        
+        assert suggestions[:2] == ["Sprite2D", "Sprite3D"]
+        assert "AnimatedSprite2D" in suggestions
+    
+    def test_accept_filter_and_limit(self, index):
+        """Test that suggestions can be filtered and limited"""
+        assert index.suggest("Label", limit=2) == ["Label", "Label3D"]
+        assert index.suggest("Label", accept=lambda name: name != "Label")[0] == "Label3D"
+        assert index.suggest("xyzzy") == []
+    
+    def test_snapshot_node_suggestions(self):
+        """Test that add_node suggestions only include instantiable nodes"""
+        snapshot = ClassDBSnapshot("4.3.stable", SAMPLE_CLASSES)
+        
+        assert snapshot.suggestions("CanvasItm") == ["CanvasItem"]
+        assert snapshot.suggestions("CanvasItm", nodes_only=True) == []
+        assert snapshot.suggestions("Lable", nodes_only=True)[0] == "Label"
+
+
+class TestClassDBStore:
+    
+    @pytest.fixture
+    def mock_client(self):
+        client = AsyncMock(spec=GodotClient)
+        client.health_check.return_value = {"status": "ok", "godot_version": "4.3.stable.official"}
+        client.classdb_dump.return_value = {"success": True, "classes": SAMPLE_CLASSES}
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_dump_fetched_once_and_persisted(self, mock_client, tmp_path):
+        """Test that the dump is fetched from the plugin once and saved per version"""
+        store = ClassDBStore(str(tmp_path))
+        
+        first = await store.get(mock_client)
+        second = await store.get(mock_client)
+        
+        assert first is second
+        mock_client.classdb_dump.assert_called_once()
+        assert os.path.exists(store.path_for("4.3.stable.official"))
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_loaded_from_disk(self, mock_client, tmp_path):
+        """Test that a known Godot version is loaded from disk without a dump"""
+        await ClassDBStore(str(tmp_path)).get(mock_client)
+        mock_client.classdb_dump.reset_mock()
+        
+        snapshot = await ClassDBStore(str(tmp_path)).get(mock_client)
+        
+        mock_client.classdb_dump.assert_not_called()
+        assert snapshot.has_class("Label")
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_keyed_and_rechecked_by_fingerprint(self, mock_client, tmp_path):
+        """Test that projects with different extensions get their own snapshot, and changes are noticed"""
+        mock_client.health_check.return_value = {"status": "ok", "godot_version": "4.3.stable", "classdb_fingerprint": "9-aaaa"}
+        store = ClassDBStore(str(tmp_path), recheck_interval=0.0)
+        
+        first = await store.get(mock_client)
+        assert await store.get(mock_client) is first
+        
+        extension_classes = SAMPLE_CLASSES + [{"name": "Boid", "parent": "Node2D", "can_instantiate": True, "is_node": True}]
+        mock_client.health_check.return_value = {"status": "ok", "godot_version": "4.3.stable", "classdb_fingerprint": "10-bbbb"}
+        mock_client.classdb_dump.return_value = {"success": True, "classes": extension_classes}
+        second = await store.get(mock_client)
+        
+        assert second is not first and second.has_class("Boid")
+        assert mock_client.classdb_dump.call_count == 2
+        assert os.path.exists(store.path_for("4.3.stable-9-aaaa")) and os.path.exists(store.path_for("4.3.stable-10-bbbb"))
+    
+    @pytest.mark.asyncio
+    async def test_unavailable_plugin_backs_off(self, mock_client, tmp_path):
+        """Test that a failed load returns None and is not retried immediately"""
+        mock_client.health_check.return_value = {"connected": False, "error": "refused"}
+        store = ClassDBStore(str(tmp_path))
+        
+        assert await store.get(mock_client) is None
+        assert await store.get(mock_client) is None
+        mock_client.health_check.assert_called_once()
+
+
+class TestLocalClassTools:
+    
+    @pytest.fixture
+    def mock_client(self):
+        return AsyncMock(spec=GodotClient)
+    
+    @pytest.fixture
+    def local_store(self):
+        store = ClassDBStore()
+        store.snapshot = ClassDBSnapshot("4.3.stable", SAMPLE_CLASSES)
+        with patch("src.tools.scene_tools.classdb_store", store):
+            yield store
+    
+    @pytest.mark.asyncio
+    async def test_add_node_unknown_type_sent_to_plugin(self, mock_client, local_store):
+        """Test that types missing from the snapshot are left to the plugin, with local suggestions"""
+        mock_client.add_node.return_value = {"success": False, "error": "Invalid node type: Sprite"}
+        
+        result = await handle_scene_tool("add_node", {"type": "Sprite", "name": "Player"}, mock_client)
+        
+        mock_client.add_node.assert_called_once_with("Sprite", "Player", "")
+        mock_client.get_node_class_info.assert_not_called()
+        assert "Failed to add node" in result[0].text
+        assert "Did you mean one of these? Sprite2D" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_add_node_extension_type_refreshes_snapshot(self, mock_client, local_store):
+        """Test that a class the editor creates but the snapshot lacks drops the snapshot"""
+        mock_client.add_node.return_value = {"success": True}
+        
+        result = await handle_scene_tool("add_node", {"type": "Boid", "name": "Boid"}, mock_client)
+        
+        assert "added successfully" in result[0].text
+        assert local_store.snapshot is None
+    
+    @pytest.mark.asyncio
+    async def test_add_node_abstract_type_rejected_locally(self, mock_client, local_store):
+        """Test that known abstract classes are still refused without a plugin call"""
+        result = await handle_scene_tool("add_node", {"type": "CanvasItem", "name": "Item"}, mock_client)
+        
+        mock_client.add_node.assert_not_called()
+        assert "cannot be instantiated" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_add_node_valid_type_sent_to_plugin(self, mock_client, local_store):
+        """Test that valid node types still go to the plugin"""
+        mock_client.add_node.return_value = {"success": True}
+        
+        result = await handle_scene_tool("add_node", {"type": "Label", "name": "Title"}, mock_client)
+        
+        mock_client.add_node.assert_called_once_with("Label", "Title", "")
+        assert "added successfully" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_list_node_classes_answered_locally(self, mock_client, local_store):
+        """Test that list_node_classes does not call the plugin when the snapshot is loaded"""
+        result = await handle_scene_tool("list_node_classes", {"filter": "node2d"}, mock_client)
+        
+        mock_client.list_node_classes.assert_not_called()
+        assert "Found 2 classes" in result[0].text
+        assert "Sprite2D" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_list_node_classes_paged(self, mock_client, local_store):
+        """Test that the tool returns one page and how to fetch the next"""
+        result = await handle_scene_tool("list_node_classes", {"filter": "all", "limit": 2, "fields": ["parent"]}, mock_client)
+        
+        text = result[0].text
+        assert "Found 9 classes, showing 1-2" in text
+        assert "- Button (extends Control)" in text
+        assert "- CanvasItem (extends Node)" in text
+        assert "abstract" not in text
+        assert "cursor 'CanvasItem'" in text
+    
+    @pytest.mark.asyncio
+    async def test_list_node_classes_paging_sent_to_plugin(self):
+        """Test that paging arguments reach the plugin when no snapshot is loaded"""
+        mock_client = AsyncMock(spec=GodotClient)
+        mock_client.list_node_classes.return_value = {"success": True, "classes": [{"name": "Label"}], "total_count": 1, "offset": 0}
+        store = ClassDBStore()
+        store.retry_at = float("inf")
+        
+        with patch("src.tools.scene_tools.classdb_store", store):
+            await handle_scene_tool("list_node_classes", {"prefix": "Lab", "cursor": "Button", "fields": ["is_node"]}, mock_client)
+        
+        mock_client.list_node_classes.assert_called_once_with("node", "", "Lab", 0, 50, "Button", ["is_node"])
+    
+    @pytest.mark.asyncio
+    async def test_get_node_class_info_answered_locally(self, mock_client, local_store):
+        """Test that get_node_class_info does not call the plugin when the snapshot is loaded"""
+        result = await handle_scene_tool("get_node_class_info", {"class_name": "Label"}, mock_client)
+        
+        mock_client.get_node_class_info.assert_not_called()
+        assert "Parent class: Control" in result[0].text
+        assert "text" in result[0].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
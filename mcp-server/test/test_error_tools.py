@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.tools import error_tools
+from src.tools.error_tools import handle_error_tool
+from src.godot_client import GodotClient
+
+
+SAMPLE_ERRORS = [
+    {"seq": 4, "severity": "script_error", "type": "SCRIPT_ERROR", "message": "Invalid call. Nonexistent function 'jump'",
+     "source": "res://player.gd:12 @ _physics_process()", "count": 3, "timestamp": "2025-01-01T12:00:00"},
+    {"seq": 9, "severity": "warning", "type": "WARNING", "message": "Node has no owner",
+     "source": "", "count": 1, "timestamp": "2025-01-01T12:00:05"}
+]
+
+
+class TestErrorTools:
+    
+    @pytest.fixture
+    def mock_client(self):
+        client = AsyncMock(spec=GodotClient)
+        client.get_errors.return_value = {"success": True, "errors": SAMPLE_ERRORS, "count": 2, "last_seq": 9,
+                                          "latest_seq": 9, "has_more": False, "reset": False, "capture": "engine_logger"}
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_get_errors_shows_counts_and_cursor(self, mock_client):
+        """Test that repeated errors show their count and the next cursor is reported"""
+        with patch.object(error_tools, "error_cursor", -1):
+            result = await handle_error_tool("get_godot_errors", {}, mock_client)
+        
+        text = result[0].text
+        assert "Found 2 error(s)" in text
+        assert "SCRIPT_ERROR: Invalid call. Nonexistent function 'jump' (Source: res://player.gd:12 @ _physics_process()) x3" in text
+        assert "WARNING: Node has no owner\n" in text
+        assert "since=9" in text
+        mock_client.get_errors.assert_called_once_with(since=-1, timeout=0.0, severity=None, source="")
+    
+    @pytest.mark.asyncio
+    async def test_new_only_tails_from_previous_call(self, mock_client):
+        """Test that new_only continues from the last sequence number seen"""
+        with patch.object(error_tools, "error_cursor", -1):
+            await handle_error_tool("get_godot_errors", {}, mock_client)
+            mock_client.get_errors.return_value = {"success": True, "errors": [], "last_seq": 9, "reset": False}
+            result = await handle_error_tool("get_godot_errors", {
+                "new_only": True, "wait_seconds": 60, "severity": ["error"], "source": "player.gd"
+            }, mock_client)
+        
+        assert "No new errors currently logged in Godot" in result[0].text
+        mock_client.get_errors.assert_called_with(since=9, timeout=error_tools.MAX_WAIT_SECONDS, severity=["error"], source="player.gd")
+    
+    @pytest.mark.asyncio
+    async def test_reset_and_capture_notes(self, mock_client):
+        """Test that dropped errors and missing engine capture are reported"""
+        mock_client.get_errors.return_value = {"errors": [], "last_seq": 40, "reset": True, "capture": "plugin_only"}
+        
+        with patch.object(error_tools, "error_cursor", -1):
+            result = await handle_error_tool("get_godot_errors", {"since": 3}, mock_client)
+        
+        assert "dropped from the log" in result[0].text
+        assert "Godot 4.5+" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_default_query_on_wrapped_log_is_not_reset(self, mock_client):
+        """Test a default query against a log that has evicted entries, as the plugin answers it"""
+        # GET /errors without since after 600 errors went through the 500-entry ring
+        mock_client.get_errors.return_value = {
+            "errors": [SAMPLE_ERRORS[0]], "count": 1, "last_seq": 600, "latest_seq": 600,
+            "has_more": False, "reset": False, "capture": "engine_logger",
+            "success": True, "message": "Error log retrieved successfully"
+        }
+        
+        with patch.object(error_tools, "error_cursor", -1):
+            result = await handle_error_tool("get_godot_errors", {"wait_seconds": 5}, mock_client)
+            assert error_tools.error_cursor == 600
+        
+        assert "Found 1 error(s)" in result[0].text
+        assert "dropped from the log" not in result[0].text
+        mock_client.get_errors.assert_called_once_with(since=-1, timeout=5.0, severity=None, source="")
+    
+    @pytest.mark.asyncio
+    async def test_get_errors_failure(self, mock_client):
+        """Test that a failed request is reported"""
+        mock_client.get_errors.return_value = {"error": "Godot is not reachable"}
+        
+        result = await handle_error_tool("get_godot_errors", {}, mock_client)
+        
+        assert "Failed to get errors: Godot is not reachable" in result[0].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,7 +1,8 @@
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, patch, ANY
 import httpx
+import json
 from src.godot_client import GodotClient
 
 
@@ -67,7 +68,9 @@ class TestGodotClient:
             
         mock_post.assert_called_once_with(
             "http://127.0.0.1:8080/scene/create",
-            json={"name": "MyScene", "path": "res://custom/MyScene.tscn"}
+            json={"name": "MyScene", "path": "res://custom/MyScene.tscn"},
+            timeout=ANY,
+            headers={"X-Deadline": ANY}
         )
         assert result["success"] is True
     
@@ -142,7 +145,9 @@ class TestGodotClient:
                 "path": "res://scripts/test.gd",
                 "content": script_content,
                 "attach_to_node": "TestNode"
-            }
+            },
+            timeout=ANY,
+            headers={"X-Deadline": ANY}
         )
         assert result["success"] is True
     
@@ -155,6 +160,701 @@ class TestGodotClient:
         assert result["connected"] is False
         assert "error" in result
     
+    @pytest.mark.asyncio
+    async def test_request_get_sends_query_params(self, client):
+        """Test that generic GET requests send the body as query parameters"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "themes": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            result = await client.request("GET", "/theme/list", {"directory": "res://themes"})
+            
+        mock_get.assert_called_once_with("http://127.0.0.1:8080/theme/list", params={"directory": "res://themes"}, timeout=ANY, headers={"X-Deadline": ANY})
+        assert result["success"] is True
+    
+    @pytest.mark.asyncio
+    async def test_request_error_uses_fallback(self, client):
+        """Test that failed requests return the error merged with the fallback"""
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=httpx.ConnectError("Connection failed")):
+            default_result = await client.request("POST", "/theme/create", {"name": "Dark"})
+            fallback_result = await client.request("POST", "/theme/create", {"name": "Dark"}, fallback={"themes": []})
+            
+        assert default_result == {"error": "Connection failed", "success": False}
+        assert fallback_result == {"error": "Connection failed", "themes": []}
+    
+    @pytest.mark.asyncio
+    async def test_batch_posts_operations(self, client):
+        """Test that batch sends all operations in one request"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "results": [], "completed": 1, "failed": 0}
+        mock_response.raise_for_status = Mock()
+        operations = [{"endpoint": "/node/add", "body": {"type": "Label", "name": "Title"}}]
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response) as mock_post:
+            result = await client.batch(operations, stop_on_error=False)
+            
+        mock_post.assert_called_once_with(
+            "http://127.0.0.1:8080/batch",
+            json={"operations": operations, "stop_on_error": False},
+            timeout=ANY,
+            headers={"X-Deadline": ANY}
+        )
+        assert result["success"] is True
+    
+    def test_keep_alive_enabled_by_default(self, client):
+        """Test that the client reuses connections by default"""
+        assert client.keep_alive is True
+        assert client.client.headers.get("connection") == "keep-alive"
+    
+    @pytest.mark.asyncio
+    async def test_keep_alive_disabled_requests_close(self):
+        """Test that disabling keep-alive asks the plugin to close each connection"""
+        client = GodotClient(keep_alive=False)
+        try:
+            assert client.keep_alive is False
+            assert client.client.headers.get("connection") == "close"
+        finally:
+            await client.close()
+    
+    def test_compression_advertised_by_default(self, client):
+        """Test that the client asks the plugin for compressed responses"""
+        assert client.client.headers.get("accept-encoding") == "gzip, deflate"
+    
+    @pytest.mark.asyncio
+    async def test_compression_disabled_requests_identity(self):
+        """Test that disabling compression asks for uncompressed bodies"""
+        client = GodotClient(compression=False)
+        try:
+            assert client.client.headers.get("accept-encoding") == "identity"
+        finally:
+            await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_gzip_response_decoded(self):
+        """Test that gzip-encoded plugin responses are decoded transparently"""
+        import gzip
+        import json
+        
+        payload = {"success": True, "classes": [{"name": f"Class{i}", "parent": "Node"} for i in range(500)]}
+        
+        def handler(request):
+            assert "gzip" in request.headers["accept-encoding"]
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+                content=gzip.compress(json.dumps(payload).encode("utf-8"))
+            )
+        
+        client = GodotClient()
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), headers=client.client.headers)
+        try:
+            result = await client.list_node_classes("all")
+        finally:
+            await client.close()
+        
+        assert result == payload
+    
+    @pytest.mark.asyncio
+    async def test_get_retried_on_transport_error(self, client):
+        """Test that idempotent GETs are retried with backoff after connection errors"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"scenes": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, side_effect=[httpx.ConnectError("refused"), mock_response]) as mock_get, \
+             patch('src.godot_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await client.list_scenes()
+            
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once()
+        assert result == {"scenes": []}
+        assert client.breaker.state == "closed"
+    
+    @pytest.mark.asyncio
+    async def test_failed_get_counts_once(self, client):
+        """Test that one GET exhausting its retries is a single breaker failure"""
+        with patch.object(client.client, 'get', new_callable=AsyncMock, side_effect=httpx.ConnectError("refused")) as mock_get, \
+             patch('src.godot_client.asyncio.sleep', new_callable=AsyncMock):
+            result = await client.list_scenes()
+        
+        assert mock_get.call_count == 3
+        assert "refused" in result["error"]
+        assert client.breaker.consecutive_failures == 1
+        assert client.breaker.state == "closed"
+    
+    @pytest.mark.asyncio
+    async def test_post_not_retried(self, client):
+        """Test that mutating requests are never retried"""
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=httpx.ConnectError("refused")) as mock_post:
+            result = await client.add_node("Label", "Title")
+            
+        assert mock_post.call_count == 1
+        assert result["success"] is False
+    
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self, client):
+        """Test that repeated connection failures open the circuit"""
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=httpx.ConnectError("refused")) as mock_post:
+            for _ in range(3):
+                await client.add_node("Label", "Title")
+            assert client.breaker.state == "open"
+            assert client.is_available() is False
+            
+            result = await client.add_node("Label", "Title")
+            
+        assert mock_post.call_count == 3
+        assert result["success"] is False
+        assert "unreachable" in result["error"]
+    
+    @pytest.mark.asyncio
+    async def test_http_error_keeps_circuit_closed(self, client):
+        """Test that HTTP error responses count as the plugin being reachable"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock(side_effect=httpx.HTTPStatusError("404 Not Found", request=None, response=None))
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response):
+            for _ in range(5):
+                result = await client.open_scene("res://missing.tscn")
+            
+        assert result["success"] is False
+        assert client.breaker.state == "closed"
+    
+    @pytest.mark.asyncio
+    async def test_probe_closes_circuit(self, client):
+        """Test that a successful supervisor probe closes an open circuit"""
+        from unittest.mock import Mock
+        
+        for _ in range(3):
+            client.breaker.record_failure("refused")
+        assert client.breaker.state == "open"
+        
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response):
+            await client._probe()
+            
+        assert client.breaker.state == "closed"
+        assert client.connection_state()["connected"] is True
+    
+    def test_circuit_half_opens_after_timeout(self):
+        """Test that an open circuit lets a trial request through after the reset timeout"""
+        from src.godot_client import CircuitBreaker
+        
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure("refused")
+        assert breaker.state == "open"
+        
+        assert breaker.allow_request() is True
+        assert breaker.state == "half_open"
+        # Only the one trial request is let through
+        assert breaker.allow_request() is False
+        breaker.record_failure("refused")
+        assert breaker.state == "open"
+        
+        assert breaker.allow_request() is True
+        breaker.release_trial()
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow_request() is True and breaker.allow_request() is True
+    
+    @pytest.mark.asyncio
+    async def test_read_timeouts_keep_circuit_closed(self, client):
+        """Test that a slow but live editor doesn't open the circuit"""
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=httpx.ReadTimeout("timed out")) as mock_post:
+            for _ in range(5):
+                result = await client.add_node("Label", "Title")
+        
+        assert mock_post.call_count == 5
+        assert result["success"] is False
+        assert client.breaker.state == "closed"
+        assert client.breaker.consecutive_failures == 0
+    
+    @pytest.mark.asyncio
+    async def test_half_open_lets_one_trial_through(self, client):
+        """Test that concurrent requests fast-fail while the half-open trial is in flight"""
+        from unittest.mock import Mock
+        
+        for _ in range(3):
+            client.breaker.record_failure("refused")
+        client.breaker.opened_at -= client.breaker.reset_timeout
+        
+        release = asyncio.Event()
+        mock_response = Mock()
+        mock_response.json.return_value = {"scenes": []}
+        mock_response.raise_for_status = Mock()
+        
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return mock_response
+        
+        with patch.object(client.client, 'get', side_effect=slow_get) as mock_get:
+            trial = asyncio.create_task(client.list_scenes())
+            await asyncio.sleep(0)
+            others = await asyncio.gather(*(client.get_scene_tree(offset=i) for i in range(5)))
+            release.set()
+            result = await trial
+        
+        assert mock_get.call_count == 1
+        assert all("a trial request is checking" in other["error"] for other in others)
+        assert result == {"scenes": []}
+        assert client.breaker.state == "closed"
+    
+    @pytest.mark.asyncio
+    async def test_timed_out_trial_hands_over(self, client):
+        """Test that a half-open trial that times out lets the next request try"""
+        for _ in range(3):
+            client.breaker.record_failure("refused")
+        client.breaker.opened_at -= client.breaker.reset_timeout
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=httpx.ReadTimeout("timed out")) as mock_post:
+            await client.add_node("Label", "Title")
+            await client.add_node("Label", "Title")
+        
+        assert mock_post.call_count == 2
+        assert client.breaker.state == "half_open"
+    
+    def test_timeout_profiles_by_endpoint(self, client):
+        """Test that endpoints resolve to their category's timeout"""
+        assert client.timeout_for("GET", "/health") == 10.0
+        assert client.timeout_for("POST", "/node/add") == 30.0
+        assert client.timeout_for("POST", "/node/properties/get") == 10.0
+        assert client.timeout_for("POST", "/theme/import") == 120.0
+        assert client.timeout_for("POST", "/project/export") == 600.0
+    
+    def test_timeout_profile_overrides(self):
+        """Test that callers can override category timeouts"""
+        client = GodotClient(timeouts={"export": 1800.0, "read": 2.0})
+        
+        assert client.timeout_for("POST", "/project/export") == 1800.0
+        assert client.timeout_for("GET", "/scene/current") == 2.0
+        assert client.timeout_for("POST", "/scene/create") == 30.0
+        
+        with pytest.raises(ValueError):
+            GodotClient(timeouts={"slow": 5.0})
+    
+    @pytest.mark.asyncio
+    async def test_request_sends_timeout_and_deadline(self, client):
+        """Test that each request carries its profile timeout and an X-Deadline header"""
+        import time
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response) as mock_post:
+            before = time.time()
+            await client.request("POST", "/theme/import", {"source_path": "res://a.tres"})
+            await client.request("POST", "/node/add", {"type": "Label"}, timeout=0.5)
+        
+        first, second = mock_post.call_args_list
+        assert first.kwargs["timeout"] == pytest.approx(120.0, abs=1.0)
+        deadline = int(first.kwargs["headers"]["X-Deadline"])
+        assert before * 1000 + 119000 <= deadline <= time.time() * 1000 + 120000
+        assert second.kwargs["timeout"] == pytest.approx(0.5, abs=0.1)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_coalesced(self, client):
+        """Test that identical in-flight reads share a single network call"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"scenes": ["res://main.tscn"]}
+        mock_response.raise_for_status = Mock()
+        
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, side_effect=slow_get) as mock_get:
+            results = await asyncio.gather(*[client.list_scenes() for _ in range(3)])
+            
+        assert mock_get.call_count == 1
+        assert all(result == {"scenes": ["res://main.tscn"]} for result in results)
+        assert results[0] is not results[1]
+        stats = client.coalescing_stats()
+        assert stats["reads"] == 3
+        assert stats["network_calls"] == 1
+        assert stats["deduplicated"] == 2
+        assert stats["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_long_timeout_read_not_joined_to_short_one(self, client):
+        """Test that a read only joins an in-flight call whose deadline is as long as its own"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"errors": []}
+        mock_response.raise_for_status = Mock()
+        
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, side_effect=slow_get) as mock_get:
+            await asyncio.gather(
+                client.request("GET", "/errors", {"since": 3}, timeout=1.0),
+                client.request("GET", "/errors", {"since": 3}, timeout=30.0),
+                client.request("GET", "/errors", {"since": 3}, timeout=5.0)
+            )
+        
+        assert mock_get.call_count == 2
+        assert [c.kwargs["timeout"] for c in mock_get.call_args_list] == [pytest.approx(1.0, abs=0.1), pytest.approx(30.0, abs=0.1)]
+        assert client.coalescing_stats()["deduplicated"] == 1
+        assert client.coalescing_stats()["in_flight"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_reads_with_different_params_not_coalesced(self, client):
+        """Test that coalescing is keyed on endpoint and parameters"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"properties": {}}
+        mock_response.raise_for_status = Mock()
+        
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=slow_post) as mock_post:
+            await asyncio.gather(
+                client.get_node_properties("Player"),
+                client.get_node_properties("Player"),
+                client.get_node_properties("Enemy")
+            )
+            
+        assert mock_post.call_count == 2
+        assert client.coalescing_stats()["deduplicated"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_mutations_never_coalesced(self, client):
+        """Test that concurrent identical mutations each reach the plugin"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True}
+        mock_response.raise_for_status = Mock()
+        
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=slow_post) as mock_post:
+            await asyncio.gather(*[client.add_node("Label", "Title") for _ in range(2)])
+            
+        assert mock_post.call_count == 2
+        assert client.coalescing_stats()["reads"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_repeated_reads_served_from_cache(self, client):
+        """Test that cacheable reads hit the plugin once"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"scenes": ["res://main.tscn"]}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            first = await client.list_scenes()
+            second = await client.list_scenes()
+            
+        assert mock_get.call_count == 1
+        assert first == second
+        stats = client.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_mutation_evicts_affected_family(self, client):
+        """Test that /scene/* mutations evict scene lists but not theme reads"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "scenes": [], "themes": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get, \
+             patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response):
+            await client.list_scenes()
+            await client.request("GET", "/theme/list", {})
+            await client.create_scene("Level")
+            await client.list_scenes()
+            await client.request("GET", "/theme/list", {})
+            
+        assert mock_get.call_count == 3
+        assert client.cache_stats()["invalidations"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_evicts_families_of_its_operations(self, client):
+        """Test that a batch evicts the families of each operation's endpoint"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "themes": [], "results": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get, \
+             patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response):
+            await client.request("GET", "/theme/list", {})
+            await client.batch([{"endpoint": "/theme/create", "body": {"name": "Dark"}}])
+            await client.request("GET", "/theme/list", {})
+            
+        assert mock_get.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_cached_results_are_private_copies(self, client):
+        """Test that mutating a returned result doesn't change later cache hits"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "themes": [{"name": "dark", "path": "res://dark.tres"}]}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            first = await client.request("GET", "/theme/list", {})
+            first["themes"][0]["name"] = "changed"
+            first["themes"].append({"name": "extra"})
+            second = await client.request("GET", "/theme/list", {})
+            second["themes"].clear()
+            third = await client.request("GET", "/theme/list", {})
+        
+        assert mock_get.call_count == 1
+        assert third["themes"] == [{"name": "dark", "path": "res://dark.tres"}]
+    
+    @pytest.mark.asyncio
+    async def test_failed_reads_not_cached(self, client):
+        """Test that errors are never served from the cache"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": False, "error": "No scene open"}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response) as mock_post:
+            await client.get_node_class_info("Node2D")
+            await client.get_node_class_info("Node2D")
+            
+        assert mock_post.call_count == 2
+        assert client.cache_stats()["entries"] == 0
+    
+    def test_cache_can_be_disabled(self):
+        """Test that the cache is optional"""
+        client = GodotClient(cache=False)
+        
+        assert client.cache is None
+        assert client.cache_stats() == {"enabled": False}
+    
+    @pytest.mark.asyncio
+    async def test_list_node_classes_paging_params(self, client):
+        """Test that paging and projection are sent as query parameters"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "classes": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            await client.list_node_classes("node", prefix="Anim", limit=20, cursor="AnimatedSprite2D", fields=["parent", "is_node"])
+        
+        assert mock_get.call_args.kwargs["params"] == {
+            "filter": "node",
+            "prefix": "Anim",
+            "limit": 20,
+            "cursor": "AnimatedSprite2D",
+            "fields": "parent,is_node"
+        }
+    
+    @pytest.mark.asyncio
+    async def test_get_node_properties_projection(self, client):
+        """Test that names and non_default_only are only sent when given"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "properties": {}}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response) as mock_post:
+            await client.get_node_properties("Player")
+            await client.get_node_properties("Player", names=["position", "scale"], non_default_only=True)
+        
+        assert mock_post.call_args_list[0].kwargs["json"] == {"node_path": "Player"}
+        assert mock_post.call_args_list[1].kwargs["json"] == {
+            "node_path": "Player",
+            "names": ["position", "scale"],
+            "non_default_only": True
+        }
+    
+    @pytest.mark.asyncio
+    async def test_get_many_node_properties_params(self, client):
+        """Test that either node_paths or the subtree root and depth are sent"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "nodes": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'post', new_callable=AsyncMock, return_value=mock_response) as mock_post:
+            await client.get_many_node_properties(["Menu/Play", "Menu/Quit"], names=["position"])
+            await client.get_many_node_properties(root_path="Menu", depth=1, non_default_only=True)
+        
+        assert mock_post.call_args_list[0].args[0].endswith("/node/properties/get_many")
+        assert mock_post.call_args_list[0].kwargs["json"] == {"node_paths": ["Menu/Play", "Menu/Quit"], "names": ["position"]}
+        assert mock_post.call_args_list[1].kwargs["json"] == {"root_path": "Menu", "depth": 1, "non_default_only": True}
+        assert client.timeout_for("POST", "/node/properties/get_many") == client.timeouts["read"]
+    
+    @pytest.mark.asyncio
+    async def test_list_resources_paging_params(self, client):
+        """Test that paging, sorting and globs are only sent when given"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "resources": [], "total_count": 0}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            await client.list_resources("res://art", [".png"], offset=200, limit=100, sort="modified", descending=True, glob=["enemy_*"])
+            await client.list_resources()
+        
+        assert mock_get.call_args_list[0].kwargs["params"] == {
+            "directory": "res://art", "recursive": True, "file_types": ".png", "glob": "enemy_*",
+            "offset": 200, "limit": 100, "sort": "modified", "descending": True
+        }
+        assert mock_get.call_args_list[1].kwargs["params"] == {"directory": "res://", "recursive": True}
+    
+    @pytest.mark.asyncio
+    async def test_mutation_count(self, client):
+        """Test that mutating requests bump the counter, even when they fail, and reads don't"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "nodes": []}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get, \
+             patch.object(client.client, 'post', new_callable=AsyncMock, side_effect=httpx.ConnectError("refused")):
+            await client.get_scene_tree(offset=1000, after="HUD/Score", count=True)
+            assert mock_get.call_args.kwargs["params"] == {"after": "HUD/Score", "count": True}
+            await client.get_scene_tree(root_path="HUD", depth=1, limit=100, properties=["visible", "position"])
+            assert client.mutation_count() == 0
+            await client.add_node("Label", "Score", "HUD")
+        
+        assert client.mutation_count() == 1
+        assert mock_get.call_args.kwargs["params"] == {"root_path": "HUD", "depth": 1, "limit": 100, "properties": "visible,position"}
+    
+    @pytest.mark.asyncio
+    async def test_get_events_long_poll_params(self, client):
+        """Test that the poll timeout is sent and added to the request's own timeout"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "events": [], "last_seq": 7, "reset": False}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            await client.get_events(7, 20.0)
+        
+        assert mock_get.call_args.kwargs["params"] == {"since": 7, "timeout": 20.0}
+        assert mock_get.call_args.kwargs["timeout"] > 20.0
+    
+    @pytest.mark.asyncio
+    async def test_get_errors_cursor_and_filters(self, client):
+        """Test that cursor, filters and long-poll timeout become query params"""
+        from unittest.mock import Mock
+        
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True, "errors": [], "last_seq": 12, "reset": False}
+        mock_response.raise_for_status = Mock()
+        
+        with patch.object(client.client, 'get', new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            await client.get_errors(since=12, timeout=5.0, severity=["error", "script_error"], source="player.gd")
+            await client.get_errors()
+        
+        first, second = mock_get.call_args_list
+        assert first.kwargs["params"] == {"since": 12, "timeout": 5.0, "severity": "error,script_error", "source": "player.gd"}
+        assert first.kwargs["timeout"] > 5.0
+        assert not second.kwargs.get("params")
+    
+    def test_apply_events_invalidates_and_notifies(self, client):
+        """Test that editor events evict cache families, count tree changes and reach listeners"""
+        received = []
+        client.add_event_listener(received.append)
+        client.cache.put(("GET", "/scene/list", "null", "{}"), {"scenes": []}, "scenes", 30.0, 0)
+        client.cache.put(("GET", "/node/list_classes", "null", "{}"), {"classes": []}, "classdb", 30.0, 0)
+        
+        client.apply_events({"success": True, "reset": False, "last_seq": 12, "events": [
+            {"seq": 11, "type": "node_added", "path": "HUD/Score", "node_type": "Label"},
+            {"seq": 12, "type": "scene_saved", "path": "res://main.tscn"}
+        ]})
+        
+        assert client.event_seq == 12
+        assert client.mutation_count() == 1
+        assert client.cache.get(("GET", "/scene/list", "null", "{}")) is None
+        assert client.cache.get(("GET", "/node/list_classes", "null", "{}")) is not None
+        assert [event["type"] for event in received] == ["node_added", "scene_saved"]
+    
+    def test_scene_edited_keeps_settings_cached(self, client):
+        """Test that an undoable edit evicts themes but not project settings"""
+        client.cache.put(("GET", "/theme/list", "null", "{}"), {"themes": []}, "themes", 30.0, 0)
+        client.cache.put(("GET", "/project/settings", "null", "{}"), {"settings": {}}, "settings", 30.0, 0)
+        
+        client.apply_events({"success": True, "reset": False, "last_seq": 3, "events": [{"seq": 3, "type": "scene_edited"}]})
+        
+        assert client.cache.get(("GET", "/theme/list", "null", "{}")) is None
+        assert client.cache.get(("GET", "/project/settings", "null", "{}")) is not None
+    
+    def test_apply_events_reset(self, client):
+        """Test that a reset (missed events) drops derived state and tells listeners"""
+        received = []
+        client.add_event_listener(received.append)
+        client.cache.put(("GET", "/theme/list", "null", "{}"), {"themes": []}, "themes", 30.0, 0)
+        client.cache.put(("GET", "/project/settings", "null", "{}"), {"settings": {}}, "settings", 30.0, 0)
+        
+        client.apply_events({"success": True, "reset": True, "last_seq": 40, "events": []})
+        
+        assert client.event_seq == 40
+        assert client.mutation_count() == 1
+        assert client.cache.get(("GET", "/theme/list", "null", "{}")) is None
+        assert client.cache.get(("GET", "/project/settings", "null", "{}")) is None
+        assert received == [{"type": "reset"}]
+    
+    @pytest.mark.asyncio
+    async def test_event_listener_loop(self, client):
+        """Test that the listener syncs, applies events and marks the feed live"""
+        polls = [
+            {"success": True, "reset": True, "last_seq": 5, "events": []},
+            {"success": True, "reset": False, "last_seq": 6, "events": [{"seq": 6, "type": "tree_changed", "count": 80}]}
+        ]
+        sinces = []
+        
+        async def fake_get_events(since, timeout):
+            sinces.append(since)
+            if polls:
+                return polls.pop(0)
+            await asyncio.sleep(3600)
+        
+        with patch.object(client, 'get_events', side_effect=fake_get_events):
+            client.start_event_listener()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert client.events_connected()
+            await client.close()
+        
+        assert sinces == [-1, 5, 6]
+        assert client.event_seq == 6
+        assert client.mutation_count() == 2
+    
     @pytest.mark.asyncio
     async def test_close_client(self, client):
         """Test closing the HTTP client"""
@@ -164,4 +864,44 @@ class TestGodotClient:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
+
+
+class TestResponseCache:
+    
+    def test_entries_expire_after_ttl(self):
+        """Test that expired entries count as misses and are dropped"""
+        from src.godot_client import ResponseCache
+        
+        cache = ResponseCache()
+        cache.put(("GET", "/scene/list"), {"scenes": []}, "scenes", 0.0, cache.generation("scenes"))
+        
+        assert cache.get(("GET", "/scene/list")) is None
+        assert cache.stats["expired"] == 1
+        assert len(cache.entries) == 0
+    
+    def test_lru_eviction_respects_memory_bound(self):
+        """Test that the least recently used entries are evicted past max_bytes"""
+        from src.godot_client import ResponseCache
+        
+        value = {"data": "x" * 40}
+        cache = ResponseCache(max_bytes=len(json.dumps(value)) * 2)
+        cache.put(("a",), value, "classdb", 60.0, 0)
+        cache.put(("b",), value, "classdb", 60.0, 0)
+        cache.get(("a",))
+        cache.put(("c",), value, "classdb", 60.0, 0)
+        
+        assert list(cache.entries) == [("a",), ("c",)]
+        assert cache.stats["evictions"] == 1
+        assert cache.total_bytes <= cache.max_bytes
+    
+    def test_stale_read_not_stored_after_invalidation(self):
+        """Test that a read started before an eviction cannot repopulate the cache"""
+        from src.godot_client import ResponseCache
+        
+        cache = ResponseCache()
+        generation = cache.generation("themes")
+        cache.invalidate(["themes"])
+        cache.put(("GET", "/theme/list"), {"themes": ["old"]}, "themes", 60.0, generation)
+        
+        assert cache.get(("GET", "/theme/list")) is None
@@ -0,0 +1,210 @@
+import os
+import struct
+import sys
+import zlib
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.project_index import ProjectIndex, read_resource_type, UNKNOWN_TYPE
+from src.tools import scene_tools, asset_tools, theme_tools
+from src.tools.scene_tools import handle_scene_tool
+from src.tools.asset_tools import handle_asset_tool
+from src.tools.theme_tools import handle_theme_tool
+from src.godot_client import GodotClient
+
+
+def write(root, relative, content="x"):
+    path = os.path.join(root, *relative.split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = "wb" if isinstance(content, bytes) else "w"
+    with open(path, mode) as f:
+        f.write(content)
+    return path
+
+
+def binary_resource_header(type_name):
+    """Start of a little-endian binary .res file as ResourceFormatSaverBinary writes it"""
+    name = type_name.encode() + b"\0"
+    return b"RSRC" + struct.pack("<5I", 0, 0, 4, 3, 5) + struct.pack("<I", len(name)) + name
+
+
+def compressed_resource(type_name, mode=1, block_size=4096):
+    """A .res as saved with filesystem/on_save/compress_binary_resources: "RSCC" and one compressed block"""
+    content = binary_resource_header(type_name) + b"\0" * 64
+    block = zlib.compress(content) if mode == 1 else b"\x00" * 20
+    return b"RSCC" + struct.pack("<4I", mode, block_size, len(content), len(block)) + block
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = str(tmp_path)
+    write(root, "project.godot", "config_version=5\n")
+    write(root, "scenes/main.tscn")
+    write(root, "scenes/levels/level_1.tscn")
+    write(root, "scripts/player.gd", "extends Node\n")
+    write(root, "art/icon.png", b"\x89PNG....")
+    write(root, "art/icon.png.import")
+    write(root, "ui/main_theme.tres", '[gd_resource type="Theme" load_steps=3 format=3 uid="uid://abc"]\n')
+    write(root, "ui/button.tres", '[gd_resource type="StyleBoxFlat" format=3]\n')
+    write(root, "ui/packed_theme.res", binary_resource_header("Theme"))
+    write(root, ".godot/imported/icon.png-123.ctex")
+    return root
+
+
+@pytest.fixture
+def mock_client(project):
+    client = AsyncMock(spec=GodotClient)
+    client.mutation_count.return_value = 0
+    client.health_check.return_value = {"status": "ok", "project_path": project + "/"}
+    return client
+
+
+class TestProjectIndex:
+    
+    @pytest.mark.asyncio
+    async def test_listings_match_plugin_shape(self, mock_client):
+        """Test scene, script and resource listings, with hidden directories skipped"""
+        index = ProjectIndex(watch=False)
+        assert await index.ensure(mock_client) is True
+        
+        assert index.list_scenes()["scenes"] == [
+            {"name": "level_1", "path": "res://scenes/levels/level_1.tscn", "directory": "res://scenes/levels"},
+            {"name": "main", "path": "res://scenes/main.tscn", "directory": "res://scenes"}
+        ]
+        assert [s["path"] for s in index.list_scripts()["scripts"]] == ["res://scripts/player.gd"]
+        icon = index.list_resources("res://art", [".png"])["resources"]
+        assert [{key: value for key, value in entry.items() if key != "modified"} for entry in icon] == [
+            {"name": "icon", "path": "res://art/icon.png", "directory": "res://art", "size": "8 bytes",
+             "type": "image", "extension": "png"}
+        ]
+        assert index.list_resources("res://art", ["png.import"])["count"] == 1
+        assert index.list_resources("res://scenes", recursive=False)["count"] == 1
+        assert index.list_resources("res://missing")["error"] == "Directory not found: res://missing"
+        assert not any(path.startswith("res://.godot") for path in index.files)
+    
+    @pytest.mark.asyncio
+    async def test_themes_from_resource_headers(self, project, mock_client):
+        """Test that themes are recognised from text and binary headers without loading them"""
+        index = ProjectIndex(watch=False)
+        await index.ensure(mock_client)
+        
+        assert [t["path"] for t in index.list_themes()["themes"]] == ["res://ui/main_theme.tres", "res://ui/packed_theme.res"]
+        assert read_resource_type(os.path.join(project, "ui", "button.tres")) == "StyleBoxFlat"
+        assert index.list_themes("res://scenes")["count"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_compressed_theme_listed(self, project, mock_client):
+        """Test that compressed ("RSCC") binary themes are read from their first block"""
+        write(project, "ui/compressed_theme.res", compressed_resource("Theme"))
+        index = ProjectIndex(watch=False)
+        await index.ensure(mock_client)
+        
+        assert "res://ui/compressed_theme.res" in [t["path"] for t in index.list_themes()["themes"]]
+    
+    @pytest.mark.asyncio
+    async def test_undecodable_compressed_resource_uses_plugin(self, project, mock_client):
+        """Test that list_themes asks the plugin when a compressed resource can't be decoded here"""
+        # Mode 0 is FastLZ, which Python can't inflate
+        path = write(project, "ui/fastlz_theme.res", compressed_resource("Theme", mode=0))
+        mock_client.request.return_value = {"success": True, "themes": [{"name": "fastlz_theme", "path": "res://ui/fastlz_theme.res"}]}
+        
+        assert read_resource_type(path) == UNKNOWN_TYPE
+        with patch.object(theme_tools, "project_index", ProjectIndex(watch=False)):
+            result = await handle_theme_tool("list_themes", {}, mock_client)
+        
+        assert "- fastlz_theme (res://ui/fastlz_theme.res)" in result[0].text
+        mock_client.request.assert_called_once_with("GET", "/theme/list", {})
+    
+    @pytest.mark.asyncio
+    async def test_polling_mode_rescans_after_mutation(self, project, mock_client):
+        """Test that without inotify a mutating request makes the next listing rescan"""
+        index = ProjectIndex(watch=False)
+        await index.ensure(mock_client)
+        write(project, "scenes/boss.tscn")
+        
+        await index.ensure(mock_client)
+        assert index.list_scenes()["count"] == 2
+        mock_client.mutation_count.return_value = 1
+        await index.ensure(mock_client)
+        assert index.list_scenes()["count"] == 3
+        assert index.state()["mode"] == "polling"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+    async def test_inotify_updates_incrementally(self, project, mock_client):
+        """Test that created, deleted and moved files and directories reach the index without a rescan"""
+        index = ProjectIndex()
+        await index.ensure(mock_client)
+        assert index.state()["mode"] == "inotify"
+        
+        write(project, "scenes/bosses/dragon.tscn")
+        os.remove(os.path.join(project, "scenes", "main.tscn"))
+        os.rename(os.path.join(project, "scenes", "levels"), os.path.join(project, "levels"))
+        write(project, "ui/main_theme.tres", '[gd_resource type="StyleBoxFlat" format=3]\n')
+        await index.ensure(mock_client)
+        
+        assert [s["path"] for s in index.list_scenes()["scenes"]] == ["res://levels/level_1.tscn", "res://scenes/bosses/dragon.tscn"]
+        assert [t["path"] for t in index.list_themes()["themes"]] == ["res://ui/packed_theme.res"]
+        assert index.state()["scans"] == 1
+        index.close()
+    
+    @pytest.mark.asyncio
+    async def test_resource_paging_sorting_and_globs(self, project, mock_client):
+        """Test that list_resources pages, sorts and filters like the plugin's /asset/list"""
+        for i in range(5):
+            write(project, f"art/enemies/enemy_{i}.png", "x" * (5 - i))
+        index = ProjectIndex(watch=False)
+        await index.ensure(mock_client)
+        
+        first = index.list_resources("res://art", glob=["enemy_*.png"], limit=2)
+        assert [r["name"] for r in first["resources"]] == ["enemy_0", "enemy_1"]
+        assert (first["total_count"], first["has_more"], first["next_offset"]) == (5, True, 2)
+        last = index.list_resources("res://art", glob=["enemy_*.png"], offset=4, limit=2)
+        assert [r["name"] for r in last["resources"]] == ["enemy_4"] and last["next_offset"] == -1
+        
+        by_name = index.list_resources("res://", glob=["res://art/*"], sort="name", descending=True)
+        assert [r["name"] for r in by_name["resources"]][:3] == ["icon.png", "icon", "enemy_4"]
+        assert index.list_resources(sort="size")["error"].startswith("Unknown sort key: size")
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_project_falls_back_to_plugin(self, mock_client):
+        """Test that list tools use the plugin when the project directory isn't local"""
+        mock_client.health_check.return_value = {"status": "ok", "project_path": "/nonexistent/project/"}
+        mock_client.list_scenes.return_value = {"scenes": [{"name": "main", "path": "res://main.tscn", "directory": "res://"}]}
+        
+        with patch.object(scene_tools, "project_index", ProjectIndex()):
+            result = await handle_scene_tool("list_scenes", {}, mock_client)
+            again = await handle_scene_tool("list_scenes", {}, mock_client)
+        
+        assert "Found 1 scene(s)" in result[0].text
+        assert "Found 1 scene(s)" in again[0].text
+        # The failed lookup is not repeated on every call
+        mock_client.health_check.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_list_resources_tool_served_from_index(self, mock_client):
+        """Test that list_resources answers from the index without a plugin round trip"""
+        with patch.object(asset_tools, "project_index", ProjectIndex(watch=False)):
+            result = await handle_asset_tool("list_resources", {"directory": "res://art"}, mock_client)
+        
+        assert "Found 2 resource(s) in res://art:" in result[0].text
+        assert "- icon (res://art/icon.png) - 8 bytes - image" in result[0].text
+        mock_client.list_resources.assert_not_called()
+
+    
+    @pytest.mark.asyncio
+    async def test_resource_type_filter_uses_plugin(self, mock_client):
+        """Test that class filters are answered by the plugin's resource type index"""
+        mock_client.list_resources.return_value = {
+            "success": True, "total_count": 1, "has_more": False,
+            "resources": [{"name": "main_theme", "path": "res://ui/main_theme.tres", "type": "resource", "resource_type": "Theme"}]
+        }
+        
+        with patch.object(asset_tools, "project_index", ProjectIndex(watch=False)):
+            result = await handle_asset_tool("list_resources", {"resource_type": "Theme"}, mock_client)
+        
+        assert "- main_theme (res://ui/main_theme.tres) - resource (Theme)" in result[0].text
+        assert mock_client.list_resources.call_args.kwargs["resource_type"] == "Theme"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
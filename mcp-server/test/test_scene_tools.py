@@ -175,6 +175,70 @@ class TestSceneTools:
         assert "Failed to add node" in result[0].text
         assert "Invalid node type" in result[0].text
     
+    @pytest.mark.asyncio
+    async def test_get_node_properties_projection(self, mock_client):
+        """Test that names and non_default_only are forwarded and missing names reported"""
+        mock_client.get_node_properties.return_value = {
+            "success": True,
+            "node_type": "Label",
+            "properties": {"text": "Score"},
+            "missing_properties": ["txet"]
+        }
+        
+        result = await handle_scene_tool("get_node_properties", {
+            "node_path": "HUD/Score",
+            "names": ["text", "txet"],
+            "non_default_only": True
+        }, mock_client)
+        
+        mock_client.get_node_properties.assert_called_once_with("HUD/Score", ["text", "txet"], True)
+        assert "Non-default properties of node 'HUD/Score'" in result[0].text
+        assert "text: Score" in result[0].text
+        assert "No such properties: txet" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_get_node_properties_all_defaults(self, mock_client):
+        """Test the message when nothing differs from the defaults"""
+        mock_client.get_node_properties.return_value = {"success": True, "node_type": "Node2D", "properties": {}}
+        
+        result = await handle_scene_tool("get_node_properties", {"node_path": "World", "non_default_only": True}, mock_client)
+        
+        mock_client.get_node_properties.assert_called_once_with("World", None, True)
+        assert "no properties changed from their defaults" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_get_many_node_properties(self, mock_client):
+        """Test that all nodes are rendered and missing ones reported per path"""
+        mock_client.get_many_node_properties.return_value = {
+            "success": True,
+            "nodes": [
+                {"node_path": "Menu/Play", "node_type": "Button", "success": True,
+                 "properties": {"position": {"__type": "Vector2", "v": [0, 40]}, "text": "Play"}},
+                {"node_path": "Menu/Quitt", "success": False, "error": "Node not found: Menu/Quitt"}
+            ],
+            "missing_nodes": ["Menu/Quitt"],
+            "truncated": False
+        }
+        
+        result = await handle_scene_tool("get_many_node_properties", {
+            "node_paths": ["Menu/Play", "Menu/Quitt"],
+            "names": ["position", "text"]
+        }, mock_client)
+        
+        mock_client.get_many_node_properties.assert_called_once_with(["Menu/Play", "Menu/Quitt"], "", -1, ["position", "text"], False)
+        text = result[0].text
+        assert "Properties of 1 nodes (1 not found)" in text
+        assert "Menu/Play (Button):\n  position: Vector2(0, 40)\n  text: Play" in text
+        assert "Menu/Quitt: Node not found: Menu/Quitt" in text
+    
+    @pytest.mark.asyncio
+    async def test_get_many_node_properties_requires_target(self, mock_client):
+        """Test that a call without node_paths or root_path is rejected locally"""
+        result = await handle_scene_tool("get_many_node_properties", {"names": ["position"]}, mock_client)
+        
+        mock_client.get_many_node_properties.assert_not_called()
+        assert "provide node_paths or root_path" in result[0].text
+    
     @pytest.mark.asyncio
     async def test_unknown_tool(self, mock_client):
         """Test handling of unknown scene tool"""
@@ -0,0 +1,220 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.scene_tree import SceneTreeMirror, normalize_node_path
+from src.classdb import ClassDBSnapshot, ClassDBStore
+from src.tools import scene_tools
+from src.tools.scene_tools import handle_scene_tool
+from src.godot_client import GodotClient
+from test.test_classdb import SAMPLE_CLASSES
+
+
+# /scene/tree output for:  Main(Node2D) -> [HUD(Control) -> [Score(Label), Play(Button)], Player(Sprite2D)]
+SAMPLE_TREE = [
+    {"path": ".", "name": "Main", "type": "Node2D", "parent": "", "index": 0, "child_count": 2, "owner": "", "groups": []},
+    {"path": "HUD", "name": "HUD", "type": "Control", "parent": ".", "index": 0, "child_count": 2, "owner": ".", "groups": ["ui"]},
+    {"path": "HUD/Score", "name": "Score", "type": "Label", "parent": "HUD", "index": 0, "child_count": 0, "owner": ".", "groups": ["ui"]},
+    {"path": "HUD/Play", "name": "Play", "type": "Button", "parent": "HUD", "index": 1, "child_count": 0, "owner": ".", "groups": []},
+    {"path": "Player", "name": "Player", "type": "Sprite2D", "parent": ".", "index": 1, "child_count": 0, "owner": ".", "groups": [],
+     "instance": "res://player.tscn", "script": "res://player.gd"}
+]
+
+
+def tree_page(nodes, offset, limit, after=""):
+    if after:
+        offset = [node["path"] for node in nodes].index(after) + 1
+    page = nodes[offset:offset + limit]
+    has_more = offset + len(page) < len(nodes)
+    return {"success": True, "scene_path": "res://main.tscn", "nodes": page, "offset": offset, "has_more": has_more,
+            "next_offset": offset + len(page) if has_more and not after else -1,
+            "next_after": page[-1]["path"] if has_more else ""}
+
+
+class TestSceneTreeMirror:
+    
+    @pytest.fixture
+    def mirror(self):
+        mirror = SceneTreeMirror()
+        mirror.load(SAMPLE_TREE, "res://main.tscn")
+        return mirror
+    
+    @pytest.fixture
+    def mock_client(self):
+        client = AsyncMock(spec=GodotClient)
+        client.mutation_count.return_value = 0
+        client.get_scene_tree.side_effect = lambda after="", limit=0, **kwargs: tree_page(SAMPLE_TREE, 0, 2, after)
+        return client
+    
+    def test_normalize_node_path(self):
+        """Test that root aliases and stray slashes map to the /scene/tree form"""
+        assert normalize_node_path("") == "."
+        assert normalize_node_path("./HUD/Score/") == "HUD/Score"
+        assert normalize_node_path("/HUD") == "HUD"
+    
+    def test_structure_queries(self, mirror):
+        """Test children, existence and pre-order descendants"""
+        assert mirror.children(".") == ["HUD", "Player"]
+        assert mirror.children("HUD") == ["HUD/Score", "HUD/Play"]
+        assert mirror.children("Missing") is None
+        assert mirror.exists("./HUD/Play")
+        assert not mirror.exists("HUD/Quit")
+        assert mirror.descendants() == [".", "HUD", "HUD/Score", "HUD/Play", "Player"]
+        assert mirror.descendants(".", max_depth=1) == [".", "HUD", "Player"]
+    
+    def test_nodes_by_type_and_group(self, mirror):
+        """Test exact type matches, subclass matches with a ClassDB snapshot, and groups"""
+        assert mirror.nodes_by_type("Control") == ["HUD"]
+        classdb = ClassDBSnapshot("4.3.stable", SAMPLE_CLASSES)
+        assert mirror.nodes_by_type("Control", classdb) == ["HUD", "HUD/Score", "HUD/Play"]
+        assert mirror.nodes_in_group("ui") == ["HUD", "HUD/Score"]
+    
+    @pytest.mark.asyncio
+    async def test_refresh_fetches_all_pages_once(self, mock_client):
+        """Test that a refresh pages through the tree and later calls are served locally"""
+        mirror = SceneTreeMirror()
+        
+        assert await mirror.refresh(mock_client) is True
+        assert await mirror.refresh(mock_client) is True
+        
+        assert mock_client.get_scene_tree.call_count == 3
+        assert [c.kwargs["after"] for c in mock_client.get_scene_tree.call_args_list] == ["", "HUD", "HUD/Play"]
+        assert len(mirror.nodes) == 5
+        assert mirror.scene_path == "res://main.tscn"
+    
+    @pytest.mark.asyncio
+    async def test_mutation_makes_mirror_stale(self, mock_client):
+        """Test that any mutating request sent through the client forces a re-fetch"""
+        mirror = SceneTreeMirror()
+        await mirror.refresh(mock_client)
+        
+        mock_client.mutation_count.return_value = 1
+        assert not mirror.is_fresh(mock_client)
+        await mirror.refresh(mock_client)
+        
+        assert mock_client.get_scene_tree.call_count == 6
+        assert mirror.is_fresh(mock_client)
+    
+    @pytest.mark.asyncio
+    async def test_refresh_failure_empties_mirror(self, mock_client, mirror):
+        """Test that a failed fetch leaves no stale copy behind"""
+        mock_client.get_scene_tree.side_effect = None
+        mock_client.get_scene_tree.return_value = {"success": False, "error": "No scene currently open"}
+        
+        assert await mirror.refresh(mock_client, force=True) is False
+        assert mirror.nodes == {}
+        assert not mirror.is_fresh(mock_client)
+        assert mirror.error == "No scene currently open"
+    
+    @pytest.mark.asyncio
+    async def test_refresh_retries_when_scene_changes_during_fetch(self, mock_client):
+        """Test that a change event landing mid-fetch causes a retry, not a failure"""
+        counts = iter([0, 1, 1, 1])
+        mock_client.mutation_count.side_effect = lambda: next(counts)
+        mirror = SceneTreeMirror()
+        
+        assert await mirror.refresh(mock_client) is True
+        
+        assert mock_client.get_scene_tree.call_count == 6
+        assert len(mirror.nodes) == 5 and not mirror.stale
+    
+    @pytest.mark.asyncio
+    async def test_refresh_restarts_when_cursor_node_is_removed(self, mock_client):
+        """Test that losing the page cursor mid-fetch starts the fetch over"""
+        lost = {"error": "Client error '409 Conflict' for url 'http://localhost:8080/scene/tree'", "success": False, "nodes": []}
+        pages = iter([tree_page(SAMPLE_TREE, 0, 2), lost])
+        mock_client.get_scene_tree.side_effect = lambda after="", limit=0, **kwargs: next(pages, None) or tree_page(SAMPLE_TREE, 0, 2, after)
+        mirror = SceneTreeMirror()
+        
+        assert await mirror.refresh(mock_client) is True
+        
+        assert mock_client.get_scene_tree.call_count == 5
+        assert len(mirror.nodes) == 5 and mirror.error == ""
+    
+    @pytest.mark.asyncio
+    async def test_refresh_keeps_stale_snapshot_when_scene_keeps_changing(self, mock_client):
+        """Test that a scene changing during every attempt still yields a snapshot, marked stale"""
+        counts = iter(range(100))
+        mock_client.mutation_count.side_effect = lambda: next(counts)
+        mirror = SceneTreeMirror()
+        
+        assert await mirror.refresh(mock_client) is True
+        
+        assert mock_client.get_scene_tree.call_count == 3 * 3
+        assert mirror.stale and len(mirror.nodes) == 5
+        assert not mirror.is_fresh(mock_client)
+
+
+class TestSceneTreeTool:
+    
+    @pytest.fixture
+    def mock_client(self):
+        client = AsyncMock(spec=GodotClient)
+        client.mutation_count.return_value = 0
+        client.get_scene_tree.return_value = tree_page(SAMPLE_TREE, 0, 1000)
+        return client
+    
+    @pytest.mark.asyncio
+    async def test_get_scene_tree_renders_hierarchy(self, mock_client):
+        """Test the indented tree with instance, script and group annotations"""
+        with patch.object(scene_tools, "scene_tree_mirror", scene_tools.SceneTreeMirror()):
+            result = await handle_scene_tool("get_scene_tree", {}, mock_client)
+        
+        text = result[0].text
+        assert "Scene tree of res://main.tscn (5 nodes):" in text
+        assert "\n  HUD (Control) groups: ui\n    Score (Label) groups: ui\n    Play (Button)\n" in text
+        assert "  Player (Sprite2D) instance of res://player.tscn script res://player.gd" in text
+    
+    @pytest.mark.asyncio
+    async def test_get_scene_tree_find_by_type(self, mock_client):
+        """Test that node_type matches subclasses when the ClassDB snapshot is loaded"""
+        with patch.object(scene_tools, "scene_tree_mirror", scene_tools.SceneTreeMirror()), \
+             patch.object(scene_tools.classdb_store, "snapshot", ClassDBSnapshot("4.3.stable", SAMPLE_CLASSES)):
+            result = await handle_scene_tool("get_scene_tree", {"root_path": "HUD", "node_type": "Control"}, mock_client)
+            again = await handle_scene_tool("get_scene_tree", {"node_type": "Button"}, mock_client)
+        
+        assert "3 nodes with type Control under HUD:\nHUD (Control)\nHUD/Score (Label)\nHUD/Play (Button)" in result[0].text
+        assert "HUD/Play (Button)" in again[0].text
+        mock_client.get_scene_tree.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_scene_tree_find_by_type_loads_classdb(self, mock_client, tmp_path):
+        """Test that node_type loads a cold ClassDB snapshot before matching subclasses"""
+        mock_client.health_check.return_value = {"status": "ok", "godot_version": "4.3.stable"}
+        mock_client.classdb_dump.return_value = {"success": True, "classes": SAMPLE_CLASSES}
+        with patch.object(scene_tools, "scene_tree_mirror", scene_tools.SceneTreeMirror()), \
+             patch.object(scene_tools, "classdb_store", ClassDBStore(str(tmp_path))):
+            result = await handle_scene_tool("get_scene_tree", {"node_type": "Control"}, mock_client)
+        
+        assert "3 nodes with type Control under .:" in result[0].text
+        mock_client.classdb_dump.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_scene_tree_reports_fetch_error(self, mock_client):
+        """Test that the plugin's reason is shown when the tree can't be fetched"""
+        mock_client.get_scene_tree.return_value = {"error": "Godot is not reachable"}
+        with patch.object(scene_tools, "scene_tree_mirror", scene_tools.SceneTreeMirror()):
+            result = await handle_scene_tool("get_scene_tree", {}, mock_client)
+        
+        assert result[0].text == "Failed to get scene tree: Godot is not reachable"
+    
+    @pytest.mark.asyncio
+    async def test_get_scene_tree_notes_stale_snapshot(self, mock_client):
+        """Test that a snapshot taken while the scene kept changing is flagged"""
+        counts = iter(range(100))
+        mock_client.mutation_count.side_effect = lambda: next(counts)
+        with patch.object(scene_tools, "scene_tree_mirror", scene_tools.SceneTreeMirror()):
+            result = await handle_scene_tool("get_scene_tree", {}, mock_client)
+        
+        assert "Scene tree of res://main.tscn (5 nodes):" in result[0].text
+        assert "the scene changed while it was being read" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_get_scene_tree_unknown_root(self, mock_client):
+        """Test that an unknown root_path is reported without another plugin call"""
+        with patch.object(scene_tools, "scene_tree_mirror", scene_tools.SceneTreeMirror()):
+            result = await handle_scene_tool("get_scene_tree", {"root_path": "Enemies"}, mock_client)
+        
+        assert "Node not found: Enemies" in result[0].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,76 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+from mcp.types import TextContent
+from src.tools.theme_tools import handle_theme_tool
+from src.tools.animation_tools import handle_animation_tool
+from src.godot_client import GodotClient
+
+
+class TestThemeAnimationTools:
+    
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock GodotClient for testing"""
+        return AsyncMock(spec=GodotClient)
+    
+    @pytest.mark.asyncio
+    async def test_create_theme_uses_shared_client(self, mock_client):
+        """Test that theme handlers go through the client they are given"""
+        mock_client.request.return_value = {"success": True, "path": "res://themes/Dark.tres"}
+        
+        with patch("src.tools.theme_tools.GodotClient") as client_class:
+            result = await handle_theme_tool("create_theme", {"name": "Dark"}, mock_client)
+            
+        client_class.assert_not_called()
+        mock_client.request.assert_called_once_with("POST", "/theme/create", {"name": "Dark"})
+        assert isinstance(result[0], TextContent)
+        assert "Successfully created theme 'Dark' at 'res://themes/Dark.tres'" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_list_themes_uses_get(self, mock_client):
+        """Test that list_themes is sent as a GET request"""
+        mock_client.request.return_value = {
+            "success": True,
+            "themes": [{"name": "Dark", "path": "res://themes/Dark.tres", "size": 512}]
+        }
+        
+        result = await handle_theme_tool("list_themes", {}, mock_client)
+        
+        mock_client.request.assert_called_once_with("GET", "/theme/list", {})
+        assert "Found 1 theme resource(s)" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_theme_failure(self, mock_client):
+        """Test theme handler failure reporting"""
+        mock_client.request.return_value = {"success": False, "error": "Theme not found"}
+        
+        result = await handle_theme_tool("apply_theme", {"theme_path": "res://missing.tres"}, mock_client)
+        
+        assert "Failed to apply theme: Theme not found" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_create_ui_animation_uses_shared_client(self, mock_client):
+        """Test that animation handlers go through the client they are given"""
+        mock_client.request.return_value = {"success": True}
+        arguments = {"target_node_path": "Menu/Title", "animation_name": "FadeIn"}
+        
+        with patch("src.tools.animation_tools.GodotClient") as client_class:
+            result = await handle_animation_tool("create_ui_animation", arguments, mock_client)
+            
+        client_class.assert_not_called()
+        mock_client.request.assert_called_once_with("POST", "/animation/create", arguments)
+        assert "Successfully created UI animation 'FadeIn' for node 'Menu/Title'" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_animation_failure(self, mock_client):
+        """Test animation handler failure reporting"""
+        mock_client.request.return_value = {"success": False, "error": "Node not found"}
+        
+        result = await handle_animation_tool("start_ui_animation", {"animation_node_path": "Missing"}, mock_client)
+        
+        assert "Failed to control animation: Node not found" in result[0].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
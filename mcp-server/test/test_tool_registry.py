@@ -0,0 +1,112 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from mcp.types import Tool, TextContent
+from src.tools.registry import ToolRegistry, tool_handler
+from src.tools.scene_tools import get_scene_tools
+from src.tools.script_tools import get_script_tools
+from src.server import build_tool_registry
+from src.godot_client import GodotClient
+
+
+def get_sample_tools() -> list[Tool]:
+    return [
+        Tool(name="sample_one", description="First sample tool", inputSchema={"type": "object", "properties": {}}),
+        Tool(name="sample_two", description="Second sample tool", inputSchema={"type": "object", "properties": {}})
+    ]
+
+@tool_handler(get_sample_tools)
+async def handle_sample_tool(name: str, arguments: dict, godot_client) -> list:
+    return [TextContent(type="text", text=f"handled {name}")]
+
+
+class TestToolRegistry:
+    
+    def test_register_handler_maps_every_tool(self):
+        """Test that a decorated handler is registered for each of its tools"""
+        registry = ToolRegistry()
+        registry.register_handler(handle_sample_tool)
+        
+        assert [tool.name for tool in registry.tools] == ["sample_one", "sample_two"]
+        assert registry.get_handler("sample_one") is handle_sample_tool
+        assert registry.get_handler("sample_two") is handle_sample_tool
+        assert "sample_one" in registry
+        assert len(registry) == 2
+    
+    def test_unknown_tool_has_no_handler(self):
+        """Test that lookups for unregistered tools return None"""
+        registry = ToolRegistry()
+        registry.register_handler(handle_sample_tool)
+        
+        assert registry.get_handler("nonexistent_tool") is None
+    
+    def test_duplicate_tool_name_rejected(self):
+        """Test that two handlers cannot claim the same tool name"""
+        registry = ToolRegistry()
+        registry.register_handler(handle_sample_tool)
+        
+        with pytest.raises(ValueError, match="Duplicate tool name: sample_one"):
+            registry.register(get_sample_tools, handle_sample_tool)
+    
+    def test_undecorated_handler_rejected(self):
+        """Test that handlers without @tool_handler cannot be registered"""
+        async def plain_handler(name, arguments, godot_client):
+            return []
+        
+        with pytest.raises(ValueError, match="not decorated"):
+            ToolRegistry().register_handler(plain_handler)
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_through_registry(self):
+        """Test calling a tool through the handler found in the registry"""
+        registry = ToolRegistry()
+        registry.register_handler(handle_sample_tool)
+        
+        result = await registry.get_handler("sample_two")("sample_two", {}, None)
+        
+        assert result[0].text == "handled sample_two"
+    
+    def test_server_registry_covers_all_tools(self):
+        """Test that the server registry lists every module's tools in order"""
+        registry = build_tool_registry()
+        names = [tool.name for tool in registry.tools]
+        
+        scene_names = [tool.name for tool in get_scene_tools()]
+        script_names = [tool.name for tool in get_script_tools()]
+        assert names[:len(scene_names)] == scene_names
+        assert names[len(scene_names):len(scene_names) + len(script_names)] == script_names
+        assert "batch_operations" in registry
+        assert names[-2:] == ["godot_health_check", "godot_client_diagnostics"]
+        assert len(set(names)) == len(names)
+    
+    @pytest.mark.asyncio
+    async def test_health_check_dispatch(self):
+        """Test that the health check tool is served from the registry"""
+        registry = build_tool_registry()
+        mock_client = AsyncMock(spec=GodotClient)
+        mock_client.health_check.return_value = {"status": "ok"}
+        
+        handler = registry.get_handler("godot_health_check")
+        result = await handler("godot_health_check", {}, mock_client)
+        
+        assert "running" in result[0].text.lower()
+    
+    @pytest.mark.asyncio
+    async def test_diagnostics_tool_reports_client_stats(self):
+        """Test that the diagnostics tool reports cache, coalescing and connection state"""
+        registry = build_tool_registry()
+        client = GodotClient()
+        
+        handler = registry.get_handler("godot_client_diagnostics")
+        result = await handler("godot_client_diagnostics", {"clear_cache": True}, client)
+        await client.close()
+        
+        assert '"hits": 0' in result[0].text
+        assert '"deduplicated": 0' in result[0].text
+        assert '"circuit": "closed"' in result[0].text
+        assert '"cache_cleared": true' in result[0].text
+        assert '"live": false' in result[0].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,160 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.variant_codec import (
+    decode, encode, to_literal, Vector2, Vector2i, Color, Rect2, Transform2D,
+    NodePath, StringName, Resource, PackedArray, Opaque
+)
+from src.tools.scene_tools import handle_scene_tool
+from src.godot_client import GodotClient
+
+
+class TestVariantCodec:
+    
+    def test_decode_math_types(self):
+        """Tagged math types become named tuples"""
+        assert decode({"__type": "Vector2", "v": [10, 20]}) == Vector2(10, 20)
+        assert decode({"__type": "Color", "v": [1, 0.5, 0, 1]}) == Color(1, 0.5, 0, 1)
+        transform = decode({"__type": "Transform2D", "v": [1, 0, 0, 1, 5, 6]})
+        assert isinstance(transform, Transform2D)
+        assert (transform.ox, transform.oy) == (5, 6)
+    
+    def test_decode_recurses_into_containers(self):
+        """Tagged values inside lists and plain dicts are decoded too"""
+        data = {"points": [{"__type": "Vector2i", "v": [1, 2]}], "target": {"__type": "NodePath", "v": "../Player"}}
+        decoded = decode(data)
+        assert decoded["points"] == [Vector2i(1, 2)]
+        assert isinstance(decoded["target"], NodePath)
+        assert decoded["target"] == "../Player"
+    
+    def test_decode_resources_packed_arrays_and_opaque(self):
+        """Resources, packed arrays and unwritable values keep their type"""
+        assert decode({"__type": "Resource", "class": "Texture2D", "path": "res://icon.svg"}) == Resource("res://icon.svg", "Texture2D")
+        packed = decode({"__type": "PackedVector2Array", "v": [[0, 0], [1, 2]]})
+        assert packed == PackedArray("PackedVector2Array", [Vector2(0, 0), Vector2(1, 2)])
+        assert decode({"__type": "RID", "v": "RID(123)"}) == Opaque("RID", {"v": "RID(123)"})
+    
+    def test_decode_non_string_keyed_dictionary(self):
+        """Dictionaries with typed keys travel as [key, value] pairs"""
+        decoded = decode({"__type": "Dictionary", "v": [[{"__type": "Vector2i", "v": [0, 1]}, "grass"], [3, "rock"]]})
+        assert decoded == {Vector2i(0, 1): "grass", 3: "rock"}
+    
+    def test_decode_rejects_malformed_values(self):
+        """Wrong component counts and non-numeric components raise ValueError"""
+        with pytest.raises(ValueError, match="Vector2 needs 2 components"):
+            decode({"__type": "Vector2", "v": [1, 2, 3]})
+        with pytest.raises(ValueError, match="must be numbers"):
+            decode({"__type": "Color", "v": [1, "0", 0, 1]})
+        with pytest.raises(ValueError):
+            decode({"__type": "PackedColorArray", "v": "red"})
+    
+    def test_round_trip(self):
+        """encode(decode(x)) reproduces the plugin's JSON"""
+        samples = [
+            {"__type": "Rect2", "v": [0, 0, 64.5, 32]},
+            {"__type": "StringName", "v": "idle"},
+            {"__type": "Resource", "class": "Theme", "path": "res://ui.tres"},
+            {"__type": "PackedColorArray", "v": [[1, 0, 0, 1]]},
+            {"__type": "PackedStringArray", "v": ["a", "b"]},
+            {"__type": "Dictionary", "v": [[1, {"__type": "Vector2", "v": [1, 1]}]]},
+            {"name": "Player", "scale": {"__type": "Vector2", "v": [2, 2]}},
+            [1, "two", None, True]
+        ]
+        for sample in samples:
+            assert encode(decode(sample)) == sample
+    
+    def test_encode_python_values(self):
+        """Python-side values encode to the tagged form, plain JSON passes through"""
+        assert encode(Vector2(10, 20)) == {"__type": "Vector2", "v": [10, 20]}
+        assert encode({"position": Vector2(1, 2), "visible": False}) == {
+            "position": {"__type": "Vector2", "v": [1, 2]},
+            "visible": False
+        }
+        assert encode(StringName("walk")) == {"__type": "StringName", "v": "walk"}
+        assert encode("plain") == "plain"
+    
+    def test_to_literal(self):
+        """Values render in Godot syntax"""
+        assert to_literal(Vector2(10.0, 20.5)) == "Vector2(10, 20.5)"
+        assert to_literal(Rect2(0, 0, 64, 64)) == "Rect2(0, 0, 64, 64)"
+        assert to_literal(NodePath("Player/Sprite")) == 'NodePath("Player/Sprite")'
+        assert to_literal(StringName("idle")) == '&"idle"'
+        assert to_literal(Resource("res://icon.svg", "Texture2D")) == "res://icon.svg"
+        assert to_literal(Resource("", "StyleBoxFlat")) == "<StyleBoxFlat>"
+        assert to_literal([True, None, "a"]) == '[true, null, "a"]'
+
+
+class TestPropertyToolsCodec:
+    
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock GodotClient for testing"""
+        return AsyncMock(spec=GodotClient)
+    
+    @pytest.mark.asyncio
+    async def test_get_node_properties_renders_literals(self, mock_client):
+        """Typed values are shown in Godot syntax, plain strings unquoted"""
+        mock_client.get_node_properties.return_value = {
+            "success": True,
+            "node_type": "Sprite2D",
+            "properties": {
+                "position": {"__type": "Vector2", "v": [10.0, 20.0]},
+                "modulate": {"__type": "Color", "v": [1, 1, 1, 1]},
+                "texture": {"__type": "Resource", "class": "Texture2D", "path": "res://icon.svg"},
+                "editor_description": "hero",
+                "visible": True
+            }
+        }
+        
+        result = await handle_scene_tool("get_node_properties", {"node_path": "Player"}, mock_client)
+        
+        text = result[0].text
+        assert "position: Vector2(10, 20)" in text
+        assert "modulate: Color(1, 1, 1, 1)" in text
+        assert "texture: res://icon.svg" in text
+        assert "editor_description: hero" in text
+        assert "visible: true" in text
+    
+    @pytest.mark.asyncio
+    async def test_set_node_properties_passes_typed_values(self, mock_client):
+        """Tagged values are validated and forwarded, untagged ones left for the plugin to coerce"""
+        mock_client.set_node_properties.return_value = {
+            "success": True,
+            "set_properties": ["position", "modulate"],
+            "failed_properties": []
+        }
+        properties = {"position": {"__type": "Vector2", "v": [10, 20]}, "modulate": "#ff8800"}
+        
+        result = await handle_scene_tool("set_node_properties", {"node_path": "Player", "properties": properties}, mock_client)
+        
+        mock_client.set_node_properties.assert_called_once_with("Player", properties)
+        assert "Set successfully: position, modulate" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_set_node_properties_rejects_malformed_value(self, mock_client):
+        """A malformed tagged value fails before any plugin call"""
+        result = await handle_scene_tool("set_node_properties", {
+            "node_path": "Player",
+            "properties": {"position": {"__type": "Vector2", "v": [10]}}
+        }, mock_client)
+        
+        mock_client.set_node_properties.assert_not_called()
+        assert "Vector2 needs 2 components" in result[0].text
+    
+    @pytest.mark.asyncio
+    async def test_set_node_properties_reports_plugin_errors(self, mock_client):
+        """Per-property decode errors from the plugin are listed"""
+        mock_client.set_node_properties.return_value = {
+            "success": True,
+            "set_properties": [],
+            "failed_properties": ["size"],
+            "errors": {"size": "Cannot convert \"big\" to Vector2"}
+        }
+        
+        result = await handle_scene_tool("set_node_properties", {"node_path": "Panel", "properties": {"size": "big"}}, mock_client)
+        
+        assert "Failed to set: size" in result[0].text
+        assert "size: Cannot convert \"big\" to Vector2" in result[0].text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])